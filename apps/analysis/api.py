@@ -11,7 +11,7 @@ from apps.core.lib.namespace_analyzer import (
     NamespaceViolationError,
     validate_table_access,
 )
-from apps.core.lib.temporal_client import get_temporal_client
+from apps.core.lib.temporal_client import execute_workflow
 from apps.core.middleware import get_tenant_id
 from apps.worker.workflows.analyze_workflow import AnalyzeWorkflow
 from apps.workflows.models import Job
@@ -97,9 +97,8 @@ def analyze(request, payload: AnalyzeRequest):
     manifest: List[Dict[str, Any]] = []
 
     try:
-        client = run_async(get_temporal_client)
         workflow_result = run_async(
-            client.execute_workflow,
+            execute_workflow,
             AnalyzeWorkflow.run,
             {
                 "source_id": payload.source_id,
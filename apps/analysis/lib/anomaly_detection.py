@@ -10,20 +10,13 @@ Personas:
 - Performance: Sampled execution for large datasets
 """
 
+import importlib.util
 import logging
 from typing import Any, Dict, List
 
 import numpy as np
 import pandas as pd
 
-# Try importing sklearn, handle case if missing (though required for ML)
-try:
-    from sklearn.ensemble import IsolationForest
-
-    SKLEARN_AVAILABLE = True
-except ImportError:
-    SKLEARN_AVAILABLE = False
-
 from apps.core.lib.errors import AnalysisError
 from apps.core.lib.plugin_registry import (
     AnalyzerPlugin,
@@ -33,6 +26,30 @@ from apps.core.lib.plugin_registry import (
 
 logger = logging.getLogger(__name__)
 
+# sklearn (and the scipy modules it pulls in) is imported on first use, not at
+# module load, so registering this plugin stays cheap on worker start-up.
+SKLEARN_AVAILABLE = importlib.util.find_spec("sklearn") is not None
+IsolationForest: Any = None
+
+# Above FIT_SAMPLE_THRESHOLD rows the forest is fitted on a FIT_SAMPLE_SIZE random
+# subset; every row is still scored.
+FIT_SAMPLE_THRESHOLD = 100_000
+FIT_SAMPLE_SIZE = 10_000
+
+
+def _isolation_forest() -> Any:
+    """Import and cache sklearn's IsolationForest on first use."""
+    global IsolationForest
+    if IsolationForest is None:
+        try:
+            from sklearn.ensemble import IsolationForest as forest
+        except ImportError as exc:
+            raise AnalysisError(
+                "VYNT-ML-001", "scikit-learn is required for anomaly detection"
+            ) from exc
+        IsolationForest = forest
+    return IsolationForest
+
 
 @register_plugin(
     name="anomaly_detector",
@@ -52,7 +69,8 @@ class AnomalyDetector(AnalyzerPlugin):
 
         Args:
             data: pandas.DataFrame containing numerical columns or List[Dict]
-            context: configuration (contamination, features)
+            context: configuration (contamination, features, n_estimators,
+                max_samples)
 
         Returns:
             Dict containing:
@@ -60,10 +78,7 @@ class AnomalyDetector(AnalyzerPlugin):
             - stats: Summary statistics
             - visualization: Plotly-ready JSON
         """
-        if not SKLEARN_AVAILABLE:
-            raise AnalysisError(
-                "VYNT-ML-001", "scikit-learn is required for anomaly detection"
-            )
+        forest_cls = _isolation_forest()
 
         # 1. Data Prep
         df = self._to_dataframe(data)
@@ -85,37 +100,61 @@ class AnomalyDetector(AnalyzerPlugin):
         if len(X) < 10:
             return {"status": "skipped", "reason": "insufficient_data", "count": len(X)}
 
+        # The tree code works in float32; casting once here avoids a hidden
+        # float64 -> float32 copy in every fit/score call. X (the DataFrame) is
+        # kept only for result assembly.
+        X_arr = X.to_numpy(dtype=np.float32)
+
         # 2. Model Training
         # Contamination: 'auto' or float (0.0 to 0.5)
         contamination = context.get("contamination", "auto")
-        model = IsolationForest(contamination=contamination, random_state=42, n_jobs=-1)
-
-        model.fit(X)
+        model = forest_cls(
+            contamination=contamination,
+            n_estimators=context.get("n_estimators", 100),
+            max_samples=context.get("max_samples", min(256, len(X_arr))),
+            random_state=42,
+            n_jobs=-1,
+        )
+
+        # Each tree only sees max_samples rows, so a random subset fits as well
+        # as the full set on large inputs (and bounds the contamination
+        # threshold pass, which scores the whole training set).
+        fit_arr = X_arr
+        if len(X_arr) > FIT_SAMPLE_THRESHOLD:
+            fit_rows = np.random.default_rng(42).choice(
+                len(X_arr), size=FIT_SAMPLE_SIZE, replace=False
+            )
+            fit_arr = X_arr[fit_rows]
+        model.fit(fit_arr)
 
         # 3. Prediction
-        # -1 for outliers, 1 for inliers
-        predictions = model.predict(X)
-        scores = model.decision_function(X)  # lower is more anomalous
+        # One scoring pass: predict() is defined as decision_function() < 0,
+        # so the outlier labels come from the same scores.
+        scores = model.decision_function(X_arr)  # lower is more anomalous
+        is_anomaly = scores < 0
 
         # 4. Result Formatting
-        X = X.copy()
-        X["anomaly_score"] = scores
-        X["is_anomaly"] = predictions == -1
-
-        anomalies = X[X["is_anomaly"]]
+        # Stay in NumPy; only the (at most 20) reported rows are boxed into dicts.
+        anomaly_count = int(is_anomaly.sum())
 
         # Sort by severity (lowest score)
-        anomalies = anomalies.sort_values("anomaly_score", ascending=True)
+        anomaly_rows = np.flatnonzero(is_anomaly)
+        top = anomaly_rows[np.argsort(scores[anomaly_rows], kind="stable")[:20]]
+        top_anomalies = (
+            X.iloc[top]
+            .assign(anomaly_score=scores[top], is_anomaly=True)
+            .to_dict(orient="records")
+        )
 
         result = {
             "status": "success",
             "total_rows": len(df),
             "analyzed_rows": len(X),
-            "anomaly_count": len(anomalies),
-            "anomaly_percentage": float(len(anomalies) / len(X)),
+            "anomaly_count": anomaly_count,
+            "anomaly_percentage": float(anomaly_count / len(X)),
             "features_used": features,
-            "top_anomalies": anomalies.head(20).to_dict(orient="records"),
-            "visualization": self._generate_plot_spec(X, features),
+            "top_anomalies": top_anomalies,
+            "visualization": self._generate_plot_spec(X, features, is_anomaly),
         }
 
         return result
@@ -125,31 +164,70 @@ class AnomalyDetector(AnalyzerPlugin):
         if isinstance(data, pd.DataFrame):
             return data
         if isinstance(data, list):
-            return pd.DataFrame(data)
+            return self._records_to_dataframe(data)
         if isinstance(data, dict):
             # Handle columnar dict
             return pd.DataFrame(data)
         raise AnalysisError("VYNT-DATA-002", f"Unsupported data type: {type(data)}")
 
+    @staticmethod
+    def _records_to_dataframe(records: List[Any]) -> pd.DataFrame:
+        """
+        Build a DataFrame from a list of dicts.
+
+        When every row has the same keys and every value is a float, each
+        column is filled straight into a float64 array instead of going
+        through pandas' per-cell row inference. Anything else (ints, bools,
+        strings, None, ragged rows) takes the regular `pd.DataFrame(records)`
+        path, so dtypes match pandas either way.
+        """
+        first = records[0] if records else None
+        if isinstance(first, dict) and first:
+            n_cols = len(first)
+            try:
+                columns = {col: [row[col] for row in records] for col in first}
+            except (KeyError, TypeError):
+                columns = None
+            if (
+                columns is not None
+                and all(len(row) == n_cols for row in records)
+                and all(type(v) is float for values in columns.values() for v in values)
+            ):
+                return pd.DataFrame(
+                    {
+                        col: np.array(values, dtype=np.float64)
+                        for col, values in columns.items()
+                    }
+                )
+        return pd.DataFrame(records)
+
     def _generate_plot_spec(
-        self, df: pd.DataFrame, features: List[str]
+        self, df: pd.DataFrame, features: List[str], is_anomaly: np.ndarray
     ) -> Dict[str, Any]:
         """Generate a Scatter plot metadata for outliers."""
         # Simple scatter of first 2 features (or Index vs Feature if 1 dim)
         if len(features) >= 2:
             x_col, y_col = features[0], features[1]
+            x = df[x_col].to_numpy()
         else:
             x_col = df.index.name or "index"
             y_col = features[0]
-            df = df.reset_index(names=x_col)
+            x = df.index.to_numpy()
+        y = df[y_col].to_numpy()
 
         return {
             "type": "scatter",
             "x": x_col,
             "y": y_col,
             "data": {
-                "inliers": df[~df["is_anomaly"]][[x_col, y_col]].to_dict(orient="list"),
-                "outliers": df[df["is_anomaly"]][[x_col, y_col]].to_dict(orient="list"),
+                "inliers": {
+                    x_col: x[~is_anomaly].tolist(),
+                    y_col: y[~is_anomaly].tolist(),
+                },
+                "outliers": {
+                    x_col: x[is_anomaly].tolist(),
+                    y_col: y[is_anomaly].tolist(),
+                },
             },
             "title": f"Anomaly Usage: {y_col} vs {x_col}",
         }
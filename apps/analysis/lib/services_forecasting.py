@@ -12,19 +12,11 @@ Personas:
 
 import logging
 from datetime import timedelta
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 
-# Try importing sklearn
-try:
-    from sklearn.linear_model import LinearRegression
-
-    SKLEARN_AVAILABLE = True
-except ImportError:
-    SKLEARN_AVAILABLE = False
-
 from apps.core.lib.errors import AnalysisError
 from apps.core.lib.plugin_registry import (
     AnalyzerPlugin,
@@ -57,16 +49,16 @@ class TimeForecaster(AnalyzerPlugin):
                 - horizon: int (default 30)
                 - date_col: str (default 'date' or index)
                 - value_col: str (default 'value')
+                - value_cols: list of str (optional; forecasts every listed
+                  column in one fit instead of `value_col`)
                 - frequency: str (default 'D')
 
         Returns:
-            Dict containing forecast data and visualization spec.
+            Dict containing forecast data (columnar: date, forecast,
+            lower_bound and upper_bound lists) and visualization spec. With
+            `value_cols`, `forecasts`, `rmse_by_column` and `visualizations`
+            hold the same per column instead.
         """
-        if not SKLEARN_AVAILABLE:
-            raise AnalysisError(
-                "VYNT-ML-001", "scikit-learn is required for forecasting"
-            )
-
         # 1. Data Prep
         df = self._to_dataframe(data)
         if df.empty:
@@ -74,124 +66,263 @@ class TimeForecaster(AnalyzerPlugin):
 
         date_col = context.get("date_col", "date")
         value_col = context.get("value_col", "value")
+        value_cols = context.get("value_cols")
         horizon = context.get("horizon", 30)
         freq = context.get("frequency", "D")
 
-        # Normalize dates
-        if date_col in df.columns:
-            df[date_col] = pd.to_datetime(df[date_col])
-            df = df.set_index(date_col)
-
-        # Ensure numeric target
-        if value_col not in df.columns:
+        # Ensure numeric target(s)
+        if value_cols is not None:
+            targets = [col for col in value_cols if col in df.columns]
+            if not targets:
+                return {"status": "skipped", "reason": "no_numeric_target"}
+        elif value_col in df.columns:
+            targets = [value_col]
+        else:
             # Try first numeric column
-            nums = df.select_dtypes(include=[np.number]).columns
+            nums = df.select_dtypes(include=[np.number]).columns.drop(
+                date_col, errors="ignore"
+            )
             if not nums.empty:
-                value_col = nums[0]
+                targets = [nums[0]]
             else:
                 return {"status": "skipped", "reason": "no_numeric_target"}
 
-        # Resample and generic fill
-        ts = df[value_col].resample(freq).mean().ffill().fillna(0)
+        # Index the targets by date directly; copying and re-indexing the
+        # whole input frame would carry every other column along.
+        dates = df.index
+        if date_col in df.columns:
+            raw_dates = df[date_col]
+            # Only parse when needed: to_datetime copies even datetime columns.
+            if not pd.api.types.is_datetime64_any_dtype(raw_dates.dtype):
+                raw_dates = pd.to_datetime(raw_dates)
+            dates = pd.DatetimeIndex(raw_dates, name=date_col)
+
+        # Resample and generic fill (every target shares the same bins)
+        history = [
+            self._resample_mean(
+                pd.Series(df[col].to_numpy(), index=dates, name=col), freq
+            )
+            for col in targets
+        ]
+        ts_index = history[0].index
 
-        if len(ts) < 10:
+        if len(ts_index) < 10:
             return {
                 "status": "skipped",
                 "reason": "insufficient_history",
-                "count": len(ts),
+                "count": len(ts_index),
             }
 
         # 2. Feature Engineering
-        # Create X (features) and y (target)
-        # Features: Trend (ordinal date), Seasonality (Month, DayOfWeek)
+        # Create X (features) and Y (one column per target)
+        # Features: Trend (days since start), Seasonality (Month, DayOfWeek as sin/cos)
 
         # Train data
-        X_train, y_train = self._create_features(ts.index, ts.values)
+        origin = float(ts_index[0].to_julian_date())
+        X_train, _ = self._create_features(ts_index, origin=origin)
+        Y_train = np.column_stack([ts.to_numpy(dtype=np.float64) for ts in history])
 
         # 3. Model Training
-        model = LinearRegression()
-        model.fit(X_train, y_train)
+        # Ordinary least squares on centered features with a separate
+        # intercept (as sklearn's LinearRegression fits it); a closed-form
+        # solve on five columns needs no estimator machinery. All targets
+        # share the design matrix, so one solve fits them together.
+        x_mean = X_train.mean(axis=0)
+        y_mean = Y_train.mean(axis=0)
+        X_centered = X_train - x_mean
+        Y_centered = Y_train - y_mean
+        coef, ssr, *_ = np.linalg.lstsq(X_centered, Y_centered, rcond=None)
+        intercept = y_mean - x_mean @ coef
 
         # 4. Forecasting
-        last_date = ts.index[-1]
+        last_date = ts_index[-1]
         future_dates = pd.date_range(
             start=last_date + timedelta(days=1), periods=horizon, freq=freq
         )
 
-        X_future, _ = self._create_features(future_dates)
+        X_future, _ = self._create_features(future_dates, origin=origin)
 
-        predictions = model.predict(X_future)
+        predictions = X_future @ coef + intercept
 
-        # Simple Confidence Intervals (based on RMSE on training)
-        y_pred_train = model.predict(X_train)
-        rmse = np.sqrt(np.mean((y_train - y_pred_train) ** 2))
+        # Simple Confidence Intervals (based on RMSE on training).
+        # lstsq already reports the residual sums of squares for full-rank
+        # fits; only a rank-deficient fit (e.g. a single month of history)
+        # needs the residuals recomputed.
+        if ssr.size:
+            rmse = np.sqrt(ssr / len(Y_train))
+        else:
+            residuals = Y_centered - X_centered @ coef
+            rmse = np.sqrt(np.einsum("ij,ij->j", residuals, residuals) / len(Y_train))
 
         # 5. Output Formatting
-        forecast_df = pd.DataFrame(
-            {
-                "date": future_dates,
-                "forecast": predictions,
-                "lower_bound": predictions - 1.96 * rmse,
-                "upper_bound": predictions + 1.96 * rmse,
+        # Columnar lists: one Python list per field rather than a dict per row,
+        # and ISO date strings instead of boxed Timestamps.
+        future_iso = self._iso_dates(future_dates)
+        margins = 1.96 * rmse
+        forecasts = {
+            col: {
+                "date": future_iso,
+                "forecast": predictions[:, i].tolist(),
+                "lower_bound": (predictions[:, i] - margins[i]).tolist(),
+                "upper_bound": (predictions[:, i] + margins[i]).tolist(),
             }
-        )
+            for i, col in enumerate(targets)
+        }
 
         result = {
             "status": "success",
             "model": "LinearRegression (Trend + Seasonality)",
             "horizon": horizon,
             "frequency": freq,
-            "rmse": float(rmse),
-            "forecast": forecast_df.to_dict(orient="records"),
-            "visualization": self._generate_plot_spec(ts, forecast_df, value_col),
         }
+        if value_cols is None:
+            col = targets[0]
+            result["rmse"] = float(rmse[0])
+            result["forecast"] = forecasts[col]
+            result["visualization"] = self._generate_plot_spec(
+                history[0], forecasts[col], col
+            )
+        else:
+            result["value_cols"] = targets
+            result["rmse_by_column"] = dict(zip(targets, rmse.tolist()))
+            result["forecasts"] = forecasts
+            result["visualizations"] = {
+                col: self._generate_plot_spec(ts, forecasts[col], col)
+                for col, ts in zip(targets, history)
+            }
 
         return result
 
     def _to_dataframe(self, data: Any) -> pd.DataFrame:
-        """Convert input to DataFrame."""
+        """Convert input to DataFrame (a DataFrame is used as-is, not copied)."""
         if isinstance(data, pd.DataFrame):
-            return data.copy()
+            return data
         if isinstance(data, list):
             return pd.DataFrame(data)
         if isinstance(data, dict):
             return pd.DataFrame(data)
         raise AnalysisError("VYNT-DATA-002", f"Unsupported data type: {type(data)}")
 
+    @staticmethod
+    def _resample_mean(series: pd.Series, freq: str) -> pd.Series:
+        """
+        Equivalent of `series.resample(freq).mean().ffill().fillna(0)`.
+
+        For fixed-width frequencies (days and finer) on a naive, numeric
+        series the bins are computed directly: bincount for sums and
+        counts, and the forward fill as a running max of last-valid bin
+        positions. Anything else goes through pandas.
+        """
+        index = series.index
+        offset = pd.tseries.frequencies.to_offset(freq)
+        if (
+            not isinstance(index, pd.DatetimeIndex)
+            or not isinstance(offset, pd.offsets.Tick)
+            or index.tz is not None
+            or index.hasnans
+            or series.empty
+            or not pd.api.types.is_numeric_dtype(series.dtype)
+            or pd.api.types.is_bool_dtype(series.dtype)
+        ):
+            return series.resample(freq).mean().ffill().fillna(0)
+
+        # Bins are anchored at midnight of the first day, as resample() does;
+        # the first bin is the one holding the earliest timestamp.
+        stamps = index.as_unit("ns").asi8
+        step = pd.Timedelta(offset).value
+        day = pd.Timedelta(days=1).value
+        first = stamps.min()
+        midnight = first - first % day
+        origin = midnight + (first - midnight) // step * step
+        bins = (stamps - origin) // step
+
+        values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        sums = np.bincount(bins, weights=values)
+        counts = np.bincount(bins, minlength=len(sums))
+        missing = np.isnan(values)
+        if missing.any():
+            sums = np.bincount(
+                bins, weights=np.where(missing, 0.0, values), minlength=len(sums)
+            )
+            counts -= np.bincount(bins[missing], minlength=len(sums))
+
+        filled = np.arange(len(sums))
+        filled[counts == 0] = 0
+        np.maximum.accumulate(filled, out=filled)
+        means = np.divide(
+            sums[filled],
+            counts[filled],
+            out=np.zeros(len(sums)),
+            where=counts[filled] > 0,
+        )
+
+        return pd.Series(
+            means,
+            index=pd.date_range(
+                pd.Timestamp(int(origin)),
+                periods=len(means),
+                freq=offset,
+                unit=index.unit,
+                name=index.name,
+            ),
+            name=series.name,
+        )
+
     def _create_features(
-        self, dates: pd.DatetimeIndex, values: Optional[np.ndarray] = None
-    ) -> Tuple[pd.DataFrame, Optional[np.ndarray]]:
-        """Create time-series features: Trend, Month, DayOfWeek."""
-        df_feat = pd.DataFrame(index=dates)
-        df_feat["trend"] = dates.to_julian_date()
-        # One-hot encoding for seasonality? linear regression handles ordinal poorly for cyclic
-        # but for simple 'analyst' view, ordinal or dummies. Let's use basic sin/cos for seasonality
-        # if we want to be PhD level,
-        # or just simple dummies. Let's stick to simple numeric for 'month' to capture broad seasonality
-        # or dummies for correctness.
-        # Developer Persona: Correct approach for linear regression is dummies or fourier terms.
-        # Let's use month/dayofweek as integers for simplicity in this MVP plugin,
-        # acknowledging it assumes linear relationship which is imperfect but robust enough for basic trends.
-        df_feat["month"] = dates.month
-        df_feat["dow"] = dates.dayofweek
-
-        return df_feat, values
+        self,
+        dates: pd.DatetimeIndex,
+        values: Optional[np.ndarray] = None,
+        origin: Optional[float] = None,
+    ) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """
+        Create the float64 design matrix of time features.
+
+        Columns: trend (days since `origin`, default the first date), then
+        sin/cos of month-of-year and day-of-week. The Fourier pairs encode the
+        seasonal cycles without imposing a linear order on them (December and
+        January end up adjacent), in four columns instead of 18 dummies.
+        """
+        julian = np.asarray(dates.to_julian_date(), dtype=np.float64)
+        if origin is None:
+            origin = julian[0] if len(julian) else 0.0
+        month_angle = np.asarray(dates.month, dtype=np.float64) * (2 * np.pi / 12)
+        dow_angle = np.asarray(dates.dayofweek, dtype=np.float64) * (2 * np.pi / 7)
+
+        features = np.empty((len(dates), 5), dtype=np.float64)
+        features[:, 0] = julian - origin
+        np.sin(month_angle, out=features[:, 1])
+        np.cos(month_angle, out=features[:, 2])
+        np.sin(dow_angle, out=features[:, 3])
+        np.cos(dow_angle, out=features[:, 4])
+
+        return features, values
+
+    @staticmethod
+    def _iso_dates(dates: pd.DatetimeIndex) -> List[str]:
+        """Format dates as ISO strings, dropping the time part when all are midnight."""
+        unit = "D" if (dates == dates.normalize()).all() else "s"
+        if dates.tz is None:
+            # Vectorised formatting; strftime goes through Python per element.
+            return np.datetime_as_string(dates.to_numpy(), unit=unit).tolist()
+        fmt = "%Y-%m-%d" if unit == "D" else "%Y-%m-%dT%H:%M:%S"
+        return dates.strftime(fmt).tolist()
 
     def _generate_plot_spec(
-        self, history: pd.Series, forecast: pd.DataFrame, value_name: str
+        self, history: pd.Series, forecast: Dict[str, List[Any]], value_name: str
     ) -> Dict[str, Any]:
-        """Generate Plotly spec for History + Forecast."""
-        # Convert index to column for exporting
-        hist_df = history.reset_index()
-        date_col = hist_df.columns[0]
+        """Generate Plotly spec for History + Forecast (columnar series)."""
+        date_col = history.index.name or "index"
 
         return {
             "type": "line_forecast",
             "x": date_col,
             "y": value_name,
             "data": {
-                "history": hist_df.to_dict(orient="records"),
-                "forecast": forecast.to_dict(orient="records"),
+                "history": {
+                    date_col: self._iso_dates(history.index),
+                    value_name: history.to_numpy(dtype=np.float64).tolist(),
+                },
+                "forecast": forecast,
             },
             "title": f"Forecast: {value_name}",
         }
@@ -1,5 +1,8 @@
+import asyncio
+import contextvars
 import logging
-from typing import Any, Dict
+import threading
+from typing import Any, Dict, Optional
 
 from asgiref.sync import async_to_sync
 from ninja.errors import HttpError
@@ -17,8 +20,59 @@ settings = get_settings()
 logger = logging.getLogger(__name__)
 
 
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_thread: Optional[threading.Thread] = None
+_loop_lock = threading.Lock()
+
+
+def _bridge_loop() -> asyncio.AbstractEventLoop:
+    """
+    The process-wide event loop that sync handlers submit coroutines to.
+
+    Started lazily in a daemon thread so each process (including forked
+    workers) gets its own. Keeping one loop alive means loop-bound clients,
+    like the Temporal client singleton, stay usable across requests.
+    """
+    global _loop, _loop_thread
+    with _loop_lock:
+        if _loop is None or not _loop_thread.is_alive():
+            _loop = asyncio.new_event_loop()
+            _loop_thread = threading.Thread(
+                target=_loop.run_forever, name="voyant-async-bridge", daemon=True
+            )
+            _loop_thread.start()
+    return _loop
+
+
+async def _in_context(ctx: contextvars.Context, coro):
+    """Await `coro` as a task running in the caller's context variables."""
+    return await asyncio.get_running_loop().create_task(coro, context=ctx)
+
+
 def run_async(func, *args, **kwargs):
-    """Run an async function from a sync context."""
+    """
+    Run an async function from a sync context on the shared bridge loop.
+
+    Only for coroutines that never block the loop (Temporal client calls,
+    policy checks); anything blocking stalls every other caller. Use
+    `run_async_isolated` for those.
+    """
+    loop = _bridge_loop()
+    if threading.current_thread() is _loop_thread:
+        raise RuntimeError("run_async cannot be called from the bridge loop itself")
+    ctx = contextvars.copy_context()
+    return asyncio.run_coroutine_threadsafe(
+        _in_context(ctx, func(*args, **kwargs)), loop
+    ).result()
+
+
+def run_async_isolated(func, *args, **kwargs):
+    """
+    Run an async function on its own loop, away from the shared bridge.
+
+    For coroutines that do blocking work inline, such as the scraper
+    activities (OCR, HTML parsing), so they cannot delay other requests.
+    """
     return async_to_sync(func)(*args, **kwargs)
 
 
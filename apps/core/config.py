@@ -203,6 +203,31 @@ class Settings(BaseSettings):
             "0 means auto-sized based on CPU."
         ),
     )
+    temporal_max_concurrent_activities: int = Field(
+        default=0,
+        alias="TEMPORAL_MAX_CONCURRENT_ACTIVITIES",
+        description=(
+            "Max activities a worker runs at once. 0 means auto: the activity "
+            "thread count in full mode, Temporal's default (100) in scraper mode."
+        ),
+    )
+    temporal_max_concurrent_workflow_tasks: int = Field(
+        default=0,
+        alias="TEMPORAL_MAX_CONCURRENT_WORKFLOW_TASKS",
+        description=(
+            "Max workflow tasks a worker processes at once. "
+            "0 means auto: 8 per CPU, capped at Temporal's default (100)."
+        ),
+    )
+    temporal_disable_eager_activities: bool = Field(
+        default=True,
+        alias="TEMPORAL_DISABLE_EAGER_ACTIVITIES",
+        description=(
+            "Send every activity through the task queue instead of letting the "
+            "worker that schedules it start it eagerly, so load spreads across "
+            "workers."
+        ),
+    )
     minio_endpoint: str = Field(
         default="",
         alias="MINIO_ENDPOINT",
@@ -259,6 +284,11 @@ class Settings(BaseSettings):
         alias="KEYCLOAK_CLIENT_SECRET",
         description="Keycloak client secret.",
     )
+    keycloak_jwks_ttl_seconds: int = Field(
+        default=3600,
+        alias="KEYCLOAK_JWKS_TTL_SECONDS",
+        description="How long fetched Keycloak signing keys are trusted before re-fetching.",
+    )
     serper_api_key: str = Field(
         default="",
         alias="SERPER_API_KEY",
@@ -636,6 +666,16 @@ class Settings(BaseSettings):
         alias="SCRAPER_MAX_OCR_IMAGES",
         description="Maximum number of images to OCR per request.",
     )
+    scraper_ocr_cache_size: int = Field(
+        default=100000,
+        alias="SCRAPER_OCR_CACHE_SIZE",
+        description="Max OCR results kept in the per-process dedup cache.",
+    )
+    scraper_ocr_cache_ttl_seconds: int = Field(
+        default=86400,
+        alias="SCRAPER_OCR_CACHE_TTL_SECONDS",
+        description="Time-to-live for cached OCR results keyed by URL validator or content hash.",
+    )
     scraper_max_transcribe_media: int = Field(
         default=5,
         alias="SCRAPER_MAX_TRANSCRIBE_MEDIA",
@@ -651,6 +691,31 @@ class Settings(BaseSettings):
         alias="SCRAPER_WHISPER_MODEL_NAME",
         description="Whisper model name to load when transcription is enabled.",
     )
+    scraper_whisper_backend: str = Field(
+        default="faster-whisper",
+        alias="SCRAPER_WHISPER_BACKEND",
+        description="Transcription backend: 'faster-whisper' (CTranslate2) or 'openai-whisper'.",
+    )
+    scraper_whisper_device: str = Field(
+        default="auto",
+        alias="SCRAPER_WHISPER_DEVICE",
+        description="Device for Whisper models: 'auto', 'cpu' or 'cuda'.",
+    )
+    scraper_whisper_fp16: bool | None = Field(
+        default=None,
+        alias="SCRAPER_WHISPER_FP16",
+        description="openai-whisper half precision; unset enables it only when the model is on CUDA.",
+    )
+    scraper_whisper_compute_type: str = Field(
+        default="int8",
+        alias="SCRAPER_WHISPER_COMPUTE_TYPE",
+        description="faster-whisper quantization (e.g. 'int8', 'int8_float16', 'float16').",
+    )
+    scraper_whisper_batch_size: int = Field(
+        default=16,
+        alias="SCRAPER_WHISPER_BATCH_SIZE",
+        description="Audio chunks per forward pass in faster-whisper's batched pipeline.",
+    )
 
 
 @lru_cache
@@ -61,6 +61,7 @@ class CompressionType(str, Enum):
 
     NONE = "none"
     GZIP = "gzip"
+    ZSTD = "zstd"  # requires the optional `zstandard` package
 
 
 @dataclass
@@ -196,12 +197,20 @@ class ArtifactStore:
         """Compress content if configured."""
         if self.config.compression == CompressionType.GZIP:
             return gzip.compress(content)
+        if self.config.compression == CompressionType.ZSTD:
+            import zstandard
+
+            return zstandard.ZstdCompressor().compress(content)
         return content
 
     def _decompress(self, content: bytes, compression: CompressionType) -> bytes:
         """Decompress content."""
         if compression == CompressionType.GZIP:
             return gzip.decompress(content)
+        if compression == CompressionType.ZSTD:
+            import zstandard
+
+            return zstandard.ZstdDecompressor().decompress(content)
         return content
 
     def store(
@@ -306,7 +315,7 @@ class ArtifactStore:
                 compressed = f.read()
 
             # Get compression type from metadata or use default
-            ref = self._refs.get(hash_value)
+            ref = self._refs.get(hash_value) or self.get_ref(hash_only)
             compression = ref.compression if ref else self.config.compression
 
             # Decompress
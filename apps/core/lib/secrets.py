@@ -40,16 +40,21 @@ import hashlib
 import json
 import logging
 import os
+import threading
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from apps.core.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Minimum interval between Vault authentication attempts after a failure.
+VAULT_AUTH_RECHECK_SECONDS = 60.0
+
 
 @dataclass
 class SecretMetadata:
@@ -221,10 +226,18 @@ class EnvSecretsBackend(SecretsBackend):
 
 
 class K8sSecretsBackend(SecretsBackend):
-    """Kubernetes mounted-secrets provider."""
+    """
+    Kubernetes mounted-secrets provider.
+
+    Values are cached per file and re-read only when the file's inode or
+    mtime changes (kubelet swaps projected secrets atomically), so warm reads
+    cost one stat() instead of an open/read.
+    """
 
     def __init__(self, root: str = "/var/run/secrets/voyant"):
         self._root = Path(root)
+        self._cache: Dict[Path, Tuple[Tuple[int, int], str]] = {}
+        self._cache_lock = threading.Lock()
 
     @property
     def provider_name(self) -> str:
@@ -234,13 +247,24 @@ class K8sSecretsBackend(SecretsBackend):
         return self._root / key
 
     async def get(self, key: str) -> Optional[str]:
+        path = self._path(key)
         try:
-            return self._path(key).read_text(encoding="utf-8").strip()
+            st = path.stat()
+            version = (st.st_ino, st.st_mtime_ns)
+            cached = self._cache.get(path)
+            if cached is not None and cached[0] == version:
+                return cached[1]
+            value = path.read_text(encoding="utf-8").strip()
         except FileNotFoundError:
+            with self._cache_lock:
+                self._cache.pop(path, None)
             return None
         except OSError as e:
             logger.error(f"K8s secret read error for '{key}': {e}")
             return None
+        with self._cache_lock:
+            self._cache[path] = (version, value)
+        return value
 
     async def set(self, key: str, value: str, expires_in: Optional[int] = None) -> bool:
         logger.error(f"K8s secrets backend is read-only; cannot set '{key}'")
@@ -405,6 +429,10 @@ class VaultSecretsBackend(SecretsBackend):
     Requires: hvac package
     Config: VAULT_ADDR, VAULT_TOKEN environment variables
 
+    Values read with `get` are cached for `cache_ttl` seconds per key, so
+    repeated lookups (e.g. credentials per connection) skip the Vault round
+    trip; `set` and `delete` through this backend invalidate the entry.
+
     IMPLEMENTATION STATUS: Core functionality present.
     Future enhancements:
     - Token renewal
@@ -417,32 +445,67 @@ class VaultSecretsBackend(SecretsBackend):
         addr: Optional[str] = None,
         token: Optional[str] = None,
         mount_point: str = "secret",
+        cache_ttl: float = 30.0,
     ):
         settings = get_settings()
         self._addr = addr or settings.secrets_vault_url
         self._token = token or settings.secrets_vault_token
         self._mount_point = mount_point
         self._client = None
+        self._auth_checked_at = float("-inf")
+        self._cache_ttl = cache_ttl
+        self._cache: Dict[str, Tuple[float, Optional[str]]] = {}
+        self._cache_lock = threading.Lock()
+
+    def _invalidate(self, key: str) -> None:
+        with self._cache_lock:
+            self._cache.pop(key, None)
 
     @property
     def provider_name(self) -> str:
         return "vault"
 
     def _get_client(self):
-        """Lazy load Vault client."""
-        if self._client is None:
-            try:
-                import hvac
+        """
+        Lazy load Vault client.
+
+        The client runs on a session we own, with a larger connection pool.
+        A failed authentication check is retried at most once per
+        VAULT_AUTH_RECHECK_SECONDS, not on every call.
+        """
+        if self._client is not None:
+            return self._client
+
+        now = time.monotonic()
+        if now - self._auth_checked_at < VAULT_AUTH_RECHECK_SECONDS:
+            return None
+        self._auth_checked_at = now
 
-                self._client = hvac.Client(url=self._addr, token=self._token)
-                if not self._client.is_authenticated():
-                    logger.error("Vault authentication failed")
-                    self._client = None
-            except ImportError:
-                logger.error("hvac package not installed")
+        try:
+            import hvac
+            import requests
+            from requests.adapters import HTTPAdapter
+        except ImportError:
+            logger.error("hvac package not installed")
+            return None
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        client = hvac.Client(url=self._addr, token=self._token, session=session)
+        if client.is_authenticated():
+            self._client = client
+        else:
+            logger.error("Vault authentication failed")
+            session.close()
         return self._client
 
     async def get(self, key: str) -> Optional[str]:
+        cached = self._cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self._cache_ttl:
+            return cached[1]
+
         client = self._get_client()
         if not client:
             return None
@@ -452,10 +515,13 @@ class VaultSecretsBackend(SecretsBackend):
                 path=key,
                 mount_point=self._mount_point,
             )
-            return result["data"]["data"].get("value")
+            value = result["data"]["data"].get("value")
         except Exception as e:
             logger.error(f"Vault get error: {e}")
             return None
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic(), value)
+        return value
 
     async def set(self, key: str, value: str, expires_in: Optional[int] = None) -> bool:
         client = self._get_client()
@@ -473,6 +539,8 @@ class VaultSecretsBackend(SecretsBackend):
         except Exception as e:
             logger.error(f"Vault set error: {e}")
             return False
+        finally:
+            self._invalidate(key)
 
     async def delete(self, key: str) -> bool:
         client = self._get_client()
@@ -489,6 +557,8 @@ class VaultSecretsBackend(SecretsBackend):
         except Exception as e:
             logger.error(f"Vault delete error: {e}")
             return False
+        finally:
+            self._invalidate(key)
 
     async def list_keys(self) -> List[str]:
         client = self._get_client()
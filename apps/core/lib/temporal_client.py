@@ -7,10 +7,11 @@ is established and reused throughout the application's lifecycle, which is
 critical for performance and resource management.
 """
 
+import asyncio
 import logging
-from typing import Optional
+from typing import Any, Optional
 
-from temporalio.client import Client
+from temporalio.client import Client, WorkflowHandle
 
 from apps.core.config import get_settings
 from apps.core.lib.errors import ExternalServiceError
@@ -19,6 +20,8 @@ logger = logging.getLogger(__name__)
 
 # Global singleton instance of the Temporal client.
 _client: Optional[Client] = None
+# Serialises the first connection so concurrent callers share one client.
+_connect_lock = asyncio.Lock()
 
 
 async def get_temporal_client() -> Client:
@@ -48,34 +51,81 @@ async def get_temporal_client() -> Client:
     if _client is not None:
         return _client
 
-    settings = get_settings()
-    target_host = settings.temporal_host
-    namespace = settings.temporal_namespace
+    async with _connect_lock:
+        # Another caller may have connected while this one waited.
+        if _client is not None:
+            return _client
+        settings = get_settings()
+        target_host = settings.temporal_host
+        namespace = settings.temporal_namespace
 
-    logger.info(f"Connecting to Temporal at {target_host} (namespace: {namespace})...")
-
-    try:
-        # Establish the connection to the Temporal frontend.
-        _client = await Client.connect(
-            target_host,
-            namespace=namespace,
+        logger.info(
+            f"Connecting to Temporal at {target_host} (namespace: {namespace})..."
         )
-        logger.info("Successfully connected to Temporal.")
-        return _client
 
-    except Exception as e:
-        # Pragmatic error handling: temporalio's connection error types can be
-        # inconsistent. We check the string representation for common network
-        # failure indicators to provide a more specific application error.
-        error_str = str(e).lower()
-        if "connect" in error_str or "refused" in error_str or "timeout" in error_str:
-            logger.error(f"Failed to connect to Temporal: {e}")
-            raise ExternalServiceError(
-                "VYNT-5001",
-                message=f"Could not connect to Temporal Orchestrator at {target_host}",
-                details={"host": target_host, "error": str(e)},
-                resolution="Ensure the Temporal service is running and accessible from the application.",
-            ) from e
-        # For any other unexpected exception, log it and re-raise.
-        logger.exception("An unexpected error occurred while connecting to Temporal.")
-        raise
+        try:
+            # Establish the connection to the Temporal frontend.
+            _client = await Client.connect(
+                target_host,
+                namespace=namespace,
+            )
+            logger.info("Successfully connected to Temporal.")
+            return _client
+
+        except Exception as e:
+            # Pragmatic error handling: temporalio's connection error types can be
+            # inconsistent. We check the string representation for common network
+            # failure indicators to provide a more specific application error.
+            error_str = str(e).lower()
+            if (
+                "connect" in error_str
+                or "refused" in error_str
+                or "timeout" in error_str
+            ):
+                logger.error(f"Failed to connect to Temporal: {e}")
+                raise ExternalServiceError(
+                    "VYNT-5001",
+                    message=f"Could not connect to Temporal Orchestrator at {target_host}",
+                    details={"host": target_host, "error": str(e)},
+                    resolution="Ensure the Temporal service is running and accessible from the application.",
+                ) from e
+            # For any other unexpected exception, log it and re-raise.
+            logger.exception(
+                "An unexpected error occurred while connecting to Temporal."
+            )
+            raise
+
+
+async def start_workflow(workflow: Any, arg: Any, **kwargs: Any) -> WorkflowHandle:
+    """
+    Start a workflow on the shared client.
+
+    Resolving the client and starting the workflow in one coroutine lets sync
+    callers do both with a single `run_async` crossing.
+    """
+    client = await get_temporal_client()
+    return await client.start_workflow(workflow, arg, **kwargs)
+
+
+async def execute_workflow(workflow: Any, arg: Any, **kwargs: Any) -> Any:
+    """Start a workflow on the shared client and wait for its result."""
+    client = await get_temporal_client()
+    return await client.execute_workflow(workflow, arg, **kwargs)
+
+
+async def cancel_workflow(*workflow_ids: str) -> str:
+    """
+    Request cancellation of the first of `workflow_ids` that can be cancelled.
+
+    Returns the cancelled workflow ID. If none can be cancelled, the error
+    from the last attempt is raised.
+    """
+    client = await get_temporal_client()
+    error: Optional[Exception] = None
+    for workflow_id in workflow_ids:
+        try:
+            await client.get_workflow_handle(workflow_id).cancel()
+            return workflow_id
+        except Exception as exc:
+            error = exc
+    raise error or ValueError("No workflow IDs given to cancel")
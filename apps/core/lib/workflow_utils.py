@@ -5,7 +5,7 @@ from typing import Any
 
 from apps.core.api_utils import run_async
 from apps.core.config import get_settings
-from apps.core.lib.temporal_client import get_temporal_client
+from apps.core.lib.temporal_client import start_workflow
 from apps.workflows.models import Job
 
 logger = logging.getLogger(__name__)
@@ -42,9 +42,8 @@ def dispatch_workflow(
         payload["source_id"] = source_id
     payload.update(parameters)
 
-    client = run_async(get_temporal_client)
     run_async(
-        client.start_workflow,
+        start_workflow,
         workflow_cls.run,
         payload,
         id=workflow_id,
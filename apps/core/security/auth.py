@@ -11,19 +11,80 @@ authorization using Keycloak as the Identity Provider. It provides mechanisms fo
 
 from __future__ import annotations
 
+import atexit
+import hashlib
+import importlib.util
 import logging
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, Iterable, Optional
 
 import httpx
 from ninja.errors import HttpError
 from ninja.security import HttpBearer
 
 from apps.core.config import get_settings
+from apps.core.lib.cache import LRUCache
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Cached keys are re-fetched in the background once this close to expiry.
+JWKS_REFRESH_AHEAD_SECONDS = 300
+# Minimum age of cached keys before an unknown `kid` may force a re-fetch, so a
+# burst of tokens with a bogus `kid` cannot hammer Keycloak.
+JWKS_FORCED_REFRESH_INTERVAL_SECONDS = 30
+
+# Validated tokens are remembered for at most this long (and never past `exp`).
+TOKEN_CACHE_MAX_TTL_SECONDS = 60
+TOKEN_CACHE_SIZE = 4096
+
+# Permissions granted by each realm role.
+_ROLE_PERMISSIONS: Dict[str, FrozenSet[str]] = {
+    "voyant-admin": frozenset({"*"}),  # Wildcard for full administrative access.
+    "voyant-engineer": frozenset(
+        {
+            "read:*",
+            "write:sources",
+            "write:jobs",
+            "execute:sql",
+            "execute:presets",
+        }
+    ),
+    "voyant-analyst": frozenset({"read:*", "execute:sql", "execute:presets"}),
+    "voyant-viewer": frozenset({"read:dashboards", "read:reports", "read:artifacts"}),
+}
+_NO_PERMISSIONS: FrozenSet[str] = frozenset()
+
+_http_client: Optional[httpx.Client] = None
+_http_client_lock = threading.Lock()
+
+
+def _get_http_client() -> httpx.Client:
+    """
+    Returns the process-wide HTTP client used for Keycloak requests.
+
+    Reusing one pooled client keeps the connection to Keycloak alive, so JWKS
+    refreshes skip the TCP and TLS handshakes. HTTP/2 is negotiated when the
+    `h2` package is installed, multiplexing concurrent calls over a single
+    connection. Closed at interpreter exit.
+    """
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                _http_client = httpx.Client(
+                    timeout=httpx.Timeout(5.0, connect=2.0),
+                    limits=httpx.Limits(
+                        max_keepalive_connections=10, max_connections=20
+                    ),
+                    http2=importlib.util.find_spec("h2") is not None,
+                    headers={"User-Agent": "voyant-auth/1"},
+                )
+                atexit.register(_http_client.close)
+    return _http_client
+
 
 @dataclass
 class User:
@@ -35,18 +96,24 @@ class User:
         email (str): The user's email address.
         username (str): The user's preferred username.
         tenant_id (str): The identifier for the tenant the user belongs to.
-        roles (List[str]): A list of roles assigned to the user within the realm.
-        permissions (List[str]): A list of derived permissions based on the user's roles.
+        roles (FrozenSet[str]): The roles assigned to the user within the realm.
+        permissions (FrozenSet[str]): The permissions derived from the user's roles.
         token (str): The original JWT token.
+        is_admin (bool): Whether the user holds the admin role or wildcard
+            permission; computed at construction.
     """
 
     user_id: str
     email: str
     username: str
     tenant_id: str
-    roles: List[str]
-    permissions: List[str]
+    roles: FrozenSet[str]
+    permissions: FrozenSet[str]
     token: str
+    is_admin: bool = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.is_admin = "voyant-admin" in self.roles or "*" in self.permissions
 
     def has_role(self, role: str) -> bool:
         """
@@ -58,7 +125,7 @@ class User:
         Returns:
             bool: True if the user has the role or is an admin, False otherwise.
         """
-        return role in self.roles or "voyant-admin" in self.roles
+        return self.is_admin or role in self.roles
 
     def has_permission(self, permission: str) -> bool:
         """
@@ -70,9 +137,7 @@ class User:
         Returns:
             bool: True if the user has the permission or wildcard access, False otherwise.
         """
-        if "*" in self.permissions:  # Administrator wildcard permission.
-            return True
-        return permission in self.permissions
+        return self.is_admin or permission in self.permissions
 
 
 class KeycloakAuth:
@@ -92,34 +157,132 @@ class KeycloakAuth:
         self.client_id = settings.keycloak_client_id
         self.client_secret = settings.keycloak_client_secret
         self._jwks: Optional[Dict[str, Any]] = None  # Cached JWKS.
+        self._signing_keys: Dict[str, Any] = {}  # Parsed public keys by `kid`.
+        self._jwks_fetched_at = 0.0  # time.monotonic() of the last fetch.
+        self._jwks_ttl = settings.keycloak_jwks_ttl_seconds
+        self._jwks_lock = threading.Lock()
+        self._jwks_refreshing = False
+        # Users of recently verified tokens, keyed by a hash of the token.
+        self._validated = LRUCache(
+            max_size=TOKEN_CACHE_SIZE, default_ttl=TOKEN_CACHE_MAX_TTL_SECONDS
+        )
         self._jwks_url = (
             f"{self.keycloak_url}/realms/{self.realm}/protocol/openid-connect/certs"
         )
         self._issuer = f"{self.keycloak_url}/realms/{self.realm}"
 
-    def _get_jwks(self) -> Dict[str, Any]:
+    def _get_jwks(self, force: bool = False) -> Dict[str, Any]:
         """
-        Fetches and caches the JSON Web Key Set (JWKS) from the Keycloak server.
+        Returns the JSON Web Key Set (JWKS), fetching it when the cache expires.
+
+        Keys are cached for `keycloak_jwks_ttl_seconds`. Within
+        `JWKS_REFRESH_AHEAD_SECONDS` of expiry the cached keys are still served
+        while one background thread re-fetches them; after expiry, concurrent
+        callers wait on a lock so only one of them hits Keycloak.
+
+        Args:
+            force (bool): Re-fetch even if the cache is fresh (e.g. unknown `kid`
+                          after a key rotation), unless the keys were fetched
+                          within `JWKS_FORCED_REFRESH_INTERVAL_SECONDS`.
 
         Returns:
             Dict[str, Any]: The JWKS dictionary.
 
         Raises:
-            httpx.HTTPError: If the request to the Keycloak JWKS endpoint fails.
             HttpError 503: If the Keycloak service is unavailable.
         """
-        if self._jwks is None:
+        if self._jwks is not None and not force:
+            remaining = self._jwks_fetched_at + self._jwks_ttl - time.monotonic()
+            if remaining > JWKS_REFRESH_AHEAD_SECONDS:
+                return self._jwks
+            if remaining > 0:
+                self._refresh_jwks_in_background()
+                return self._jwks
+
+        with self._jwks_lock:
+            # Re-check: another caller may have fetched the keys while we waited.
+            max_age = JWKS_FORCED_REFRESH_INTERVAL_SECONDS if force else self._jwks_ttl
+            if (
+                self._jwks is not None
+                and time.monotonic() - self._jwks_fetched_at < max_age
+            ):
+                return self._jwks
+            self._fetch_jwks()
+            return self._jwks
+
+    def _fetch_jwks(self) -> None:
+        """
+        Fetches the JWKS from Keycloak and restarts the cache TTL.
+
+        Signing keys are parsed into `cryptography` public keys here, once per
+        fetch, so token verification only does a dict lookup by `kid`.
+        """
+        try:
+            response = _get_http_client().get(self._jwks_url)
+            response.raise_for_status()
+            jwks = response.json()
+        except httpx.HTTPError as exc:
+            logger.error("Failed to fetch JWKS from Keycloak: %s", exc)
+            raise HttpError(
+                503, "Authentication service (Keycloak) unavailable."
+            ) from exc
+        self._signing_keys = self._parse_signing_keys(jwks)
+        self._jwks = jwks
+        self._jwks_fetched_at = time.monotonic()
+
+    @staticmethod
+    def _parse_signing_keys(jwks: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Parses the signature keys of a JWKS, skipping encryption keys.
+
+        Args:
+            jwks (Dict[str, Any]): The JWKS dictionary.
+
+        Returns:
+            Dict[str, Any]: Public key objects keyed by Key ID (kid).
+        """
+        import jwt
+
+        keys = {}
+        for jwk in jwks.get("keys", []):
+            if "kid" not in jwk or jwk.get("use", "sig") != "sig":
+                continue
             try:
-                with httpx.Client(timeout=10.0) as client:
-                    response = client.get(self._jwks_url)
-                    response.raise_for_status()
-                    self._jwks = response.json()
-            except httpx.HTTPError as exc:
-                logger.error("Failed to fetch JWKS from Keycloak: %s", exc)
-                raise HttpError(
-                    503, "Authentication service (Keycloak) unavailable."
-                ) from exc
-        return self._jwks
+                keys[jwk["kid"]] = jwt.PyJWK(jwk).key
+            except jwt.PyJWKError as exc:
+                logger.debug("Skipping unusable JWK %s: %s", jwk["kid"], exc)
+        return keys
+
+    def _signing_key(self, kid: Optional[str]) -> Optional[Any]:
+        """
+        Returns the public key for `kid`, re-fetching the JWKS once on a miss.
+
+        Keycloak may have rotated its keys since they were cached.
+        """
+        self._get_jwks()
+        key = self._signing_keys.get(kid)
+        if key is None:
+            self._get_jwks(force=True)
+            key = self._signing_keys.get(kid)
+        return key
+
+    def _refresh_jwks_in_background(self) -> None:
+        """Starts one background JWKS re-fetch unless one is already running."""
+        with self._jwks_lock:
+            if self._jwks_refreshing:
+                return
+            self._jwks_refreshing = True
+
+        def refresh() -> None:
+            try:
+                with self._jwks_lock:
+                    self._fetch_jwks()
+            except HttpError:
+                pass  # Keep serving cached keys until they expire.
+            finally:
+                self._jwks_refreshing = False
+
+        threading.Thread(target=refresh, name="jwks-refresh", daemon=True).start()
 
     def validate_token(self, token: str) -> User:
         """
@@ -127,7 +290,10 @@ class KeycloakAuth:
 
         This method verifies the token's signature using Keycloak's public keys
         (JWKS), checks its expiration, audience, and issuer, and then decodes
-        the claims to construct a `User` object.
+        the claims to construct a `User` object. The resulting user is cached
+        for up to `TOKEN_CACHE_MAX_TTL_SECONDS` (never beyond the token's
+        `exp`), so repeated requests with the same bearer token skip the RS256
+        signature check.
 
         Args:
             token (str): The JWT token string (without "Bearer" prefix).
@@ -138,23 +304,20 @@ class KeycloakAuth:
         Raises:
             HttpError 401: If the token is invalid, expired, or authentication service is unavailable.
         """
+        cache_key = hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+        cached = self._validated.get(cache_key)
+        if cached is not None and cached.token == token:
+            return cached
+
         try:
-            from jose import JWTError, jwt
-            from jose.exceptions import ExpiredSignatureError
+            import jwt
+            from jwt import ExpiredSignatureError, InvalidTokenError
 
             # Get unverified header to find the Key ID (kid) for JWKS lookup.
             unverified = jwt.get_unverified_header(token)
-            kid = unverified.get("kid")
-
-            jwks = self._get_jwks()
-            key = None
-            # Find the correct public key in the JWKS to verify the token's signature.
-            for jwk in jwks.get("keys", []):
-                if jwk.get("kid") == kid:
-                    key = jwk
-                    break
+            key = self._signing_key(unverified.get("kid"))
 
-            if not key:
+            if key is None:
                 logger.warning("JWT validation failed: Key ID (kid) not found in JWKS.")
                 raise HttpError(
                     401, "Invalid authentication token: signing key not found."
@@ -175,14 +338,14 @@ class KeycloakAuth:
             username = payload.get("preferred_username", email)
 
             realm_access = payload.get("realm_access", {})
-            roles = realm_access.get("roles", [])
+            roles = frozenset(realm_access.get("roles", []))
 
             tenant_id = payload.get(
                 "tenant_id", "default"
             )  # Custom claim for multi-tenancy.
             permissions = self._derive_permissions(roles)
 
-            return User(
+            user = User(
                 user_id=user_id,
                 email=email,
                 username=username,
@@ -191,11 +354,18 @@ class KeycloakAuth:
                 permissions=permissions,
                 token=token,
             )
+            ttl = TOKEN_CACHE_MAX_TTL_SECONDS
+            if "exp" in payload:
+                ttl = min(ttl, int(payload["exp"] - time.time()))
+            if ttl > 0:
+                self._validated.set(cache_key, user, ttl=ttl)
+            return user
 
         except ExpiredSignatureError as exc:
+            self._validated.delete(cache_key)
             logger.warning("JWT token is expired.")
             raise HttpError(401, "Authentication token has expired.") from exc
-        except JWTError as exc:
+        except InvalidTokenError as exc:
             logger.error("JWT validation error: %s", exc)
             raise HttpError(401, f"Invalid authentication token: {exc}.") from exc
         except HttpError:  # Re-raise HttpErrors from _get_jwks
@@ -206,38 +376,19 @@ class KeycloakAuth:
                 500, "Authentication failed due to internal error."
             ) from exc
 
-    def _derive_permissions(self, roles: List[str]) -> List[str]:
+    def _derive_permissions(self, roles: Iterable[str]) -> FrozenSet[str]:
         """
-        Derives a list of granular permissions based on the user's assigned roles.
+        Derives the set of granular permissions granted by the user's roles.
 
         Args:
-            roles (List[str]): A list of role names assigned to the user.
+            roles (Iterable[str]): The role names assigned to the user.
 
         Returns:
-            List[str]: A unique list of permissions the user possesses.
+            FrozenSet[str]: The permissions the user possesses.
         """
-        permissions = []
-
-        # Define a mapping from roles to their associated permissions.
-        role_map = {
-            "voyant-admin": ["*"],  # Wildcard for full administrative access.
-            "voyant-engineer": [
-                "read:*",
-                "write:sources",
-                "write:jobs",
-                "execute:sql",
-                "execute:presets",
-            ],
-            "voyant-analyst": ["read:*", "execute:sql", "execute:presets"],
-            "voyant-viewer": ["read:dashboards", "read:reports", "read:artifacts"],
-        }
-
-        # Aggregate permissions from all assigned roles.
-        for role in roles:
-            if role in role_map:
-                permissions.extend(role_map[role])
-
-        return list(set(permissions))  # Return unique permissions.
+        return _NO_PERMISSIONS.union(
+            *(_ROLE_PERMISSIONS.get(role, _NO_PERMISSIONS) for role in roles)
+        )
 
 
 class KeycloakBearer(HttpBearer):
@@ -292,13 +443,23 @@ def _get_bearer_token(request) -> Optional[str]:
     Args:
         request: The Django HTTP request object.
 
+    The result is memoized on the request, since role/permission checkers and
+    the endpoint itself may each resolve the current user.
+
     Returns:
         Optional[str]: The Bearer token string, or None if not found or malformed.
     """
-    auth_header = request.headers.get("Authorization", "")
-    if auth_header.startswith("Bearer "):
-        return auth_header.split(" ", 1)[1].strip()
-    return None
+    cache = getattr(request, "__dict__", {})
+    if "_voyant_bearer_token" in cache:
+        return cache["_voyant_bearer_token"]
+    auth_header = request.headers.get("Authorization")
+    token = (
+        auth_header[7:].strip()
+        if auth_header and auth_header.startswith("Bearer ")
+        else None
+    )
+    cache["_voyant_bearer_token"] = token
+    return token
 
 
 def get_current_user(request) -> User:
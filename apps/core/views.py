@@ -16,7 +16,6 @@ import os
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
-from asgiref.sync import async_to_sync
 from django.http import JsonResponse
 
 from apps.core.config import get_settings
@@ -128,10 +127,12 @@ def ready(_request) -> JsonResponse:
 
     # Temporal connectivity check
     try:
+        from apps.core.api_utils import run_async
         from apps.core.lib.temporal_client import get_temporal_client
 
         def _check_temporal() -> None:
-            async_to_sync(asyncio.wait_for)(get_temporal_client(), timeout=2.0)
+            # Connect on the shared bridge loop so the cached client stays usable.
+            run_async(asyncio.wait_for, get_temporal_client(), timeout=2.0)
 
         _run_with_timeout(_check_temporal, 3.0)
         checks["temporal"] = {"status": "up", "details": "Client connected"}
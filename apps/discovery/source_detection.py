@@ -4,90 +4,76 @@ from __future__ import annotations
 
 from typing import Any
 
+# Each rule is (source_type, connector, confidence).
+_Rule = tuple[str, str, float]
+
+_SCHEME_MAP: dict[str, _Rule] = {
+    "postgresql": ("postgresql", "airbyte/source-postgres", 0.95),
+    "postgres": ("postgresql", "airbyte/source-postgres", 0.95),
+    "mysql": ("mysql", "airbyte/source-mysql", 0.95),
+    "mongodb": ("mongodb", "airbyte/source-mongodb-v2", 0.95),
+    "mongodb+srv": ("mongodb", "airbyte/source-mongodb-v2", 0.95),
+}
+_SUFFIX_MAP: dict[str, _Rule] = {
+    ".csv": ("csv", "file", 0.9),
+    ".parquet": ("parquet", "file", 0.9),
+    ".json": ("json", "file", 0.9),
+    ".jsonl": ("json", "file", 0.9),
+}
+# Checked in order after the scheme and suffix lookups miss.
+_SUBSTRING_RULES: tuple[tuple[str, _Rule], ...] = (
+    ("s3://", ("s3", "airbyte/source-s3", 0.9)),
+    ("sheets.google.com", ("google_sheets", "airbyte/source-google-sheets", 0.9)),
+    (
+        "docs.google.com/spreadsheets",
+        ("google_sheets", "airbyte/source-google-sheets", 0.9),
+    ),
+)
+_SNOWFLAKE_RULE: _Rule = ("snowflake", "airbyte/source-snowflake", 0.9)
+_WEB_SCHEMES = frozenset({"http", "https"})
+_API_RULE: _Rule = ("api", "airbyte/source-http", 0.5)
+_UNKNOWN_RULE: _Rule = ("unknown", "unknown", 0.1)
+
+
+def _match(hint_lower: str) -> _Rule:
+    scheme = hint_lower.split("://", 1)[0] if "://" in hint_lower else ""
+    rule = _SCHEME_MAP.get(scheme)
+    if rule:
+        return rule
+    # Snowflake wins over file suffixes, e.g. "snowflake_export.csv".
+    if "snowflake" in hint_lower:
+        return _SNOWFLAKE_RULE
+    _, dot, ext = hint_lower.rpartition(".")
+    rule = _SUFFIX_MAP.get(dot + ext)
+    if rule:
+        return rule
+    for needle, rule in _SUBSTRING_RULES:
+        if needle in hint_lower:
+            return rule
+    if scheme in _WEB_SCHEMES:
+        return _API_RULE
+    return _UNKNOWN_RULE
+
+
+def _properties(source_type: str, connector: str, hint: str) -> dict[str, Any]:
+    if connector == "file":
+        return {"format": source_type}
+    if source_type == "postgresql":
+        return {"host": hint.split("@")[-1].split("/")[0] if "@" in hint else "unknown"}
+    if source_type == "s3":
+        parts = hint.split("/")
+        return {"bucket": parts[2] if len(parts) > 2 else ""}
+    if source_type == "api":
+        return {"url": hint}
+    return {}
+
 
 def detect_source_type(hint: str) -> dict[str, Any]:
     """Detect source type and connector hints from user-provided input."""
-    hint_lower = hint.lower()
-    if hint_lower.startswith("postgresql://") or hint_lower.startswith("postgres://"):
-        return {
-            "source_type": "postgresql",
-            "connector": "airbyte/source-postgres",
-            "properties": {
-                "host": hint.split("@")[-1].split("/")[0] if "@" in hint else "unknown"
-            },
-            "confidence": 0.95,
-        }
-    if hint_lower.startswith("mysql://"):
-        return {
-            "source_type": "mysql",
-            "connector": "airbyte/source-mysql",
-            "properties": {},
-            "confidence": 0.95,
-        }
-    if hint_lower.startswith("mongodb://") or hint_lower.startswith("mongodb+srv://"):
-        return {
-            "source_type": "mongodb",
-            "connector": "airbyte/source-mongodb-v2",
-            "properties": {},
-            "confidence": 0.95,
-        }
-    if "snowflake" in hint_lower:
-        return {
-            "source_type": "snowflake",
-            "connector": "airbyte/source-snowflake",
-            "properties": {},
-            "confidence": 0.9,
-        }
-    if hint_lower.endswith(".csv"):
-        return {
-            "source_type": "csv",
-            "connector": "file",
-            "properties": {"format": "csv"},
-            "confidence": 0.9,
-        }
-    if hint_lower.endswith(".parquet"):
-        return {
-            "source_type": "parquet",
-            "connector": "file",
-            "properties": {"format": "parquet"},
-            "confidence": 0.9,
-        }
-    if hint_lower.endswith(".json") or hint_lower.endswith(".jsonl"):
-        return {
-            "source_type": "json",
-            "connector": "file",
-            "properties": {"format": "json"},
-            "confidence": 0.9,
-        }
-    if "s3://" in hint_lower:
-        return {
-            "source_type": "s3",
-            "connector": "airbyte/source-s3",
-            "properties": {
-                "bucket": hint.split("/")[2] if len(hint.split("/")) > 2 else ""
-            },
-            "confidence": 0.9,
-        }
-    if (
-        "sheets.google.com" in hint_lower
-        or "docs.google.com/spreadsheets" in hint_lower
-    ):
-        return {
-            "source_type": "google_sheets",
-            "connector": "airbyte/source-google-sheets",
-            "properties": {},
-            "confidence": 0.9,
-        }
-    if hint_lower.startswith("http://") or hint_lower.startswith("https://"):
-        return {
-            "source_type": "api",
-            "connector": "airbyte/source-http",
-            "properties": {"url": hint},
-            "confidence": 0.5,
-        }
+    source_type, connector, confidence = _match(hint.lower())
     return {
-        "source_type": "unknown",
-        "connector": "unknown",
-        "properties": {},
-        "confidence": 0.1,
+        "source_type": source_type,
+        "connector": connector,
+        "properties": _properties(source_type, connector, hint),
+        "confidence": confidence,
     }
@@ -13,7 +13,7 @@ from pydantic import Field
 
 from apps.core.api_utils import run_async
 from apps.core.config import get_settings
-from apps.core.lib.temporal_client import get_temporal_client
+from apps.core.lib.temporal_client import cancel_workflow, start_workflow
 from apps.core.middleware import get_tenant_id
 from apps.discovery.models import Source
 from apps.ingestion.models import IngestionJob
@@ -66,9 +66,8 @@ def trigger_ingest(request: HttpRequest, payload: IngestRequest) -> JobResponse:
     )
 
     try:
-        client = run_async(get_temporal_client)
         run_async(
-            client.start_workflow,
+            start_workflow,
             IngestDataWorkflow.run,
             {
                 "job_id": str(job.id),
@@ -174,9 +173,7 @@ def cancel_job(request: HttpRequest, job_id: str) -> Dict[str, str]:
         raise HttpError(400, f"Job {job_id} cannot be cancelled (status: {job.status})")
 
     try:
-        client = run_async(get_temporal_client)
-        handle = client.get_workflow_handle(job.workflow_instance_id)
-        run_async(handle.cancel)
+        run_async(cancel_workflow, job.workflow_instance_id)
 
         job.status = IngestionJob.Status.CANCELLED
         job.save(update_fields=["status"])
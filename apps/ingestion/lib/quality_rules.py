@@ -30,6 +30,11 @@ class ValidationResult:
     passed: bool
     details: Dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        # Rules compare pandas scalars, which yields numpy.bool_; keep the
+        # summary made of plain Python values.
+        self.passed = bool(self.passed)
+
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert the validation result to a dictionary.
@@ -199,13 +204,12 @@ class UniqueCheck(QualityRule):
             )
 
         total = len(df)
-        unique = df[self.column].nunique()
-        # Note: nunique ignores NaNs by default.
-        # If we want strict uniqueness including NaNs, we'd need len(df[col].unique())
-        # But usually unique constraints imply non-null or allow one null.
-        # Let's check duplicates directly.
-
-        dupes = df.duplicated(subset=[self.column]).sum()
+        # One hash pass: pd.unique keeps one entry per distinct value (nulls
+        # included), so duplicates are the rows beyond those, and nunique's
+        # count is the non-null entries among them.
+        uniques = pd.unique(df[self.column])
+        dupes = total - len(uniques)
+        unique = int(pd.notna(uniques).sum())
 
         return ValidationResult(
             self.get_name(),
@@ -236,7 +240,7 @@ class QualityEngine:
         """
         results = [rule.check(df) for rule in self.rules]
 
-        passed_count = sum(1 for r in results if r.passed)
+        passed_count = sum(r.passed for r in results)
         failed_count = len(results) - passed_count
 
         return {
@@ -24,7 +24,7 @@ from apps.analysis.lib.kpi_templates import (
 )
 from apps.core.api_utils import run_async
 from apps.core.config import get_settings
-from apps.core.lib.temporal_client import get_temporal_client
+from apps.core.lib.temporal_client import cancel_workflow
 from apps.core.lib.tenant_quotas import QuotaTier, get_quota_manager, set_tenant_tier
 from apps.core.lib.trino import get_trino_client
 from apps.discovery.lib.catalog import ServiceDef, get_discovery_repo
@@ -164,14 +164,13 @@ def tool_jobs_cancel(job_id: str, tenant_id=None):
     if not job:
         raise ValueError("Job not found")
     try:
-        client = run_async(get_temporal_client)
-        for prefix in ("ingest", "profile", "quality", "analyze"):
-            try:
-                handle = client.get_workflow_handle(f"{prefix}-{job_id}")
-                run_async(handle.cancel)
-                break
-            except Exception:
-                continue
+        run_async(
+            cancel_workflow,
+            *(
+                f"{prefix}-{job_id}"
+                for prefix in ("ingest", "profile", "quality", "analyze")
+            ),
+        )
     except Exception:
         pass
     job.status = "cancelled"
@@ -12,7 +12,7 @@ from django_mcp import mcp_app
 
 from apps.core.api_utils import run_async
 from apps.core.config import get_settings
-from apps.core.lib.temporal_client import get_temporal_client
+from apps.core.lib.temporal_client import start_workflow
 from apps.core.lib.trino import get_trino_client
 from apps.core.lib.workflow_utils import dispatch_workflow
 from apps.discovery.models import Source
@@ -35,9 +35,8 @@ def _tenant(tenant_id):
 
 def _start_workflow(workflow_cls, workflow_id, payload):
     """Launch a Temporal workflow and return immediately (fire-and-forget)."""
-    client = run_async(get_temporal_client)
     run_async(
-        client.start_workflow,
+        start_workflow,
         workflow_cls.run,
         payload,
         id=workflow_id,
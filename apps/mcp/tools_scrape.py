@@ -12,7 +12,7 @@ Extracted from mcp/tools.py (Rule 245 compliance — 723-line split).
 
 from django_mcp import mcp_app
 
-from apps.core.api_utils import run_async
+from apps.core.api_utils import run_async_isolated
 from apps.scraper.activities import FetchActivities, ParseActivities
 from apps.uptp_core.engine import UPTPExecutionEngine
 from apps.uptp_core.schemas import TemplateExecutionRequest
@@ -36,6 +36,8 @@ def tool_scrape_fetch(
     capture_url_contains=None,
     capture_max_bytes=None,
     capture_max_items=None,
+    condense: bool = False,
+    max_html_length=None,
 ):
     """
     Fetch a web page and return HTML + metadata.
@@ -53,8 +55,11 @@ def tool_scrape_fetch(
         capture_url_contains: Filter for which JSON XHR URLs to capture.
         capture_max_bytes: Max size per captured JSON body.
         capture_max_items: Max number of JSON responses to capture.
+        condense: Strip scripts/styles/comments and non-selector attributes
+            from the returned HTML; use when reading the page to write selectors.
+        max_html_length: Truncate condensed HTML to this many characters.
     """
-    return run_async(
+    return run_async_isolated(
         _fetch_activities.fetch_page,
         {
             "url": url,
@@ -69,6 +74,8 @@ def tool_scrape_fetch(
             "capture_url_contains": capture_url_contains,
             "capture_max_bytes": capture_max_bytes,
             "capture_max_items": capture_max_items,
+            "condense": condense,
+            "max_html_length": max_html_length,
         },
     )
 
@@ -108,12 +115,15 @@ def tool_scrape_extract(html: str, selectors, url: str = ""):
     """
     Extract structured data from HTML using CSS or XPath selectors.
 
+    Prefer CSS selectors; use XPath (starting with //) only when CSS cannot
+    express the query, e.g. text(), axes or positions.
+
     Args:
         html: Raw HTML string to parse.
         selectors: Dict mapping field names to CSS/XPath selectors.
         url: Source URL for metadata context.
     """
-    return run_async(
+    return run_async_isolated(
         _parse_activities.extract_data,
         {"html": html, "selectors": selectors, "url": url},
     )
@@ -128,7 +138,7 @@ def tool_scrape_ocr(images, language: str = "spa+eng"):
         images: List of image URLs or local paths.
         language: Tesseract language pack (e.g. 'spa+eng', 'eng').
     """
-    return run_async(
+    return run_async_isolated(
         _parse_activities.process_ocr,
         {"images": images, "language": language},
     )
@@ -143,7 +153,7 @@ def tool_scrape_parse_pdf(pdf_url: str, extract_tables: bool = False):
         pdf_url: URL or local path of the PDF file.
         extract_tables: Whether to extract tables via pdfplumber.
     """
-    return run_async(
+    return run_async_isolated(
         _parse_activities.parse_pdf,
         {"pdf_url": pdf_url, "extract_tables": extract_tables},
     )
@@ -152,13 +162,13 @@ def tool_scrape_parse_pdf(pdf_url: str, extract_tables: bool = False):
 @mcp_app.tool(name="scrape.transcribe")
 def tool_scrape_transcribe(media_urls, language: str = "es"):
     """
-    Transcribe audio/video files to text using OpenAI Whisper.
+    Transcribe audio/video files to text using Whisper.
 
     Args:
         media_urls: List of media file URLs.
         language: Language code (e.g. 'es', 'en').
     """
-    return run_async(
+    return run_async_isolated(
         _parse_activities.transcribe_media,
         {"media_urls": media_urls, "language": language},
     )
@@ -11,8 +11,9 @@ Usage (recommended):
 
 Usage (backward-compatible):
     from apps.scraper.activities import ScrapeActivities
-    # Works for all methods: fetch_page, deep_archive, extract_data, process_ocr,
-    # transcribe_media, parse_pdf, store_artifact, finalize_job
+    # Works for all methods: fetch_page, fetch_pages_batch, deep_archive,
+    # extract_data, process_ocr, transcribe_media, parse_pdf, store_artifact,
+    # finalize_job
 """
 
 from apps.scraper.activities.fetch_activities import FetchActivities
@@ -10,7 +10,7 @@ Extracted from scraper/activities.py (Rule 245 compliance — 949-line split).
 import asyncio
 import json
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict
 
 from temporalio import activity
@@ -39,6 +39,40 @@ class FetchActivities:
             # REST/MCP direct execution path (not Temporal activity runtime).
             return
 
+    @staticmethod
+    def _playwright_options(params: Dict[str, Any]) -> Dict[str, Any]:
+        """Resolve Playwright rendering options from params and settings defaults."""
+        settle_ms = params.get("settle_ms")
+        if settle_ms is None:
+            settle_ms = settings.scraper_playwright_settle_ms_default
+        block_resources = params.get("block_resources")
+        if block_resources is None:
+            block_resources = settings.scraper_playwright_block_resources_default
+        capture_max_bytes = params.get("capture_max_bytes")
+        if capture_max_bytes is None:
+            capture_max_bytes = settings.scraper_playwright_capture_max_bytes
+        capture_max_items = params.get("capture_max_items")
+        if capture_max_items is None:
+            capture_max_items = settings.scraper_playwright_capture_max_items
+        return {
+            "wait_for": params.get("wait_for"),
+            "scroll": params.get("scroll", False),
+            "timeout": params.get("timeout", settings.scraper_default_timeout_seconds),
+            "wait_until": str(
+                params.get("wait_until") or settings.scraper_playwright_wait_until
+            ),
+            "settle_ms": int(settle_ms),
+            "block_resources": bool(block_resources),
+            "capture_json": bool(
+                params.get(
+                    "capture_json", settings.scraper_playwright_capture_json_default
+                )
+            ),
+            "capture_url_contains": params.get("capture_url_contains") or None,
+            "capture_max_bytes": int(capture_max_bytes),
+            "capture_max_items": int(capture_max_items),
+        }
+
     @activity.defn(name="fetch_page")
     async def fetch_page(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -52,6 +86,9 @@ class FetchActivities:
                 - wait_for (str, optional): CSS selector to wait for before returning content.
                 - scroll (bool): Whether to scroll to the bottom of the page.
                 - timeout (int): Request timeout in seconds.
+                - condense (bool): Return condensed HTML (no scripts/styles/comments,
+                  selector-relevant attributes only) instead of the raw page.
+                - max_html_length (int, optional): Truncate condensed HTML to this length.
 
         Returns:
             Dict with html, url, status_code, fetched_at.
@@ -59,30 +96,70 @@ class FetchActivities:
         Raises:
             ApplicationError: If SSRF protection blocks the URL or the fetch fails.
         """
+        url = params.get("url")
+        engine = params.get("engine", settings.scraper_default_engine)
+        self._heartbeat_safe(f"Fetching {url} with {engine}")
+        return await self._fetch_one(url, params)
+
+    @activity.defn(name="fetch_pages_batch")
+    async def fetch_pages_batch(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Fetch several pages in one activity, sharing one Chromium instance.
+
+        With the Playwright engine, the browser is launched once and each URL
+        renders in its own context, instead of a browser boot per URL.
+
+        Args:
+            params: Same options as `fetch_page`, with `urls` (List[str])
+                in place of `url`.
+
+        Returns:
+            Dict with `pages`: one entry per input URL, in input order. Each is
+            the `fetch_page` result, or `{"url", "error"}` if that URL failed.
+
+        Raises:
+            ApplicationError: If the shared browser cannot be launched.
+        """
+        urls = params.get("urls") or []
+        engine = params.get("engine", settings.scraper_default_engine)
+        self._heartbeat_safe(f"Fetching {len(urls)} pages with {engine}")
+
+        async def _fetch_or_error(url: str, browser: Any) -> Dict[str, Any]:
+            try:
+                return await self._fetch_one(url, params, browser=browser)
+            except ApplicationError as e:
+                return {"url": url, "error": str(e)}
+
+        if engine != "playwright":
+            pages = await asyncio.gather(*[_fetch_or_error(u, None) for u in urls])
+            return {"pages": list(pages)}
+
+        from playwright.async_api import async_playwright
+
+        async with async_playwright() as p:
+            try:
+                browser = await p.chromium.launch(headless=True)
+            except Exception as e:
+                raise ApplicationError(f"Browser launch failed: {e}")
+            try:
+                pages = await asyncio.gather(
+                    *[_fetch_or_error(u, browser) for u in urls]
+                )
+            finally:
+                try:
+                    await browser.close()
+                except Exception:
+                    pass
+        return {"pages": list(pages)}
+
+    async def _fetch_one(
+        self, url: str, params: Dict[str, Any], browser: Any = None
+    ) -> Dict[str, Any]:
+        """SSRF-check and fetch one URL, rendering on `browser` when given."""
         from apps.scraper.security import SSRFError, validate_url
 
-        url = params.get("url")
         engine = params.get("engine", settings.scraper_default_engine)
-        wait_for = params.get("wait_for")
-        scroll = params.get("scroll", False)
         timeout = params.get("timeout", settings.scraper_default_timeout_seconds)
-        wait_until = params.get("wait_until") or settings.scraper_playwright_wait_until
-        settle_ms = params.get("settle_ms")
-        if settle_ms is None:
-            settle_ms = settings.scraper_playwright_settle_ms_default
-        block_resources = params.get("block_resources")
-        if block_resources is None:
-            block_resources = settings.scraper_playwright_block_resources_default
-        capture_json = params.get(
-            "capture_json", settings.scraper_playwright_capture_json_default
-        )
-        capture_url_contains = params.get("capture_url_contains") or None
-        capture_max_bytes = params.get("capture_max_bytes")
-        if capture_max_bytes is None:
-            capture_max_bytes = settings.scraper_playwright_capture_max_bytes
-        capture_max_items = params.get("capture_max_items")
-        if capture_max_items is None:
-            capture_max_items = settings.scraper_playwright_capture_max_items
 
         # SSRF Protection (Zero-Bypass)
         try:
@@ -90,22 +167,10 @@ class FetchActivities:
         except SSRFError as e:
             raise ApplicationError(f"SSRF blocked: {e}", non_retryable=True)
 
-        self._heartbeat_safe(f"Fetching {url} with {engine}")
-
         try:
             if engine == "playwright":
                 result = await self._fetch_playwright(
-                    url,
-                    wait_for=wait_for,
-                    scroll=scroll,
-                    timeout=timeout,
-                    wait_until=str(wait_until),
-                    settle_ms=int(settle_ms),
-                    block_resources=bool(block_resources),
-                    capture_json=bool(capture_json),
-                    capture_url_contains=capture_url_contains,
-                    capture_max_bytes=int(capture_max_bytes),
-                    capture_max_items=int(capture_max_items),
+                    url, browser=browser, **self._playwright_options(params)
                 )
             elif engine == "httpx":
                 result = await self._fetch_httpx(url, timeout)
@@ -115,6 +180,13 @@ class FetchActivities:
                 # Default to httpx for unknown engines
                 result = await self._fetch_httpx(url, timeout)
 
+            if params.get("condense") and result.get("html"):
+                from apps.scraper.parsing.html_parser import condense_html
+
+                result["html"] = condense_html(
+                    result["html"], params.get("max_html_length")
+                )
+
             return result
 
         except ApplicationError:
@@ -124,7 +196,32 @@ class FetchActivities:
             raise ApplicationError(f"Fetch failed: {e}", non_retryable=False)
 
     async def _fetch_playwright(
+        self, url: str, browser: Any = None, **options: Any
+    ) -> Dict[str, Any]:
+        """
+        Fetch a URL using Playwright to support JavaScript rendering.
+
+        Renders in a fresh context on `browser` when given (the caller owns its
+        lifetime); otherwise launches and closes a Chromium instance for this URL.
+        """
+        if browser is not None:
+            return await self._render_playwright(browser, url, **options)
+
+        from playwright.async_api import async_playwright
+
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=True)
+            try:
+                return await self._render_playwright(browser, url, **options)
+            finally:
+                try:
+                    await browser.close()
+                except Exception:
+                    pass
+
+    async def _render_playwright(
         self,
+        browser: Any,
         url: str,
         wait_for: str | None = None,
         scroll: bool = False,
@@ -137,147 +234,136 @@ class FetchActivities:
         capture_max_bytes: int = 524288,
         capture_max_items: int = 25,
     ) -> Dict[str, Any]:
-        """Fetch a URL using Playwright to support JavaScript rendering."""
-        from playwright.async_api import async_playwright
-
-        async with async_playwright() as p:
-            captured_json: list[dict[str, Any]] = []
-            capture_tasks: set[asyncio.Task] = set()
-            capturing_enabled = True
-
-            browser = None
-            context = None
-            page = None
-            response = None
-            html = ""
-
-            try:
-                browser = await p.chromium.launch(headless=True)
-                context = await browser.new_context(
-                    user_agent=settings.scraper_playwright_user_agent,
-                    locale=settings.scraper_playwright_locale,
-                )
-                page = await context.new_page()
+        """Render one page in its own context on an already launched browser."""
+        captured_json: list[dict[str, Any]] = []
+        capture_tasks: set[asyncio.Task] = set()
+        capturing_enabled = True
 
-                if block_resources:
+        context = None
+        page = None
+        response = None
+        html = ""
 
-                    async def _route_handler(route, request) -> None:
-                        try:
-                            if request.resource_type in ("image", "media", "font"):
-                                await route.abort()
-                            else:
-                                await route.continue_()
-                        except Exception:
-                            try:
-                                await route.continue_()
-                            except Exception:
-                                return
+        try:
+            context = await browser.new_context(
+                user_agent=settings.scraper_playwright_user_agent,
+                locale=settings.scraper_playwright_locale,
+            )
+            page = await context.new_page()
 
-                    await page.route("**/*", _route_handler)
+            if block_resources:
 
-                async def _maybe_capture_response(response) -> None:
+                async def _route_handler(route, request) -> None:
                     try:
-                        if not capture_json:
-                            return
-                        if len(captured_json) >= capture_max_items:
-                            return
-                        req = response.request
-                        if req.resource_type not in ("xhr", "fetch"):
-                            return
-                        if response.status < 200 or response.status >= 300:
-                            return
-                        resp_url = str(response.url)
-                        if capture_url_contains and not any(
-                            s in resp_url for s in capture_url_contains
-                        ):
-                            return
-                        ct = (response.headers or {}).get("content-type", "")
-                        if "json" not in (ct or "").lower():
-                            return
-                        if len(captured_json) >= capture_max_items:
-                            return
-                        try:
-                            body = await response.text()
-                        except Exception:
-                            return
-                        if body is None or len(body) > capture_max_bytes:
-                            return
-                        try:
-                            parsed = json.loads(body)
-                        except Exception:
-                            return
-                        captured_json.append(
-                            {
-                                "url": resp_url,
-                                "status": response.status,
-                                "content_type": ct,
-                                "body": parsed,
-                            }
-                        )
+                        if request.resource_type in ("image", "media", "font"):
+                            await route.abort()
+                        else:
+                            await route.continue_()
                     except Exception:
-                        return
-
-                if capture_json:
-
-                    def _on_response(response) -> None:
-                        nonlocal capturing_enabled
-                        if not capturing_enabled:
-                            return
                         try:
-                            task = asyncio.create_task(
-                                _maybe_capture_response(response)
-                            )
-                        except RuntimeError:
+                            await route.continue_()
+                        except Exception:
                             return
-                        capture_tasks.add(task)
-                        task.add_done_callback(lambda t: capture_tasks.discard(t))
-
-                    page.on("response", _on_response)
-
-                response = await page.goto(
-                    url,
-                    wait_until=wait_until,
-                    timeout=timeout * 1000,
-                )
-
-                if wait_for:
-                    await page.wait_for_selector(wait_for, timeout=timeout * 1000)
-
-                if scroll:
-                    await page.evaluate(
-                        "window.scrollTo(0, document.body.scrollHeight)"
-                    )
-                    await page.wait_for_timeout(1000)
 
-                if settle_ms and settle_ms > 0:
-                    await page.wait_for_timeout(settle_ms)
+                await page.route("**/*", _route_handler)
 
-                html = await page.content()
-            finally:
-                capturing_enabled = False
-                if capture_tasks:
+            async def _maybe_capture_response(response) -> None:
+                try:
+                    if not capture_json:
+                        return
+                    if len(captured_json) >= capture_max_items:
+                        return
+                    req = response.request
+                    if req.resource_type not in ("xhr", "fetch"):
+                        return
+                    if response.status < 200 or response.status >= 300:
+                        return
+                    resp_url = str(response.url)
+                    if capture_url_contains and not any(
+                        s in resp_url for s in capture_url_contains
+                    ):
+                        return
+                    ct = (response.headers or {}).get("content-type", "")
+                    if "json" not in (ct or "").lower():
+                        return
+                    if len(captured_json) >= capture_max_items:
+                        return
                     try:
-                        await asyncio.gather(
-                            *list(capture_tasks), return_exceptions=True
-                        )
+                        body = await response.text()
                     except Exception:
-                        pass
-                for obj in [page, context, browser]:
+                        return
+                    if body is None or len(body) > capture_max_bytes:
+                        return
                     try:
-                        if obj is not None:
-                            await obj.close()
+                        parsed = json.loads(body)
                     except Exception:
-                        pass
+                        return
+                    captured_json.append(
+                        {
+                            "url": resp_url,
+                            "status": response.status,
+                            "content_type": ct,
+                            "body": parsed,
+                        }
+                    )
+                except Exception:
+                    return
 
-            result = {
-                "html": html,
-                "url": url,
-                "status_code": response.status if response else 0,
-                "fetched_at": datetime.utcnow().isoformat(),
-            }
             if capture_json:
-                result["captured_json"] = captured_json
-            return result
+
+                def _on_response(response) -> None:
+                    nonlocal capturing_enabled
+                    if not capturing_enabled:
+                        return
+                    try:
+                        task = asyncio.create_task(_maybe_capture_response(response))
+                    except RuntimeError:
+                        return
+                    capture_tasks.add(task)
+                    task.add_done_callback(lambda t: capture_tasks.discard(t))
+
+                page.on("response", _on_response)
+
+            response = await page.goto(
+                url,
+                wait_until=wait_until,
+                timeout=timeout * 1000,
+            )
+
+            if wait_for:
+                await page.wait_for_selector(wait_for, timeout=timeout * 1000)
+
+            if scroll:
+                await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+                await page.wait_for_timeout(1000)
+
+            if settle_ms and settle_ms > 0:
+                await page.wait_for_timeout(settle_ms)
+
+            html = await page.content()
+        finally:
+            capturing_enabled = False
+            if capture_tasks:
+                try:
+                    await asyncio.gather(*list(capture_tasks), return_exceptions=True)
+                except Exception:
+                    pass
+            for obj in [page, context]:
+                try:
+                    if obj is not None:
+                        await obj.close()
+                except Exception:
+                    pass
+
+        result = {
+            "html": html,
+            "url": url,
+            "status_code": response.status if response else 0,
+            "fetched_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        }
+        if capture_json:
+            result["captured_json"] = captured_json
+        return result
 
     @activity.defn(name="deep_archive")
     async def deep_archive(self, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -449,7 +535,7 @@ class FetchActivities:
                 "url": str(response.url),
                 "status_code": response.status_code,
                 "headers": dict(response.headers),
-                "fetched_at": datetime.utcnow().isoformat(),
+                "fetched_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
             }
 
     async def _fetch_scrapy(self, url: str, timeout: int = 30) -> Dict[str, Any]:
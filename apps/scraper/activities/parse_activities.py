@@ -8,17 +8,247 @@ Pure mechanical execution — NO intelligence, NO LLM, NO decision making.
 Extracted from scraper/activities.py (Rule 245 compliance — 949-line split).
 """
 
+import hashlib
+import io
 import logging
-from datetime import datetime
-from typing import Any, Dict
+import subprocess
+import threading
+import wave
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from temporalio import activity
 
 from apps.core.config import get_settings
+from apps.core.lib.cache import LRUCache
+from apps.scraper.parsing.html_parser import (
+    compiled_css,
+    compiled_xpath,
+)
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Process-wide OCR results keyed by URL validator or image content hash.
+_ocr_cache = LRUCache(
+    max_size=settings.scraper_ocr_cache_size,
+    default_ttl=settings.scraper_ocr_cache_ttl_seconds,
+)
+
+# lru_cache does not stop concurrent misses; transcriptions running on several
+# activity threads would otherwise each load their own copy of the model.
+_whisper_load_lock = threading.Lock()
+
+
+@lru_cache(maxsize=4)
+def _load_whisper_model(
+    backend: str, model_name: str, device: str = "auto", compute_type: str = "int8"
+) -> Tuple[str, Any]:
+    """
+    Load a Whisper model once per process.
+
+    The cache is keyed on everything that changes the loaded weights, so every
+    activity call after the first reuses the same model instead of paying the
+    (multi-GB) load again; `release_whisper_models` drops them. Callers hold
+    `_whisper_load_lock`.
+
+    faster-whisper (CTranslate2, quantized) is preferred and is wrapped in a
+    BatchedInferencePipeline so each file's audio chunks are decoded in
+    batches; the reference openai-whisper package is used when it is selected
+    or when faster-whisper is not installed.
+
+    Returns:
+        Tuple of (backend actually loaded, model).
+    """
+    if backend == "faster-whisper":
+        try:
+            from faster_whisper import WhisperModel  # type: ignore
+
+            model = WhisperModel(model_name, device=device, compute_type=compute_type)
+            try:
+                from faster_whisper import BatchedInferencePipeline  # type: ignore
+            except ImportError:
+                return backend, model
+            return "faster-whisper-batched", BatchedInferencePipeline(model=model)
+        except ImportError:
+            logger.warning(
+                "faster-whisper not installed; falling back to openai-whisper"
+            )
+
+    try:
+        import whisper  # type: ignore
+    except Exception as exc:
+        raise RuntimeError(
+            "Whisper is not installed in this runtime. "
+            "Enable transcription and include the transcription dependency set."
+        ) from exc
+
+    # openai-whisper picks CUDA when available if no device is given.
+    return "openai-whisper", whisper.load_model(
+        model_name, device=None if device == "auto" else device
+    )
+
+
+def _whisper_fp16(model: Any) -> bool:
+    """
+    Whether openai-whisper should decode in FP16 (configured, else CUDA only).
+
+    Follows the device the model was loaded on, not whether a GPU exists: a
+    model pinned to the CPU on a CUDA host must still decode in FP32.
+    """
+    if settings.scraper_whisper_fp16 is not None:
+        return settings.scraper_whisper_fp16
+    device = getattr(model, "device", None)
+    return getattr(device, "type", None) == "cuda"
+
+
+def release_whisper_models() -> None:
+    """
+    Drop cached Whisper models and return their GPU memory.
+
+    For memory-pressured workers; the next transcription reloads the model.
+    """
+    with _whisper_load_lock:
+        _load_whisper_model.cache_clear()
+    try:
+        import torch  # type: ignore
+    except ImportError:
+        return
+    if torch.cuda.is_available():
+        torch.cuda.empty_cache()
+
+
+def _decode_audio_bytes(data: bytes) -> Any:
+    """
+    Decode audio/video bytes to 16 kHz mono float32 samples via ffmpeg pipes.
+
+    Mirrors `whisper.load_audio` but feeds the bytes on stdin instead of
+    reading a file, so downloaded media never touches disk.
+    """
+    import numpy as np
+
+    cmd = [
+        "ffmpeg",
+        "-nostdin",
+        "-threads",
+        "0",
+        "-i",
+        "pipe:0",
+        "-f",
+        "s16le",
+        "-ac",
+        "1",
+        "-acodec",
+        "pcm_s16le",
+        "-ar",
+        "16000",
+        "pipe:1",
+    ]
+    proc = subprocess.run(cmd, input=data, capture_output=True, check=True)
+    return np.frombuffer(proc.stdout, np.int16).flatten().astype(np.float32) / 32768.0
+
+
+def _whisper_ready_wav(source: Union[str, bytes]) -> Optional[Any]:
+    """
+    Read a WAV that is already 16 kHz mono 16-bit PCM without decoding it.
+
+    Whisper's input format is exactly that, so such clips skip the ffmpeg
+    (openai-whisper) or PyAV (faster-whisper) decode and resample pass.
+
+    Returns:
+        float32 samples in [-1, 1], or None if the source is not such a WAV.
+    """
+    import numpy as np
+
+    stream = io.BytesIO(source) if isinstance(source, bytes) else source
+    try:
+        with wave.open(stream) as w:
+            if (w.getnchannels(), w.getsampwidth(), w.getframerate()) != (1, 2, 16000):
+                return None
+            frames = w.readframes(w.getnframes())
+    except (wave.Error, EOFError, OSError):
+        return None
+    return np.frombuffer(frames, np.int16).astype(np.float32) / 32768.0
+
+
+def _transcribe_many(
+    sources: List[Union[str, bytes]], language: str
+) -> List[Dict[str, Any]]:
+    """
+    Transcribe audio/video files with the configured Whisper backend.
+
+    Each source is a local path or the raw media bytes; bytes are decoded in
+    memory (a file-like object for faster-whisper, an ffmpeg pipe for
+    openai-whisper). WAVs already in Whisper's 16 kHz mono PCM format are
+    passed as samples without any decode. The model is loaded once per
+    process. With faster-whisper's batched pipeline, up to
+    `scraper_whisper_batch_size` chunks of each file go through the
+    encoder/decoder per forward pass.
+
+    Returns:
+        One dict per source, in input order, with full text and segments
+        (id, start, end, text) in the openai-whisper result schema regardless
+        of backend. A source that fails carries an `error` key instead.
+    """
+    with _whisper_load_lock:
+        backend, model = _load_whisper_model(
+            settings.scraper_whisper_backend,
+            settings.scraper_whisper_model_name,
+            settings.scraper_whisper_device,
+            settings.scraper_whisper_compute_type,
+        )
+    fp16 = backend == "openai-whisper" and _whisper_fp16(model)
+
+    results: List[Dict[str, Any]] = []
+    for source in sources:
+        try:
+            audio = _whisper_ready_wav(source)
+            if audio is None and isinstance(source, bytes):
+                audio = (
+                    _decode_audio_bytes(source)
+                    if backend == "openai-whisper"
+                    else io.BytesIO(source)
+                )
+            elif audio is None:
+                audio = source
+
+            if backend == "openai-whisper":
+                import torch  # type: ignore
+
+                # No autograd bookkeeping; FP16 halves compute and VRAM on GPU.
+                with torch.inference_mode():
+                    results.append(
+                        model.transcribe(audio, language=language, fp16=fp16)
+                    )
+                continue
+
+            if backend == "faster-whisper-batched":
+                segments, _info = model.transcribe(
+                    audio,
+                    language=language,
+                    batch_size=settings.scraper_whisper_batch_size,
+                )
+            else:
+                segments, _info = model.transcribe(
+                    audio, language=language, vad_filter=True
+                )
+            segments = [
+                {"id": seg.id, "start": seg.start, "end": seg.end, "text": seg.text}
+                for seg in segments
+            ]
+            results.append(
+                {
+                    "text": "".join(seg["text"] for seg in segments),
+                    "segments": segments,
+                }
+            )
+        except Exception as e:
+            logger.warning(f"Transcription failed: {e}")
+            results.append({"error": str(e)})
+
+    return results
+
 
 class ParseActivities:
     """
@@ -67,7 +297,7 @@ class ParseActivities:
 
         result: Dict[str, Any] = {
             "url": url,
-            "extracted_at": datetime.utcnow().isoformat(),
+            "extracted_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
         }
 
         for field, selector in selectors.items():
@@ -80,8 +310,10 @@ class ParseActivities:
                 result[field] = None
                 logger.warning(f"Selector {field} failed: {e}")
 
-        result["images"] = tree.xpath("//img/@src")
-        result["media_urls"] = tree.xpath("//video/source/@src | //audio/source/@src")
+        result["images"] = compiled_xpath("//img/@src")(tree)
+        result["media_urls"] = compiled_xpath(
+            "//video/source/@src | //audio/source/@src"
+        )(tree)
 
         return result
 
@@ -95,16 +327,13 @@ class ParseActivities:
             - Plain CSS selector
         """
         if selector.startswith("//"):
-            return tree.xpath(selector)
+            return compiled_xpath(selector)(tree)
         elif "::" in selector:
             parts = selector.split("::")
             css = parts[0]
             pseudo = parts[1] if len(parts) > 1 else "text"
 
-            from lxml.cssselect import CSSSelector
-
-            sel = CSSSelector(css)
-            elements = sel(tree)
+            elements = compiled_css(css)(tree)
 
             if pseudo == "text":
                 return [
@@ -116,10 +345,7 @@ class ParseActivities:
             else:
                 return [el.text_content().strip() for el in elements]
         else:
-            from lxml.cssselect import CSSSelector
-
-            sel = CSSSelector(selector)
-            elements = sel(tree)
+            elements = compiled_css(selector)(tree)
             return [el.text_content().strip() for el in elements if el.text_content()]
 
     def _extract_nested(self, tree, selector_config: dict):
@@ -135,12 +361,9 @@ class ParseActivities:
         fields = selector_config.get("fields", {})
 
         if root_selector.startswith("//"):
-            items = tree.xpath(root_selector)
+            items = compiled_xpath(root_selector)(tree)
         else:
-            from lxml.cssselect import CSSSelector
-
-            sel = CSSSelector(root_selector)
-            items = sel(tree)
+            items = compiled_css(root_selector)(tree)
 
         results = []
         for item in items:
@@ -171,38 +394,27 @@ class ParseActivities:
         images = params.get("images", [])
         language = params.get("language", settings.scraper_default_ocr_language)
 
-        self._heartbeat_safe(f"OCR processing {len(images)} images")
+        # Pages repeat logos, avatars and sprites; dedupe before any network I/O.
+        unique_images = list(dict.fromkeys(images))[: settings.scraper_max_ocr_images]
+
+        self._heartbeat_safe(f"OCR processing {len(unique_images)} images")
 
         results = []
         combined_text = []
 
-        for image_url in images[: settings.scraper_max_ocr_images]:
-            try:
-                if image_url.startswith(("http://", "https://")):
-                    import httpx
-
-                    async with httpx.AsyncClient() as client:
-                        resp = await client.get(image_url)
-                        image_data = resp.content
-                else:
-                    with open(image_url, "rb") as f:
-                        image_data = f.read()
+        import httpx
 
-                import io
-
-                import pytesseract
-                from PIL import Image
-
-                img = Image.open(io.BytesIO(image_data))
-                text = pytesseract.image_to_string(img, lang=language)
-
-                if text.strip():
-                    results.append({"source": image_url, "text": text.strip()})
-                    combined_text.append(text.strip())
+        async with httpx.AsyncClient() as client:
+            for image_url in unique_images:
+                try:
+                    text = await self._ocr_image(client, image_url, language)
+                    if text:
+                        results.append({"source": image_url, "text": text})
+                        combined_text.append(text)
 
-            except Exception as e:
-                logger.warning(f"OCR failed for {image_url}: {e}")
-                results.append({"source": image_url, "error": str(e)})
+                except Exception as e:
+                    logger.warning(f"OCR failed for {image_url}: {e}")
+                    results.append({"source": image_url, "error": str(e)})
 
         return {
             "text": "\n\n".join(combined_text),
@@ -210,6 +422,62 @@ class ParseActivities:
             "processed": len(results),
         }
 
+    async def _ocr_image(self, client, image_url: str, language: str) -> str:
+        """
+        OCR a single image, reusing cached text for already-seen images.
+
+        Remote images are first probed with HEAD: a matching (URL, ETag or
+        Content-Length) pair skips the download entirely. After download, the
+        SHA-256 of the bytes catches identical images served from other URLs.
+        """
+        url_key = None
+        if image_url.startswith(("http://", "https://")):
+            url_key = await self._ocr_url_key(client, image_url, language)
+            if url_key is not None:
+                cached = _ocr_cache.get(url_key)
+                if cached is not None:
+                    return cached
+
+            resp = await client.get(image_url)
+            image_data = resp.content
+        else:
+            with open(image_url, "rb") as f:
+                image_data = f.read()
+
+        content_key = f"ocr:sha:{hashlib.sha256(image_data).hexdigest()}:{language}"
+        text = _ocr_cache.get(content_key)
+        if text is None:
+            from PIL import Image
+
+            from apps.scraper.parsing.ocr_processor import (
+                PSM_SINGLE_BLOCK,
+                image_to_text,
+                prepare_for_ocr,
+            )
+
+            img = prepare_for_ocr(Image.open(io.BytesIO(image_data)))
+            # Web images are mostly single text blocks: skip layout analysis.
+            text = image_to_text(img, language, psm=PSM_SINGLE_BLOCK)
+            _ocr_cache.set(content_key, text)
+
+        if url_key is not None:
+            _ocr_cache.set(url_key, text)
+        return text
+
+    @staticmethod
+    async def _ocr_url_key(client, image_url: str, language: str) -> str | None:
+        """Build a cache key from a HEAD validator, or None if the server gives none."""
+        try:
+            head = await client.head(image_url, follow_redirects=True)
+        except Exception as e:
+            logger.debug(f"OCR HEAD probe failed for {image_url}: {e}")
+            return None
+        validator = head.headers.get("etag") or head.headers.get("content-length")
+        if head.status_code >= 400 or not validator:
+            return None
+        url_hash = hashlib.sha256(image_url.encode("utf-8")).hexdigest()
+        return f"ocr:url:{url_hash}:{validator}:{language}"
+
     @activity.defn(name="transcribe_media")
     async def transcribe_media(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -237,31 +505,46 @@ class ParseActivities:
 
         self._heartbeat_safe(f"Transcribing {len(media_urls)} media files")
 
-        transcriptions = []
+        import asyncio
 
-        for media_url in media_urls[: settings.scraper_max_transcribe_media]:
-            try:
-                import tempfile
+        import httpx
 
-                import httpx
+        media_urls = media_urls[: settings.scraper_max_transcribe_media]
 
-                async with httpx.AsyncClient() as client:
-                    resp = await client.get(media_url)
-                    with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as f:
-                        f.write(resp.content)
-                        temp_path = f.name
+        async def download(client: httpx.AsyncClient, media_url: str) -> bytes:
+            resp = await client.get(media_url)
+            return resp.content
 
-                try:
-                    import whisper  # type: ignore
-                except Exception as exc:
-                    raise RuntimeError(
-                        "Whisper is not installed in this runtime. "
-                        "Enable transcription and include the transcription dependency set."
-                    ) from exc
+        async with httpx.AsyncClient() as client:
+            downloads = await asyncio.gather(
+                *(download(client, url) for url in media_urls),
+                return_exceptions=True,
+            )
+
+        media = [data for data in downloads if isinstance(data, bytes)]
+        transcribed: List[Dict[str, Any]] = []
+        try:
+            if media:
+                # One model load and one worker-thread hop for the whole batch.
+                transcribed = await asyncio.to_thread(_transcribe_many, media, language)
+        except Exception as e:
+            logger.warning(f"Transcription failed: {e}")
+            transcribed = [{"error": str(e)}] * len(media)
 
-                model = whisper.load_model(settings.scraper_whisper_model_name)
-                result = model.transcribe(temp_path, language=language)
+        results = iter(transcribed)
+        transcriptions = []
+        for media_url, downloaded in zip(media_urls, downloads):
+            if isinstance(downloaded, BaseException):
+                logger.warning(f"Transcription failed for {media_url}: {downloaded}")
+                result = {"error": str(downloaded)}
+            else:
+                result = next(results)
 
+            if "error" in result:
+                transcriptions.append(
+                    {"source": media_url, "error_code": "TRANSCRIPTION_FAILED"}
+                )
+            else:
                 transcriptions.append(
                     {
                         "source": media_url,
@@ -270,16 +553,6 @@ class ParseActivities:
                     }
                 )
 
-                import os
-
-                os.unlink(temp_path)
-
-            except Exception as e:
-                logger.warning(f"Transcription failed for {media_url}: {e}")
-                transcriptions.append(
-                    {"source": media_url, "error_code": "TRANSCRIPTION_FAILED"}
-                )
-
         return {
             "transcriptions": transcriptions,
             "processed": len(transcriptions),
@@ -289,15 +562,17 @@ class ParseActivities:
     async def parse_pdf(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
         Parse a PDF document to extract text, metadata, and tables.
-        Uses Apache Tika for text/metadata and pdfplumber for tables.
+        Uses pdfplumber native text first, Tesseract only for scanned pages,
+        and Apache Tika when the document has no usable text layer.
 
         Args:
             params:
                 - pdf_url (str): URL or local path of the PDF file.
                 - extract_tables (bool): Whether to extract tables via pdfplumber.
+                - language (str): Tesseract language(s) for scanned pages.
 
         Returns:
-            Dict with text, metadata, and optional tables list.
+            Dict with text, metadata, pages, ocr_pages, and optional tables list.
         """
         pdf_url = params.get("pdf_url", "")
         extract_tables = params.get("extract_tables", False)
@@ -310,38 +585,23 @@ class ParseActivities:
 
                 validate_url(pdf_url)
 
-                import tempfile
-
                 import httpx
 
                 async with httpx.AsyncClient() as client:
                     resp = await client.get(pdf_url)
-                    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-                        f.write(resp.content)
-                        pdf_path = f.name
+                # Parsed from memory; pdfplumber needs a seekable file object.
+                pdf_source: Union[str, io.BytesIO] = io.BytesIO(resp.content)
             else:
-                pdf_path = pdf_url
-
-            from tika import parser as tika_parser
-
-            parsed = tika_parser.from_file(pdf_path)
-
-            result: Dict[str, Any] = {
-                "text": parsed.get("content", "").strip(),
-                "metadata": parsed.get("metadata", {}),
-            }
+                pdf_source = pdf_url
 
-            if extract_tables:
-                import pdfplumber
+            import asyncio
 
-                tables = []
-                with pdfplumber.open(pdf_path) as pdf:
-                    for i, page in enumerate(pdf.pages):
-                        for table in page.extract_tables():
-                            tables.append({"page": i + 1, "data": table})
-                result["tables"] = tables
+            from apps.scraper.parsing.pdf_parser import PDFParser
 
-            return result
+            language = params.get("language", settings.scraper_default_ocr_language)
+            parser = PDFParser(ocr_language=language)
+            # Text extraction and page OCR are CPU-bound; keep the loop free.
+            return await asyncio.to_thread(parser.parse, pdf_source, extract_tables)
 
         except Exception as e:
             logger.error(f"PDF parse failed: {e}")
@@ -9,7 +9,7 @@ Extracted from scraper/activities.py (Rule 245 compliance — 949-line split).
 
 import hashlib
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict
 
 from temporalio import activity
@@ -50,7 +50,9 @@ class StorageActivities:
         Store extracted scrape data as a JSON artifact in MinIO.
 
         Creates or updates a ScrapeArtifact ORM record keyed by content hash
-        to ensure idempotent storage regardless of retry count.
+        to ensure idempotent storage regardless of retry count. The first time
+        an artifact is recorded, the job's live progress counters are bumped
+        in a single UPDATE.
 
         Args:
             params:
@@ -58,49 +60,125 @@ class StorageActivities:
                 - tenant_id (str): Tenant ID for partitioning.
                 - url (str): Original source URL.
                 - data (dict): Extracted data to persist.
+                - bytes_processed (int, optional): Size of the fetched page.
 
         Returns:
             Dict with artifact_id, storage_path, content_hash, size_bytes, url.
         """
-        from apps.core.lib.artifact_store import store_artifact
-
-        _, ScrapeArtifact = self._load_models()
+        ScrapeJob, ScrapeArtifact = self._load_models()
         job_id = params.get("job_id")
         tenant_id = params.get("tenant_id", settings.default_tenant_id)
         url = params.get("url", "")
-        data = params.get("data", {})
 
         self._heartbeat_safe(f"Storing artifact for {url}")
 
+        record = self._write_artifact(job_id, tenant_id, url, params.get("data", {}))
+        artifact_id = record.pop("artifact_id")
+
+        _, created = ScrapeArtifact.objects.update_or_create(
+            artifact_id=artifact_id,
+            defaults={"job_id": job_id, **record},
+        )
+        if created:
+            ScrapeJob(job_id=job_id).increment_progress(
+                pages=1,
+                bytes_=params.get("bytes_processed", 0),
+                artifacts=1,
+            )
+
+        return self._artifact_summary(artifact_id, record)
+
+    @activity.defn(name="store_artifacts")
+    def store_artifacts(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Store many extracted results for one job with batched ORM inserts.
+
+        Each item is written to MinIO as in `store_artifact`, then all
+        ScrapeArtifact rows are inserted via `ScrapeArtifact.bulk_record`
+        (existing IDs skipped, so retries are safe). Artifacts recorded for
+        the first time bump the job's progress counters in one UPDATE.
+
+        Args:
+            params:
+                - job_id (str): Parent job ID.
+                - tenant_id (str): Tenant ID for partitioning.
+                - items (list[dict]): Each with url (str), data (dict) and
+                  optionally bytes_processed (int).
+
+        Returns:
+            Dict with artifacts (one summary per item, in order) and count.
+        """
+        ScrapeJob, ScrapeArtifact = self._load_models()
+        job_id = params.get("job_id")
+        tenant_id = params.get("tenant_id", settings.default_tenant_id)
+        items = params.get("items", [])
+
+        self._heartbeat_safe(f"Storing {len(items)} artifacts for job {job_id}")
+
+        records = [
+            self._write_artifact(
+                job_id, tenant_id, item.get("url", ""), item.get("data", {})
+            )
+            for item in items
+        ]
+        seen = set(
+            ScrapeArtifact.objects.filter(
+                artifact_id__in=[record["artifact_id"] for record in records]
+            ).values_list("artifact_id", flat=True)
+        )
+        ScrapeArtifact.bulk_record(job_id, records)
+
+        new_pages = new_bytes = 0
+        for item, record in zip(items, records):
+            if record["artifact_id"] not in seen:
+                seen.add(record["artifact_id"])
+                new_pages += 1
+                new_bytes += item.get("bytes_processed", 0)
+        if new_pages:
+            ScrapeJob(job_id=job_id).increment_progress(
+                pages=new_pages, bytes_=new_bytes, artifacts=new_pages
+            )
+
+        artifacts = [
+            self._artifact_summary(record["artifact_id"], record) for record in records
+        ]
+        return {"artifacts": artifacts, "count": len(artifacts)}
+
+    @staticmethod
+    def _write_artifact(
+        job_id: Any, tenant_id: str, url: str, data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Write `data` to the artifact store and return its ScrapeArtifact fields."""
+        from apps.core.lib.artifact_store import store_artifact
+        from apps.scraper.models import ScrapeArtifact
+
         ref = store_artifact(
             content=data,
             artifact_type="scrape_json",
             metadata={"job_id": job_id, "tenant_id": tenant_id, "source_url": url},
         )
         content_hash = hashlib.sha256(str(ref.hash).encode("utf-8")).hexdigest()
-        artifact_id = f"scrape-{job_id}-{content_hash[:12]}"
-        storage_path = ref.hash
-
-        ScrapeArtifact.objects.update_or_create(
-            artifact_id=artifact_id,
-            defaults={
-                "job_id": job_id,
-                "artifact_type": ScrapeArtifact.ArtifactType.JSON,
-                "format": "json",
-                "storage_path": storage_path,
-                "content_hash": ref.hash,
-                "size_bytes": ref.size_bytes,
-                "source_url": url,
-                "metadata": {"artifact_ref": ref.to_dict()},
-            },
-        )
 
         return {
-            "artifact_id": artifact_id,
-            "storage_path": storage_path,
+            "artifact_id": f"scrape-{job_id}-{content_hash[:12]}",
+            "artifact_type": ScrapeArtifact.ArtifactType.JSON,
+            "format": "json",
+            "storage_path": ref.hash,
             "content_hash": ref.hash,
             "size_bytes": ref.size_bytes,
-            "url": url,
+            "source_url": url,
+            "metadata": {"artifact_ref": ref.to_dict()},
+        }
+
+    @staticmethod
+    def _artifact_summary(artifact_id: str, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Activity return shape for a stored artifact."""
+        return {
+            "artifact_id": artifact_id,
+            "storage_path": record["storage_path"],
+            "content_hash": record["content_hash"],
+            "size_bytes": record["size_bytes"],
+            "url": record["source_url"],
         }
 
     @activity.defn(name="finalize_job")
@@ -129,16 +207,20 @@ class StorageActivities:
         error_count = params.get("error_count", 0)
 
         self._heartbeat_safe(f"Finalizing job {job_id}")
-        status = "succeeded" if error_count == 0 else "partial"
-
         ScrapeJob, _ = self._load_models()
+        status = (
+            ScrapeJob.Status.SUCCEEDED if error_count == 0 else ScrapeJob.Status.PARTIAL
+        )
+        finished_at = datetime.now(timezone.utc)
+
+        # Single UPDATE: no SELECT, no model instantiation, no save() signals.
         ScrapeJob.objects.filter(job_id=job_id).update(
             status=status,
             pages_fetched=pages_fetched,
             bytes_processed=bytes_processed,
             artifact_count=artifact_count,
             error_count=error_count,
-            finished_at=datetime.utcnow(),
+            finished_at=finished_at,
         )
 
         return {
@@ -148,5 +230,5 @@ class StorageActivities:
             "bytes_processed": bytes_processed,
             "artifact_count": artifact_count,
             "error_count": error_count,
-            "finished_at": datetime.utcnow().isoformat(),
+            "finished_at": finished_at.isoformat(timespec="seconds"),
         }
@@ -7,7 +7,6 @@ are controlled by an external intelligent agent, following an Agent-Tool Archite
 
 from typing import Any, Dict, List, Optional
 
-from asgiref.sync import async_to_sync
 from django.shortcuts import get_object_or_404
 from ninja import Router, Schema
 
@@ -144,8 +143,10 @@ def _get_security():
 
 
 def _run_async(func, *args, **kwargs):
-    """Run async function synchronously."""
-    return async_to_sync(func)(*args, **kwargs)
+    """Run a scraper activity synchronously, isolated from the shared bridge."""
+    from apps.core.api_utils import run_async_isolated
+
+    return run_async_isolated(func, *args, **kwargs)
 
 
 def _start_scrape_workflow(
@@ -156,13 +157,13 @@ def _start_scrape_workflow(
     tenant_id: str,
 ):
     """Start Temporal workflow for scraping (pure execution)."""
-    from apps.core.lib.temporal_client import get_temporal_client
+    from apps.core.api_utils import run_async
+    from apps.core.lib.temporal_client import start_workflow
 
     from .workflow import ScrapeWorkflow
 
-    client = _run_async(get_temporal_client)
-    _run_async(
-        client.start_workflow,
+    run_async(
+        start_workflow,
         ScrapeWorkflow.run,
         {
             "job_id": job_id,
@@ -181,7 +182,7 @@ def _start_scrape_workflow(
 # ============================================================================
 
 
-@scrape_router.post("/start", response={202: ScrapeJobSchema})
+@scrape_router.post("/start", response={202: ScrapeJobSchema, 400: Dict[str, Any]})
 def start_scrape(request, payload: ScrapeStartSchema):
     """
     Start a new web scraping job.
@@ -195,6 +196,7 @@ def start_scrape(request, payload: ScrapeStartSchema):
     - wait_for: CSS selector to wait for
     - ocr: true/false - Enable OCR for images found
     - transcribe: true/false - Enable transcription for media
+    - max_concurrency: URLs processed in parallel (default: 5)
     """
     ScrapeJob, _ = _get_models()
     validate_url, validate_urls, SSRFError = _get_security()
@@ -207,6 +209,14 @@ def start_scrape(request, payload: ScrapeStartSchema):
     except SSRFError as e:
         return 400, {"error": str(e)}
 
+    # Reject malformed selectors before a job is queued and pages are fetched.
+    if payload.selectors:
+        from .parsing.html_parser import validate_selectors
+
+        invalid = validate_selectors(payload.selectors)
+        if invalid:
+            return 400, {"error": "Invalid selectors", "invalid_selectors": invalid}
+
     job = ScrapeJob.objects.create(
         tenant_id=tenant_id,
         urls=validated_urls,
@@ -224,11 +234,12 @@ def start_scrape(request, payload: ScrapeStartSchema):
             tenant_id=tenant_id,
         )
         job.status = ScrapeJob.Status.RUNNING
-        job.save(update_fields=["status"])
+        ScrapeJob.objects.filter(job_id=job.job_id).update(status=job.status)
     except Exception as e:
         job.status = ScrapeJob.Status.FAILED
-        job.error_message = str(e)
-        job.save(update_fields=["status", "error_message"])
+        ScrapeJob.objects.filter(job_id=job.job_id).update(
+            status=job.status, error_message=str(e)
+        )
 
     return 202, {
         "job_id": str(job.job_id),
@@ -241,7 +252,7 @@ def start_scrape(request, payload: ScrapeStartSchema):
     }
 
 
-@scrape_router.post("/extract")
+@scrape_router.post("/extract", response={200: Dict[str, Any], 400: Dict[str, Any]})
 def extract_data(request, payload: ScrapeExtractSchema):
     """
     Extract data from HTML using agent-provided selectors.
@@ -249,7 +260,16 @@ def extract_data(request, payload: ScrapeExtractSchema):
     Pure execution - no LLM, just CSS/XPath parsing.
     """
     from lxml import html as lxml_html
-    from lxml.cssselect import CSSSelector
+
+    from .parsing.html_parser import (
+        compiled_css,
+        compiled_xpath,
+        validate_selectors,
+    )
+
+    invalid = validate_selectors(payload.selectors)
+    if invalid:
+        return 400, {"error": "Invalid selectors", "invalid_selectors": invalid}
 
     try:
         tree = lxml_html.fromstring(payload.html)
@@ -262,11 +282,10 @@ def extract_data(request, payload: ScrapeExtractSchema):
             if isinstance(selector, str):
                 if selector.startswith("//"):
                     # XPath
-                    result[field] = tree.xpath(selector)
+                    result[field] = compiled_xpath(selector)(tree)
                 else:
                     # CSS
-                    sel = CSSSelector(selector)
-                    elements = sel(tree)
+                    elements = compiled_css(selector)(tree)
                     result[field] = [el.text_content().strip() for el in elements]
         except Exception as e:
             result[field] = {"error": str(e)}
@@ -385,17 +404,17 @@ def cancel_scrape(request, job_id: str):
 
     # Cancel workflow execution when a running scrape is stopped.
     try:
-        from apps.core.lib.temporal_client import get_temporal_client
+        from apps.core.api_utils import run_async
+        from apps.core.lib.temporal_client import cancel_workflow
 
-        client = _run_async(get_temporal_client)
-        handle = client.get_workflow_handle(f"scrape-{job_id}")
-        _run_async(handle.cancel)
+        run_async(cancel_workflow, f"scrape-{job_id}")
     except Exception:
         # Keep cancellation idempotent even if workflow handle is already closed/missing.
         pass
 
-    job.status = ScrapeJob.Status.CANCELLED
-    job.save()
+    ScrapeJob.objects.filter(job_id=job.job_id).update(
+        status=ScrapeJob.Status.CANCELLED
+    )
 
     return {"status": "cancelled", "job_id": str(job.job_id)}
 
@@ -144,15 +144,8 @@ class BeautifulSoupClient:
             requests.exceptions.RequestException: If the HTTP request fails.
             Exception: Any exception raised during HTML parsing.
         """
-        soup = self.fetch_and_parse(url)
-        links = []
-
-        for a in soup.find_all("a", href=True):
-            href = a["href"]
-            absolute_url = urljoin(url, href)
-            links.append(absolute_url)
-
-        return links
+        tree = self._fetch_tree(url)
+        return [urljoin(url, href) for href in tree.xpath("//a/@href")]
 
     def extract_by_selector(
         self, url: str, selector: str, attribute: Optional[str] = None
@@ -173,9 +166,30 @@ class BeautifulSoupClient:
             requests.exceptions.RequestException: If the HTTP request fails.
             Exception: Any exception raised during HTML parsing or selector execution.
         """
-        soup = self.fetch_and_parse(url)
-        elements = soup.select(selector)
+        from apps.scraper.parsing.html_parser import compiled_css
+
+        tree = self._fetch_tree(url)
+        elements = compiled_css(selector)(tree)
 
         if attribute:
             return [el.get(attribute, "") for el in elements]
-        return [el.get_text(strip=True) for el in elements]
+        # Matches BeautifulSoup's get_text(strip=True): strip each text node, no separator.
+        return ["".join(t.strip() for t in el.itertext()) for el in elements]
+
+    def _fetch_tree(self, url: str):
+        """
+        Fetches a web page and parses it directly into an lxml element tree.
+
+        Selector and link extraction run on this tree rather than on a
+        BeautifulSoup object, which would first build an lxml parse and then
+        convert it into a slower pure-Python tree.
+
+        Args:
+            url (str): The URL of the web page to fetch.
+
+        Returns:
+            lxml.html.HtmlElement: The root element of the parsed page.
+        """
+        from lxml import html as lxml_html
+
+        return lxml_html.fromstring(self.fetch(url))
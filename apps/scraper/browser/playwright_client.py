@@ -15,6 +15,17 @@ from playwright.async_api import Browser, async_playwright
 
 logger = logging.getLogger(__name__)
 
+# Resource types that never contribute to the serialized DOM.
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "stylesheet", "media"})
+
+
+async def _abort_non_document_resources(route, request) -> None:
+    """Route handler that aborts requests for `_BLOCKED_RESOURCE_TYPES`."""
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
 
 class PlaywrightClient:
     """
@@ -60,7 +71,11 @@ class PlaywrightClient:
         return self._browser
 
     async def fetch_async(
-        self, url: str, wait_until: str = "networkidle", timeout: int = 30000
+        self,
+        url: str,
+        wait_until: str = "networkidle",
+        timeout: int = 30000,
+        html_only: bool = True,
     ) -> str:
         """
         Fetches the HTML content of a URL asynchronously, waiting for dynamic content to load.
@@ -70,6 +85,9 @@ class PlaywrightClient:
             wait_until (str): Condition to wait for after navigation ('domcontentloaded', 'load', 'networkidle').
                               Defaults to 'networkidle'.
             timeout (int): Maximum time in milliseconds to wait for navigation. Defaults to 30000 (30 seconds).
+            html_only (bool): If True, abort image, font, stylesheet and media requests so
+                              Chromium only downloads what is needed to build the DOM.
+                              Scripts and XHR still run. Defaults to True.
 
         Returns:
             str: The HTML content of the page after rendering.
@@ -82,6 +100,8 @@ class PlaywrightClient:
         page = await browser.new_page()
 
         try:
+            if html_only:
+                await page.route("**/*", _abort_non_document_resources)
             await page.goto(url, wait_until=wait_until, timeout=timeout)
             html = await page.content()
             return html
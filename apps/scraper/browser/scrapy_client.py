@@ -8,14 +8,42 @@ rules, and the ability to follow links for deeper data collection.
 """
 
 import logging
-from typing import Any, Callable, Dict, List, Optional
+import threading
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
 
 import scrapy
-from scrapy.crawler import CrawlerProcess
+from scrapy.crawler import CrawlerRunner
 from scrapy.http import Response
 
 logger = logging.getLogger(__name__)
 
+# A Twisted reactor can only be started once per process, so every crawl is
+# scheduled onto one long-lived reactor running in a daemon thread.
+_reactor_lock = threading.Lock()
+_reactor_thread: Optional[threading.Thread] = None
+
+
+def _get_reactor():
+    """
+    Returns the process-wide Twisted reactor, starting its thread on first use.
+
+    Returns:
+        twisted.internet.reactor: The running reactor.
+    """
+    global _reactor_thread
+    from twisted.internet import reactor
+
+    with _reactor_lock:
+        if _reactor_thread is None or not _reactor_thread.is_alive():
+            _reactor_thread = threading.Thread(
+                target=reactor.run,
+                kwargs={"installSignalHandlers": False},
+                name="scrapy-reactor",
+                daemon=True,
+            )
+            _reactor_thread.start()
+    return reactor
+
 
 class VoyantSpider(scrapy.Spider):
     """
@@ -92,6 +120,7 @@ class ScrapyClient:
         concurrent_requests: int = 16,
         download_delay: float = 0.5,
         obey_robots: bool = True,
+        timeout: int = 60,
     ):
         """
         Initializes the ScrapyClient.
@@ -100,10 +129,12 @@ class ScrapyClient:
             concurrent_requests (int): The maximum number of concurrent requests Scrapy will perform.
             download_delay (float): The average number of seconds that the downloads should be delayed.
             obey_robots (bool): If True, Scrapy will respect robots.txt rules.
+            timeout (int): Timeout in seconds for fetching sitemap documents.
         """
         self.concurrent_requests = concurrent_requests
         self.download_delay = download_delay
         self.obey_robots = obey_robots
+        self.timeout = timeout
         self.results: List[Dict[str, Any]] = []
 
     def fetch(self, url: str) -> str:
@@ -129,8 +160,9 @@ class ScrapyClient:
         """
         Crawls a list of URLs and, optionally, follows links found on those pages.
 
-        This method sets up and runs a Scrapy crawler process to fetch content
-        from the specified URLs.
+        The crawl is scheduled on the shared reactor thread and this call blocks
+        until it finishes, so it may be called repeatedly (and from several
+        threads at once) within one process.
 
         Args:
             urls (List[str]): A list of URLs to begin crawling.
@@ -142,11 +174,9 @@ class ScrapyClient:
             List[Dict[str, Any]]: A list of dictionaries, where each dictionary
                                   represents the scraped data for a URL.
         """
-        self.results = []  # Reset results for this crawl.
+        from twisted.internet.threads import blockingCallFromThread
 
-        def collect_result(result):
-            """Callback to collect results from the spider."""
-            self.results.append(result)
+        results: List[Dict[str, Any]] = []
 
         settings = {
             "CONCURRENT_REQUESTS": self.concurrent_requests,
@@ -156,19 +186,26 @@ class ScrapyClient:
                 max_depth if follow_links else 0
             ),  # 0 means no following links from start_urls
             "LOG_LEVEL": "WARNING",  # Suppress excessive Scrapy logging
+            # Run on whichever reactor the shared thread already started.
+            "TWISTED_REACTOR": None,
         }
 
-        process = CrawlerProcess(settings)
-        spider = VoyantSpider(urls=urls, callback=collect_result)
-        process.crawl(spider)
-        process.start()  # This is blocking until the crawl finishes.
+        reactor = _get_reactor()
+        runner = CrawlerRunner(settings)
+        blockingCallFromThread(
+            reactor, runner.crawl, VoyantSpider, urls=urls, callback=results.append
+        )
 
-        return self.results
+        self.results = results
+        return results
 
     def crawl_sitemap(self, sitemap_url: str) -> List[Dict[str, Any]]:
         """
         Crawls all URLs listed in a sitemap XML file.
 
+        The sitemap is streamed and parsed incrementally, so memory use stays
+        proportional to the URL list rather than to a full XML DOM.
+
         Args:
             sitemap_url (str): The URL to the sitemap.xml file.
 
@@ -177,24 +214,56 @@ class ScrapyClient:
                                   represents the scraped data for a URL found in the sitemap.
 
         Raises:
-            requests.exceptions.RequestException: If fetching the sitemap fails.
-            Exception: If XML parsing of the sitemap fails.
+            httpx.HTTPError: If fetching the sitemap fails.
+            lxml.etree.XMLSyntaxError: If XML parsing of the sitemap fails.
         """
-        # Parse sitemap and extract URLs
-        # Note: This uses requests and BeautifulSoup directly, separate from Scrapy's core.
-        import requests
-        from bs4 import BeautifulSoup
+        import httpx
 
         try:
-            response = requests.get(sitemap_url, timeout=self.timeout)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, "lxml-xml")
-            urls = [loc.text for loc in soup.find_all("loc")]
-            logger.info(f"Discovered {len(urls)} URLs from sitemap: {sitemap_url}.")
-            return self.crawl(urls)
-        except requests.exceptions.RequestException as e:
+            with httpx.stream(
+                "GET", sitemap_url, timeout=self.timeout, follow_redirects=True
+            ) as response:
+                response.raise_for_status()
+                urls = list(iter_sitemap_locs(response.iter_bytes()))
+        except httpx.HTTPError as e:
             logger.error(f"Failed to fetch sitemap from {sitemap_url}: {e}")
             raise
         except Exception as e:
             logger.error(f"Failed to parse sitemap from {sitemap_url}: {e}")
             raise
+
+        logger.info(f"Discovered {len(urls)} URLs from sitemap: {sitemap_url}.")
+        return self.crawl(urls)
+
+
+def iter_sitemap_locs(chunks: Iterable[bytes]) -> Iterator[str]:
+    """
+    Incrementally yields the text of every `<loc>` element in a sitemap.
+
+    Works for both `<urlset>` and `<sitemapindex>` documents, with or without
+    the sitemaps.org namespace. Parsed elements are cleared as soon as they are
+    read, and entity resolution and network access are disabled.
+
+    Args:
+        chunks (Iterable[bytes]): Raw sitemap bytes, e.g. `response.iter_bytes()`.
+
+    Yields:
+        str: Each non-empty `<loc>` value, stripped of surrounding whitespace.
+    """
+    from lxml import etree
+
+    parser = etree.XMLPullParser(
+        events=("end",), resolve_entities=False, no_network=True
+    )
+
+    def _drain() -> Iterator[str]:
+        for _, element in parser.read_events():
+            if etree.QName(element).localname == "loc" and element.text:
+                yield element.text.strip()
+            element.clear()
+
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from _drain()
+    parser.close()
+    yield from _drain()
@@ -7,14 +7,197 @@ performing form filling, or handling scenarios where
 JavaScript execution and full browser simulation are required.
 """
 
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
 from selenium import webdriver
+from selenium.common.exceptions import NoSuchElementException
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
+logger = logging.getLogger(__name__)
+
+# Chrome content settings that block non-DOM resources (2 = block).
+_BLOCK_RESOURCE_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.managed_default_content_settings.stylesheets": 2,
+    "profile.managed_default_content_settings.fonts": 2,
+}
+
+# Action types `perform_actions(batch_actions=True)` runs in-page via
+# `_RUN_ACTIONS_JS` instead of one WebDriver call each.
+_BATCHABLE_ACTIONS = frozenset({"click", "fill", "scroll"})
+
+# Runs a batch of actions in one `execute_script` round trip. Returns null when
+# every action ran, or {index, error} for a missing element, or {index, slow}
+# for a fill that needs WebDriver key events (file inputs, contenteditable).
+_RUN_ACTIONS_JS = """
+const actions = arguments[0];
+for (let i = 0; i < actions.length; i++) {
+    const a = actions[i];
+    if (a.type === "scroll") {
+        window.scrollTo(0, document.body.scrollHeight);
+        continue;
+    }
+    const el = document.querySelector(a.selector);
+    if (!el) {
+        return {index: i, error: "no such element: " + a.selector};
+    }
+    if (a.type === "click") {
+        el.click();
+    } else if (a.type === "fill") {
+        if (el.type === "file" || !("value" in el) || el.isContentEditable) {
+            return {index: i, slow: true};
+        }
+        // Native setter so framework-controlled inputs (React, Vue) see the change.
+        const desc = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), "value");
+        if (desc && desc.set) {
+            desc.set.call(el, a.value);
+        } else {
+            el.value = a.value;
+        }
+        el.dispatchEvent(new Event("input", {bubbles: true}));
+        el.dispatchEvent(new Event("change", {bubbles: true}));
+    }
+}
+return null;
+"""
+
+
+def _quit_quietly(driver: webdriver.Chrome) -> None:
+    """Quits a driver, logging instead of raising on failure."""
+    try:
+        driver.quit()
+    except Exception as e:
+        logger.warning(f"Failed to quit WebDriver: {e}")
+
+
+class _DriverPool:
+    """
+    A bounded pool of Chrome WebDriver instances shared by worker threads.
+
+    Drivers are created lazily up to `size`, handed out through a queue, and
+    returned after each use. A driver that raised during a fetch is discarded
+    and its slot freed, so one crashed browser does not poison the pool. With
+    `max_pages`, a driver that has served that many pages is retired the same
+    way, bounding each browser's memory growth.
+    """
+
+    def __init__(self, options: Options, size: int, max_pages: Optional[int] = None):
+        """
+        Initializes the pool.
+
+        Args:
+            options (Options): Chrome options used for every driver in the pool.
+            size (int): Maximum number of concurrent driver instances.
+            max_pages (Optional[int]): Pages a driver serves before it is replaced.
+        """
+        self._options = options
+        self.size = size
+        self.max_pages = max_pages
+        self._idle: "queue.Queue[webdriver.Chrome]" = queue.Queue()
+        self._created = 0
+        self._pages: Dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self) -> webdriver.Chrome:
+        """
+        Borrows a driver, creating one if the pool has not reached its size.
+
+        Blocks while all `size` drivers are in use, until one is released or
+        a discarded driver frees its slot.
+        """
+        while True:
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                pass
+            with self._lock:
+                can_create = self._created < self.size
+                if can_create:
+                    self._created += 1
+            if can_create:
+                try:
+                    return webdriver.Chrome(options=self._options)
+                except Exception:
+                    with self._lock:
+                        self._created -= 1
+                    raise
+            try:
+                return self._idle.get(timeout=0.5)
+            except queue.Empty:
+                continue
+
+    def release(self, driver: webdriver.Chrome) -> None:
+        """
+        Returns a healthy driver to the pool, or retires it past `max_pages`.
+
+        A retired driver's slot is freed at once and it quits in the background,
+        so the next `acquire` starts a fresh browser without waiting on it. A
+        driver beyond a `resize`d cap quits instead of going back to the pool.
+        """
+        with self._lock:
+            surplus = self._created > self.size
+        if surplus:
+            self.discard(driver)
+            return
+        if self.max_pages:
+            with self._lock:
+                served = self._pages.get(id(driver), 0) + 1
+                retire = served >= self.max_pages
+                if retire:
+                    self._pages.pop(id(driver), None)
+                    self._created -= 1
+                else:
+                    self._pages[id(driver)] = served
+            if retire:
+                threading.Thread(
+                    target=_quit_quietly, args=(driver,), daemon=True
+                ).start()
+                return
+        self._idle.put(driver)
+
+    def discard(self, driver: webdriver.Chrome) -> None:
+        """Quits a broken driver and frees its slot for a fresh one."""
+        _quit_quietly(driver)
+        with self._lock:
+            self._pages.pop(id(driver), None)
+            self._created -= 1
+
+    def resize(self, size: int) -> None:
+        """
+        Changes the pool's cap.
+
+        Growing takes effect on the next `acquire`. When shrinking, idle
+        drivers above the new cap quit now and busy ones on `release`.
+        """
+        with self._lock:
+            self.size = size
+        while True:
+            with self._lock:
+                if self._created <= self.size:
+                    return
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            self.discard(driver)
+
+    def close(self) -> None:
+        """Quits every idle driver in the pool."""
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self.discard(driver)
+
 
 class SeleniumClient:
     """
@@ -30,26 +213,46 @@ class SeleniumClient:
     as they launch and control a full browser instance.
     """
 
-    def __init__(self, headless: bool = True, proxy: Optional[str] = None):
+    def __init__(
+        self,
+        headless: bool = True,
+        proxy: Optional[str] = None,
+        include_resources: bool = False,
+        max_pages_per_driver: Optional[int] = None,
+    ):
         """
         Initializes the SeleniumClient.
 
         Args:
             headless (bool): If True, the browser runs in headless mode (without a UI).
             proxy (Optional[str]): A proxy server address (e.g., "http://proxy.internal:8080") for network requests.
+            include_resources (bool): If False (default), images, stylesheets and fonts
+                                      are not loaded and navigation returns once the DOM
+                                      is ready. Set True when rendered visuals are needed
+                                      (e.g. OCR of screenshots).
+            max_pages_per_driver (Optional[int]): If set, a browser is replaced after
+                                      serving this many pages, since Chrome's memory
+                                      only grows over long runs. Disabled by default.
         """
         self.headless = headless
         self.proxy = proxy
+        self.include_resources = include_resources
+        self.max_pages_per_driver = max_pages_per_driver
         self._driver: Optional[webdriver.Chrome] = None
+        self._options: Optional[Options] = None
+        self._pool: Optional[_DriverPool] = None
+        self._pages_served = 0
+        self._standby: Optional[webdriver.Chrome] = None
+        self._spawner: Optional[threading.Thread] = None
 
-    def _get_driver(self) -> webdriver.Chrome:
+    def _get_options(self) -> Options:
         """
-        Lazily gets or creates a Selenium Chrome WebDriver instance.
+        Builds the Chrome options once and reuses them for every driver.
 
         Returns:
-            selenium.webdriver.Chrome: The Chrome WebDriver instance.
+            selenium.webdriver.chrome.options.Options: The shared Chrome options.
         """
-        if self._driver is None:
+        if self._options is None:
             options = Options()
             if self.headless:
                 options.add_argument("--headless")
@@ -61,9 +264,76 @@ class SeleniumClient:
             if self.proxy:
                 options.add_argument(f"--proxy-server={self.proxy}")
 
-            self._driver = webdriver.Chrome(options=options)
+            if not self.include_resources:
+                # Scraping needs the DOM, not pixels: skip image/CSS/font bytes and
+                # return from get() at DOMContentLoaded instead of the load event.
+                options.add_experimental_option("prefs", _BLOCK_RESOURCE_PREFS)
+                options.page_load_strategy = "eager"
+
+            self._options = options
+        return self._options
+
+    def _get_driver(self) -> webdriver.Chrome:
+        """
+        Lazily gets or creates a Selenium Chrome WebDriver instance.
+
+        When a replacement browser started by `_page_served` is ready, it is
+        swapped in here, between pages, and the old one quits in the background.
+
+        Returns:
+            selenium.webdriver.Chrome: The Chrome WebDriver instance.
+        """
+        if self._standby is not None:
+            old, self._driver, self._standby = self._driver, self._standby, None
+            self._pages_served = 0
+            self._spawner = None
+            if old is not None:
+                threading.Thread(target=_quit_quietly, args=(old,), daemon=True).start()
+        if self._driver is None:
+            self._driver = webdriver.Chrome(options=self._get_options())
         return self._driver
 
+    def _page_served(self) -> None:
+        """
+        Counts a page on the single driver and prepares its replacement.
+
+        Past `max_pages_per_driver`, a new browser is started on a background
+        thread while the current one keeps serving; `_get_driver` swaps it in
+        once it is up, so rotation adds no startup latency to any page.
+        """
+        if not self.max_pages_per_driver:
+            return
+        self._pages_served += 1
+        if self._pages_served >= self.max_pages_per_driver and self._spawner is None:
+            self._spawner = threading.Thread(
+                target=self._spawn_standby, name="selenium-standby", daemon=True
+            )
+            self._spawner.start()
+
+    def _spawn_standby(self) -> None:
+        """Starts the replacement driver; on failure, the next page retries."""
+        try:
+            self._standby = webdriver.Chrome(options=self._get_options())
+        except Exception as e:
+            logger.warning(f"Could not start replacement WebDriver: {e}")
+            self._spawner = None
+
+    @staticmethod
+    def _load(
+        driver: webdriver.Chrome, url: str, wait_for: Optional[str], timeout: int
+    ) -> str:
+        """
+        Internal method: Navigates `driver` to `url` and returns the rendered HTML.
+        """
+        driver.get(url)
+
+        if wait_for:
+            WebDriverWait(driver, timeout).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, wait_for))
+            )
+
+        return driver.page_source
+
     def fetch_page(
         self, url: str, wait_for: Optional[str] = None, timeout: int = 30
     ) -> str:
@@ -85,15 +355,69 @@ class SeleniumClient:
                                                          is not found within the timeout.
             selenium.common.exceptions.WebDriverException: For other WebDriver-related errors.
         """
-        driver = self._get_driver()
-        driver.get(url)
+        html = self._load(self._get_driver(), url, wait_for, timeout)
+        self._page_served()
+        return html
 
-        if wait_for:
-            WebDriverWait(driver, timeout).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, wait_for))
+    def fetch_many(
+        self,
+        urls: List[str],
+        concurrency: int = 4,
+        wait_for: Optional[str] = None,
+        timeout: int = 30,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetches several URLs concurrently using a pool of WebDriver instances.
+
+        Up to `concurrency` browsers load pages at the same time, so a slow page
+        only occupies one driver instead of delaying the whole batch. Drivers
+        stay in the pool between calls until `close()` is called.
+
+        Args:
+            urls (List[str]): The URLs to fetch.
+            concurrency (int): Maximum number of browsers used in parallel. Pooled
+                               drivers are reused across calls; a different value
+                               resizes the pool.
+            wait_for (Optional[str]): An optional CSS selector to wait for on each page.
+            timeout (int): Page-load and `wait_for` timeout in seconds, per page.
+
+        Returns:
+            List[Dict[str, Any]]: One entry per input URL, in input order, with
+                                  either `{"url", "html"}` or `{"url", "error"}`.
+        """
+        if not urls:
+            return []
+
+        size = max(1, concurrency)
+        if self._pool is None:
+            self._pool = _DriverPool(
+                self._get_options(), size=size, max_pages=self.max_pages_per_driver
             )
+        elif self._pool.size != size:
+            self._pool.resize(size)
+        pool = self._pool
 
-        return driver.page_source
+        def _fetch_one(url: str) -> Dict[str, Any]:
+            try:
+                driver = pool.acquire()
+            except Exception as e:
+                logger.error(f"Could not start WebDriver for {url}: {e}")
+                return {"url": url, "error": str(e)}
+            try:
+                driver.set_page_load_timeout(timeout)
+                html = self._load(driver, url, wait_for, timeout)
+            except Exception as e:
+                logger.warning(f"Selenium fetch failed for {url}: {e}")
+                pool.discard(driver)
+                return {"url": url, "error": str(e)}
+            pool.release(driver)
+            return {"url": url, "html": html}
+
+        with ThreadPoolExecutor(
+            max_workers=min(pool.size, len(urls)),
+            thread_name_prefix="selenium-fetch",
+        ) as executor:
+            return list(executor.map(_fetch_one, urls))
 
     def perform_actions(
         self,
@@ -101,6 +425,7 @@ class SeleniumClient:
         actions: List[Dict[str, Any]],
         wait_for: Optional[str] = None,
         timeout: int = 30,
+        batch_actions: bool = False,
     ) -> str:
         """
         Fetches a page and performs a sequence of browser actions.
@@ -118,6 +443,13 @@ class SeleniumClient:
             wait_for (Optional[str]): An optional CSS selector to wait for after
                                        initial page load and before performing actions.
             timeout (int): The maximum number of seconds to wait for elements or actions.
+            batch_actions (bool): If True, consecutive click/fill/scroll actions run
+                                  in-page in a single `execute_script` call. Clicks
+                                  are then DOM `click()` calls and fills set the value
+                                  and fire input/change, without WebDriver's
+                                  interactability checks or key events; a `wait`
+                                  splits the batch and must follow a click that
+                                  navigates. Off by default.
 
         Returns:
             str: The HTML content of the page after all actions have been performed.
@@ -133,36 +465,104 @@ class SeleniumClient:
                 EC.presence_of_element_located((By.CSS_SELECTOR, wait_for))
             )
 
+        batch: List[Dict[str, Any]] = []
         for action in actions:
             action_type = action.get("type")
             selector = action.get("selector")
 
-            if action_type == "click" and selector:
-                element = driver.find_element(By.CSS_SELECTOR, selector)
-                element.click()
-            elif action_type == "fill" and selector:
-                element = driver.find_element(By.CSS_SELECTOR, selector)
-                element.clear()
-                element.send_keys(action.get("value", ""))
-            elif action_type == "scroll":
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight)")
+            if action_type in _BATCHABLE_ACTIONS and (
+                selector or action_type == "scroll"
+            ):
+                step = {
+                    "type": action_type,
+                    "selector": selector,
+                    "value": action.get("value", ""),
+                }
+                if batch_actions:
+                    batch.append(step)
+                else:
+                    self._run_action(driver, step)
             elif action_type == "wait":
-                import time  # Importing here to avoid circular dependencies if time isn't used elsewhere.
-
+                self._run_action_batch(driver, batch)
+                batch = []
                 time.sleep(
                     action.get("timeout", 1000) / 1000
                 )  # Timeout is in milliseconds, sleep in seconds.
             else:
                 pass  # Log a warning for unknown action types if needed.
 
-        return driver.page_source
+        self._run_action_batch(driver, batch)
+
+        html = driver.page_source
+        self._page_served()
+        return html
+
+    @staticmethod
+    def _run_action(driver: webdriver.Chrome, action: Dict[str, Any]) -> None:
+        """
+        Internal method: Runs one click/fill/scroll action through WebDriver.
+
+        Raises:
+            selenium.common.exceptions.NoSuchElementException: If the selector
+                matches nothing.
+        """
+        if action["type"] == "scroll":
+            driver.execute_script("window.scrollTo(0, document.body.scrollHeight)")
+            return
+        element = driver.find_element(By.CSS_SELECTOR, action["selector"])
+        if action["type"] == "click":
+            element.click()
+        else:
+            element.clear()
+            element.send_keys(action["value"])
+
+    @staticmethod
+    def _run_action_batch(
+        driver: webdriver.Chrome, batch: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Internal method: Runs consecutive click/fill/scroll actions in one round trip.
+
+        The batch is executed in-page by `_RUN_ACTIONS_JS`. Fills that need
+        real key events (file inputs, contenteditable elements) fall back to
+        WebDriver `send_keys`, after which the rest of the batch resumes in-page.
+
+        Raises:
+            selenium.common.exceptions.NoSuchElementException: If a selector
+                matches nothing, as `find_element` would.
+        """
+        while batch:
+            outcome = driver.execute_script(_RUN_ACTIONS_JS, batch)
+            if not outcome:
+                return
+
+            index = outcome["index"]
+            if "error" in outcome:
+                raise NoSuchElementException(outcome["error"])
+
+            action = batch[index]
+            element = driver.find_element(By.CSS_SELECTOR, action["selector"])
+            element.send_keys(action["value"])
+            batch = batch[index + 1 :]
 
     def close(self):
         """
-        Closes the underlying Selenium WebDriver instance and releases browser resources.
+        Closes the underlying Selenium WebDriver instances and releases browser resources.
 
-        This should be called to clean up resources when the client is no longer needed.
+        This quits the single driver used by `fetch_page`/`perform_actions` and
+        every pooled driver used by `fetch_many`. It should be called to clean up
+        resources when the client is no longer needed.
         """
+        if self._spawner is not None:
+            self._spawner.join()
+            self._spawner = None
+        if self._standby is not None:
+            _quit_quietly(self._standby)
+            self._standby = None
         if self._driver:
             self._driver.quit()
             self._driver = None
+        self._pages_served = 0
+        if self._pool:
+            self._pool.close()
+            self._pool = None
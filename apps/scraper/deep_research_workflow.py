@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from datetime import timedelta
 
@@ -33,18 +34,30 @@ class DeepResearchWorkflow:
         # STEP 1: Search Node (Yields mathematical list of URLs)
         start_to_close_timeout = timedelta(minutes=2)
 
+        # The topic plus any follow-up queries the agent supplied, searched as
+        # one batch over a shared client; URLs are merged in query order.
+        queries = [topic, *params.get("queries", [])]
         search_params = {
-            "query": topic,
+            "queries": queries,
             "max_results": max_urls,
             "tenant_id": tenant_id,
         }
 
-        url_collection = await workflow.execute_activity(
-            SearchActivities.execute_searxng_query,
+        query_results = await workflow.execute_activity(
+            SearchActivities.execute_searxng_queries,
             search_params,
             start_to_close_timeout=start_to_close_timeout,
         )
 
+        seen_urls = set()
+        url_collection = []
+        for results in query_results:
+            for item in results:
+                url = item.get("url")
+                if url and url not in seen_urls and len(url_collection) < max_urls:
+                    seen_urls.add(url)
+                    url_collection.append(item)
+
         if not url_collection:
             return {
                 "status": "failed",
@@ -81,7 +94,7 @@ class DeepResearchWorkflow:
                 scrape_futures.append(future)
 
         # Await all chunks in parallel completely autonomously
-        all_chunked_html = await workflow.wait_all(scrape_futures)
+        all_chunked_html = await asyncio.gather(*scrape_futures)
 
         workflow.logger.info(
             f"[DEEP_RESEARCH] Extracted {len(all_chunked_html)} autonomous dumps for {tenant_id}."
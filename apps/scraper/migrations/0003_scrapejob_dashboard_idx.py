@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-17 06:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        (
+            "scraper",
+            "0002_rename_voyant_scra_tenant__e7c5e0_idx_voyant_scra_tenant__759caa_idx_and_more",
+        ),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="scrapejob",
+            index=models.Index(
+                fields=["tenant_id", "status", "-created_at"],
+                include=("pages_fetched", "bytes_processed"),
+                name="sj_dashboard_idx",
+            ),
+        ),
+    ]
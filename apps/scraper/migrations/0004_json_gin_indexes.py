@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-17 06:22
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("scraper", "0003_scrapejob_dashboard_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="scrapeartifact",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["metadata"],
+                name="sa_metadata_gin",
+                opclasses=["jsonb_path_ops"],
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="scrapejob",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["options"], name="sj_options_gin", opclasses=["jsonb_path_ops"]
+            ),
+        ),
+    ]
@@ -8,8 +8,11 @@ ScrapeArtifact: Artifact produced by scraping
 """
 
 import uuid
+from typing import Any, Dict, Iterable, List
 
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
+from django.db.models import F
 
 
 class ScrapeJob(models.Model):
@@ -18,6 +21,9 @@ class ScrapeJob(models.Model):
 
     Pure execution model - Agent provides all parameters.
     NO LLM integration.
+
+    Progress counters are bumped with `increment_progress`, a single UPDATE
+    using F() expressions; do not read-modify-save them.
     """
 
     class Status(models.TextChoices):
@@ -65,19 +71,51 @@ class ScrapeJob(models.Model):
         indexes = [
             models.Index(fields=["tenant_id", "status"]),
             models.Index(fields=["created_at"]),
+            # Covering index for per-tenant job listings filtered by status and
+            # ordered newest-first: served as an index-only scan with no sort.
+            models.Index(
+                fields=["tenant_id", "status", "-created_at"],
+                include=["pages_fetched", "bytes_processed"],
+                name="sj_dashboard_idx",
+            ),
+            # jsonb_path_ops: smaller index serving `options__contains={...}` (@>).
+            GinIndex(
+                fields=["options"], name="sj_options_gin", opclasses=["jsonb_path_ops"]
+            ),
         ]
 
     def __str__(self):
         return f"ScrapeJob({self.job_id}) - {self.status}"
 
+    def increment_progress(
+        self, pages: int = 0, bytes_: int = 0, artifacts: int = 0, errors: int = 0
+    ) -> None:
+        """
+        Atomically add to the progress counters in one UPDATE.
+
+        Only the primary key is needed, so `ScrapeJob(job_id=...)` works without
+        loading the row. In-memory counters on this instance are not refreshed.
+        """
+        ScrapeJob.objects.filter(pk=self.pk).update(
+            pages_fetched=F("pages_fetched") + pages,
+            bytes_processed=F("bytes_processed") + bytes_,
+            artifact_count=F("artifact_count") + artifacts,
+            error_count=F("error_count") + errors,
+        )
+
 
 class ScrapeArtifact(models.Model):
     """
     Artifact produced by scraping job.
 
     Stores raw data extracted by pure execution tools.
+
+    Jobs produce many artifacts; write them with `bulk_record` (batched
+    INSERTs) rather than one `.save()` per row.
     """
 
+    BULK_BATCH_SIZE = 500
+
     class ArtifactType(models.TextChoices):
         HTML = "html", "HTML"
         JSON = "json", "JSON"
@@ -106,6 +144,32 @@ class ScrapeArtifact(models.Model):
     class Meta:
         db_table = "voyant_scrape_artifact"
         ordering = ["-created_at"]
+        indexes = [
+            # jsonb_path_ops: smaller index serving `metadata__contains={...}` (@>).
+            GinIndex(
+                fields=["metadata"], name="sa_metadata_gin", opclasses=["jsonb_path_ops"]
+            ),
+        ]
 
     def __str__(self):
         return f"ScrapeArtifact({self.artifact_id}) - {self.artifact_type}"
+
+    @classmethod
+    def bulk_record(
+        cls, job_id: Any, records: Iterable[Dict[str, Any]]
+    ) -> List["ScrapeArtifact"]:
+        """
+        Insert artifacts for a job in batches of `BULK_BATCH_SIZE`.
+
+        Artifact IDs are derived from content hashes, so rows that already
+        exist (e.g. on activity retry) are skipped rather than duplicated.
+
+        Args:
+            job_id: Parent ScrapeJob primary key.
+            records: Field dicts for each artifact (artifact_id, artifact_type,
+                format, storage_path, ...).
+        """
+        artifacts = [cls(job_id=job_id, **record) for record in records]
+        return cls.objects.bulk_create(
+            artifacts, batch_size=cls.BULK_BATCH_SIZE, ignore_conflicts=True
+        )
@@ -8,13 +8,141 @@ XPath selectors. It leverages `lxml` for high-performance parsing and
 """
 
 import logging
-from typing import Any, Dict, List, Union
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Union
 
+from lxml import etree
 from lxml import html as lxml_html
 from lxml.cssselect import CSSSelector
 
 logger = logging.getLogger(__name__)
 
+# Raw HTML or a tree already produced by `HTMLParser.parse`.
+HTMLSource = Union[str, lxml_html.HtmlElement]
+
+# Attributes kept by `condense_html` (plus any `aria-*`): what selectors target.
+_CONDENSE_KEEP_ATTRS = frozenset({"id", "class", "role", "href"})
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=1024)
+def compiled_css(selector: str) -> CSSSelector:
+    """
+    Returns a compiled CSS selector, reusing it across calls.
+
+    Agents apply the same handful of selectors to many pages, so compiling the
+    CSS grammar into XPath once per distinct selector string removes that cost
+    from every extraction. Selectors are plain strings, hence hashable.
+
+    Args:
+        selector (str): A CSS selector without pseudo-element suffix.
+
+    Returns:
+        lxml.cssselect.CSSSelector: A callable that returns matching elements.
+
+    Raises:
+        cssselect.SelectorError: If the selector is invalid (not cached).
+    """
+    return CSSSelector(selector)
+
+
+@lru_cache(maxsize=1024)
+def compiled_xpath(expression: str) -> etree.XPath:
+    """
+    Returns a compiled XPath expression, reusing it across calls.
+
+    Args:
+        expression (str): An XPath expression.
+
+    Returns:
+        lxml.etree.XPath: A callable evaluated against an element or tree.
+
+    Raises:
+        lxml.etree.XPathSyntaxError: If the expression is invalid (not cached).
+    """
+    return etree.XPath(expression)
+
+
+def _selector_error(selector: Any) -> Optional[str]:
+    """Returns why a single selector string cannot be compiled, or None."""
+    if not isinstance(selector, str) or not selector:
+        return "selector must be a non-empty string"
+    try:
+        if selector.startswith("//"):
+            compiled_xpath(selector)
+        else:
+            compiled_css(selector.rsplit("::", 1)[0])
+    except Exception as e:
+        return str(e) or type(e).__name__
+    return None
+
+
+def validate_selectors(selectors: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Checks an agent-provided selector map before any page is fetched.
+
+    Every selector is compiled (and thereby cached) up front so that a
+    malformed map is rejected as a whole, with every problem listed, instead
+    of surfacing as silently empty fields after a full scrape. Nested
+    `{"root": ..., "fields": {...}}` entries are checked field by field.
+
+    Args:
+        selectors (Dict[str, Any]): Same selector map accepted by
+            `HTMLParser.extract`.
+
+    Returns:
+        Dict[str, str]: Error message per invalid field (`field` or
+        `field.sub_field` for nested entries); empty when the map is valid.
+    """
+    errors: Dict[str, str] = {}
+    for field, selector in selectors.items():
+        if isinstance(selector, dict):
+            fields_map = selector.get("fields")
+            if not isinstance(fields_map, dict):
+                errors[f"{field}.fields"] = "nested selector needs a 'fields' map"
+                fields_map = {}
+            nested = {"root": selector.get("root"), **fields_map}
+            for sub_field, sub_selector in nested.items():
+                error = _selector_error(sub_selector)
+                if error:
+                    errors[f"{field}.{sub_field}"] = error
+        else:
+            error = _selector_error(selector)
+            if error:
+                errors[field] = error
+    return errors
+
+
+def condense_html(raw_html: str, max_length: Optional[int] = None) -> str:
+    """
+    Shrinks HTML to the structure an agent needs to write selectors.
+
+    Drops `<script>`, `<style>`, `<noscript>` and comments, keeps only the
+    `id`, `class`, `role`, `href` and `aria-*` attributes, and collapses
+    whitespace. On typical SPA pages most bytes sit in `<head>` and inline
+    scripts, so truncating the condensed markup keeps far more of the body
+    than cutting the raw HTML at the same length.
+
+    Args:
+        raw_html (str): The raw HTML content as a string.
+        max_length (Optional[int]): Truncate the result to this many characters.
+
+    Returns:
+        str: The condensed HTML.
+    """
+    tree = lxml_html.fromstring(raw_html)
+    etree.strip_elements(
+        tree, "script", "style", "noscript", etree.Comment, with_tail=False
+    )
+    for el in tree.iter(etree.Element):
+        for attr in list(el.attrib):
+            if attr not in _CONDENSE_KEEP_ATTRS and not attr.startswith("aria-"):
+                del el.attrib[attr]
+
+    condensed = _WHITESPACE.sub(" ", lxml_html.tostring(tree, encoding="unicode"))
+    return condensed[:max_length] if max_length else condensed
+
 
 class HTMLParser:
     """
@@ -52,11 +180,46 @@ class HTMLParser:
                             Missing or failed extractions will result in `None` values.
         """
         try:
-            tree = lxml_html.fromstring(raw_html)
+            tree = self.parse(raw_html)
         except Exception as e:
             logger.error(f"HTML parsing failed: {e}")
             return {"error": str(e)}
 
+        return self.extract_tree(tree, selectors)
+
+    @staticmethod
+    def parse(raw_html: str) -> lxml_html.HtmlElement:
+        """
+        Parses raw HTML into an lxml element tree.
+
+        Callers that run several extractions over the same document (selectors,
+        links, images, media) should parse once here and pass the tree to
+        `extract_tree` and the `get_all_*` helpers instead of re-parsing.
+
+        Args:
+            raw_html (str): The raw HTML content as a string.
+
+        Returns:
+            lxml.html.HtmlElement: The root element of the parsed document.
+
+        Raises:
+            lxml.etree.ParserError: If the document is empty or cannot be parsed.
+        """
+        return lxml_html.fromstring(raw_html)
+
+    def extract_tree(
+        self, tree: lxml_html.HtmlElement, selectors: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Extracts data from an already-parsed tree using a map of selectors.
+
+        Args:
+            tree (lxml.html.HtmlElement): A tree returned by `parse`.
+            selectors (Dict[str, Any]): Same selector map accepted by `extract`.
+
+        Returns:
+            Dict[str, Any]: The extracted data, keyed by field name.
+        """
         result = {}
 
         for field, selector in selectors.items():
@@ -85,8 +248,8 @@ class HTMLParser:
             Union[List[str], str, None]: A list of extracted strings, a single string, or None if not found/error.
         """
         if selector.startswith("//"):
-            # XPath selector. lxml's xpath method returns a list.
-            return tree.xpath(selector)
+            # XPath selector. lxml's xpath evaluation returns a list.
+            return compiled_xpath(selector)(tree)
 
         elif "::" in selector:
             # CSS selector with pseudo-element (e.g., ::text, ::attr(href)).
@@ -113,8 +276,7 @@ class HTMLParser:
         pseudo = parts[1] if len(parts) > 1 else "text"
 
         try:
-            sel = CSSSelector(css)
-            elements = sel(tree)
+            elements = compiled_css(css)(tree)
         except Exception as e:
             logger.warning(f"Invalid CSS selector '{css}': {e}")
             return []
@@ -154,11 +316,10 @@ class HTMLParser:
 
         # Find all root elements that represent the repeating items.
         if root_selector.startswith("//"):
-            items = tree.xpath(root_selector)
+            items = compiled_xpath(root_selector)(tree)
         else:
             try:
-                sel = CSSSelector(root_selector)
-                items = sel(tree)
+                items = compiled_css(root_selector)(tree)
             except Exception as e:
                 logger.warning(
                     f"Invalid root selector '{root_selector}' for nested extraction: {e}"
@@ -182,41 +343,51 @@ class HTMLParser:
 
         return results
 
-    def get_all_links(self, raw_html: str) -> List[str]:
+    def get_all_links(self, raw_html: HTMLSource) -> List[str]:
         """
         Extracts all `href` attributes from `<a>` tags in the HTML.
 
         Args:
-            raw_html (str): The raw HTML content.
+            raw_html (Union[str, lxml.html.HtmlElement]): The raw HTML content,
+                or a tree returned by `parse` to avoid re-parsing.
 
         Returns:
             List[str]: A list of all link URLs found.
         """
-        tree = lxml_html.fromstring(raw_html)
-        return tree.xpath("//a/@href")
+        return compiled_xpath("//a/@href")(self._as_tree(raw_html))
 
-    def get_all_images(self, raw_html: str) -> List[str]:
+    def get_all_images(self, raw_html: HTMLSource) -> List[str]:
         """
         Extracts all `src` attributes from `<img>` tags in the HTML.
 
         Args:
-            raw_html (str): The raw HTML content.
+            raw_html (Union[str, lxml.html.HtmlElement]): The raw HTML content,
+                or a tree returned by `parse` to avoid re-parsing.
 
         Returns:
             List[str]: A list of all image source URLs found.
         """
-        tree = lxml_html.fromstring(raw_html)
-        return tree.xpath("//img/@src")
+        return compiled_xpath("//img/@src")(self._as_tree(raw_html))
 
-    def get_all_media(self, raw_html: str) -> List[str]:
+    def get_all_media(self, raw_html: HTMLSource) -> List[str]:
         """
         Extracts all `src` attributes from `<video>` and `<audio>` tags in the HTML.
 
         Args:
-            raw_html (str): The raw HTML content.
+            raw_html (Union[str, lxml.html.HtmlElement]): The raw HTML content,
+                or a tree returned by `parse` to avoid re-parsing.
 
         Returns:
             List[str]: A list of all media source URLs found.
         """
-        tree = lxml_html.fromstring(raw_html)
-        return tree.xpath("//video/source/@src | //audio/source/@src")
+        return compiled_xpath("//video/source/@src | //audio/source/@src")(
+            self._as_tree(raw_html)
+        )
+
+    def _as_tree(self, raw_html: HTMLSource) -> lxml_html.HtmlElement:
+        """
+        Internal method: Returns `raw_html` unchanged if already parsed, else parses it.
+        """
+        if isinstance(raw_html, str):
+            return self.parse(raw_html)
+        return raw_html
@@ -16,10 +16,157 @@ For future refactoring, these two modules should be consolidated.
 
 import io
 import logging
-from typing import Any, Dict, List, Union
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from itertools import repeat
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
+# Longest image side fed to Tesseract; larger inputs (e.g. 2x DPR screenshots)
+# are downscaled, since LSTM OCR time grows with pixel count.
+OCR_MAX_SIDE = 2000
+
+# Adaptive threshold window radius (31px block) and offset below the local mean.
+_THRESHOLD_RADIUS = 15
+_THRESHOLD_OFFSET = 10
+
+# Tesseract page segmentation modes used here (same numbering in tesserocr.PSM).
+PSM_AUTO = 3
+PSM_SINGLE_BLOCK = 6
+
+# Start method for the `batch_extract` pools. Forking the worker process would
+# copy locks held by its Temporal and activity threads into the children.
+_POOL_START_METHOD = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+# Long-lived `batch_extract` pools keyed by worker count, so each call does not
+# pay process start-up and Tesseract engine loading again.
+_pools: Dict[int, ProcessPoolExecutor] = {}
+_pools_lock = threading.Lock()
+
+
+@lru_cache(maxsize=4)
+def _tesserocr_api(language: str, psm: int) -> Optional[Tuple[Any, threading.Lock]]:
+    """
+    Returns an in-process Tesseract engine and its lock, loaded once per process.
+
+    `tesserocr` binds libtesseract directly, so the language model is loaded
+    once instead of on every `pytesseract` subprocess spawn. An engine holds
+    per-image state, so calls on it are serialized by its own lock; engines
+    for other languages or modes run in parallel. Returns None when tesserocr
+    is not installed; callers then fall back to `pytesseract`.
+    """
+    try:
+        from tesserocr import OEM, PyTessBaseAPI  # type: ignore
+    except ImportError:
+        return None
+    return PyTessBaseAPI(lang=language, psm=psm, oem=OEM.LSTM_ONLY), threading.Lock()
+
+
+def image_to_text(image: Any, language: str, psm: int = PSM_AUTO) -> str:
+    """
+    Recognizes the text in an already prepared image.
+
+    Uses the cached tesserocr engine when available, otherwise one
+    `pytesseract` call.
+
+    Args:
+        image (PIL.Image.Image): The image, typically from `prepare_for_ocr`.
+        language (str): Tesseract language(s), e.g. "spa+eng".
+        psm (int): Tesseract page segmentation mode.
+
+    Returns:
+        str: The recognized text, stripped.
+    """
+    engine = _tesserocr_api(language, psm)
+    if engine is not None:
+        api, lock = engine
+        with lock:
+            api.SetImage(image)
+            return api.GetUTF8Text().strip()
+
+    import pytesseract
+
+    return pytesseract.image_to_string(
+        image, lang=language, config=f"--oem 1 --psm {psm}"
+    ).strip()
+
+
+def prepare_for_ocr(image: Any, max_side: int = OCR_MAX_SIDE) -> Any:
+    """
+    Converts an image to a downscaled binary image ready for Tesseract.
+
+    Grayscale, cap the longest side at `max_side`, then apply an adaptive mean
+    threshold: a pixel turns black when it is more than `_THRESHOLD_OFFSET`
+    darker than its 31x31 neighbourhood. Tesseract receives fewer pixels and
+    skips its own binarization pass; local thresholding also copes with the
+    uneven backgrounds common in web graphics.
+
+    Args:
+        image (PIL.Image.Image): The source image.
+        max_side (int): Maximum width/height in pixels after scaling.
+
+    Returns:
+        PIL.Image.Image: A mode "L" image containing only black and white.
+    """
+    from PIL import Image, ImageChops, ImageFilter
+
+    image = image.convert("L")
+    if max(image.size) > max_side:
+        image.thumbnail((max_side, max_side), Image.LANCZOS)
+
+    local_mean = image.filter(ImageFilter.BoxBlur(_THRESHOLD_RADIUS))
+    darker_by = ImageChops.subtract(local_mean, image)
+    return darker_by.point(lambda v: 0 if v > _THRESHOLD_OFFSET else 255)
+
+
+@lru_cache(maxsize=4)
+def _worker_processor(language: str) -> "OCRProcessor":
+    """One OCRProcessor per worker process, so its Tesseract engine is reused."""
+    return OCRProcessor(language)
+
+
+def _process_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Returns the shared process pool for `max_workers`, starting it once."""
+    with _pools_lock:
+        pool = _pools.get(max_workers)
+        if pool is None:
+            pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context(_POOL_START_METHOD),
+            )
+            _pools[max_workers] = pool
+        return pool
+
+
+def shutdown_ocr_pools() -> None:
+    """Shuts down the shared `batch_extract` pools; called when the worker stops."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _batch_worker(language: str, image_source: Union[bytes, str]) -> Dict[str, Any]:
+    """
+    Process-pool entry point for `OCRProcessor.batch_extract`.
+
+    Defined at module level so it can be pickled into worker processes; errors
+    are returned rather than raised so one bad image does not fail the batch.
+    """
+    try:
+        return _worker_processor(language).extract(image_source)
+    except Exception as e:
+        logger.error(f"Batch OCR failed for an image: {e}")
+        return {"error": str(e)}
+
 
 class OCRProcessor:
     """
@@ -38,8 +185,9 @@ class OCRProcessor:
                                       Defaults to "spa+eng" (Spanish and English).
         """
         self.language = language
-        # Tesseract configuration for LSTM engine mode and automatic page segmentation.
-        self.config = "--oem 3 --psm 3"
+        # Tesseract configuration: LSTM engine only and automatic page segmentation.
+        self.psm = PSM_AUTO
+        self.config = f"--oem 1 --psm {self.psm}"
 
     def extract(self, image_source: Union[bytes, str]) -> Dict[str, Any]:
         """
@@ -53,11 +201,10 @@ class OCRProcessor:
                             confidence score, the language used, and image dimensions.
 
         Raises:
-            ImportError: If `pytesseract` or `Pillow` are not installed.
+            ImportError: If `Pillow` or an OCR binding is not installed.
             TesseractError: If Tesseract encounters an error during OCR.
             Exception: For other errors during image loading or processing.
         """
-        import pytesseract
         from PIL import Image
 
         # Load image from bytes or file path.
@@ -69,13 +216,27 @@ class OCRProcessor:
         # Apply preprocessing steps to enhance OCR accuracy.
         image = self._preprocess(image)
 
-        # Extract text using Tesseract.
-        text = pytesseract.image_to_string(
-            image, lang=self.language, config=self.config
-        )
+        engine = _tesserocr_api(self.language, self.psm)
+        if engine is not None:
+            # In-process engine: one recognition pass serves text and confidence.
+            api, lock = engine
+            with lock:
+                api.SetImage(image)
+                text = api.GetUTF8Text()
+                confidence = round(max(api.MeanTextConf(), 0) / 100, 2)
+        else:
+            import pytesseract
 
-        # Calculate an average confidence score for the extraction.
-        confidence = self._get_confidence(image)
+            # A single Tesseract pass yields both the words and their confidences;
+            # the plain text is rebuilt from the same result.
+            data = pytesseract.image_to_data(
+                image,
+                lang=self.language,
+                config=self.config,
+                output_type=pytesseract.Output.DICT,
+            )
+            text = self._text_from_data(data)
+            confidence = self._confidence_from_data(data)
 
         return {
             "text": text.strip(),
@@ -146,64 +307,88 @@ class OCRProcessor:
             image (PIL.Image.Image): The Pillow Image object to preprocess.
 
         Returns:
-            PIL.Image.Image: The processed Pillow Image object.
+            PIL.Image.Image: The downscaled, binarized image (see `prepare_for_ocr`).
         """
-        from PIL import ImageEnhance, ImageFilter
+        return prepare_for_ocr(image)
 
-        # Convert to RGB mode if necessary for consistent processing.
-        if image.mode != "RGB":
-            image = image.convert("RGB")
-
-        # Enhance contrast to make text more distinct.
-        enhancer = ImageEnhance.Contrast(image)
-        image = enhancer.enhance(1.5)
+    @staticmethod
+    def _text_from_data(data: Dict[str, List[Any]]) -> str:
+        """
+        Internal method: Rebuilds plain text from Tesseract `image_to_data` output.
 
-        # Apply sharpening filter to improve character definition.
-        image = image.filter(ImageFilter.SHARPEN)
+        Words are joined with spaces within a line, lines with newlines and
+        paragraphs/blocks with a blank line, mirroring `image_to_string` layout.
 
-        return image
+        Args:
+            data (Dict[str, List[Any]]): The `pytesseract.Output.DICT` result.
 
-    def _get_confidence(self, image: Any) -> float:
+        Returns:
+            str: The recognized text.
         """
-        Internal method: Calculates the average confidence score of the OCR extraction.
+        lines: List[str] = []
+        current_line = None
+        current_par = None
+        for i, word in enumerate(data["text"]):
+            if not word or not word.strip():
+                continue
+            par = (data["block_num"][i], data["par_num"][i])
+            line = par + (data["line_num"][i],)
+            if line != current_line:
+                if current_par is not None and par != current_par:
+                    lines.append("")
+                lines.append(word)
+                current_line, current_par = line, par
+            else:
+                lines[-1] += " " + word
+        return "\n".join(lines).strip()
+
+    @staticmethod
+    def _confidence_from_data(data: Dict[str, List[Any]]) -> float:
+        """
+        Internal method: Averages word confidences from `image_to_data` output.
 
         Args:
-            image (PIL.Image.Image): The Pillow Image object from which text was extracted.
+            data (Dict[str, List[Any]]): The `pytesseract.Output.DICT` result.
 
         Returns:
-            float: The average confidence score (0.0 to 1.0), or 0.0 if calculation fails.
+            float: The average confidence score (0.0 to 1.0), or 0.0 if none.
         """
-        import pytesseract
-
-        try:
-            data = pytesseract.image_to_data(
-                image, lang=self.language, output_type=pytesseract.Output.DICT
-            )
-            # Filter out zero-confidence entries (often non-text regions).
-            confidences = [c for c in data["conf"] if c > 0]
-            if confidences:
-                return round(sum(confidences) / len(confidences) / 100, 2)
-        except Exception as e:
-            logger.warning(f"Confidence calculation failed: {e}")
-
+        # Filter out zero-confidence entries (often non-text regions).
+        confidences = [float(c) for c in data["conf"] if float(c) > 0]
+        if confidences:
+            return round(sum(confidences) / len(confidences) / 100, 2)
         return 0.0
 
-    def batch_extract(self, images: List[Union[bytes, str]]) -> List[Dict[str, Any]]:
+    def batch_extract(
+        self, images: List[Union[bytes, str]], max_workers: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """
         Extracts text from a list of images in a batch.
 
+        OCR is CPU-bound and each image is independent, so batches of more than
+        one image are spread across a process pool, one Tesseract run per core.
+        The pool outlives the call and is reused by later batches.
+
         Args:
             images (List[Union[bytes, str]]): A list of image data as bytes or file paths.
+            max_workers (Optional[int]): Maximum worker processes. Defaults to
+                                         the number of CPUs.
 
         Returns:
-            List[Dict[str, Any]]: A list of extraction results, one dictionary per image.
-                                  Includes an "error" field if an image fails processing.
+            List[Dict[str, Any]]: A list of extraction results, one dictionary per image,
+                                  in input order. Includes an "error" field if an
+                                  image fails processing.
         """
-        results = []
-        for img_source in images:
-            try:
-                results.append(self.extract(img_source))
-            except Exception as e:
-                logger.error(f"Batch OCR failed for an image: {e}")
-                results.append({"error": str(e)})
-        return results
+        limit = max_workers or os.cpu_count() or 1
+        if min(limit, len(images)) <= 1:
+            return [_batch_worker(self.language, img) for img in images]
+
+        pool = _process_pool(limit)
+        try:
+            return list(pool.map(_batch_worker, repeat(self.language), images))
+        except BrokenProcessPool:
+            # A worker died (e.g. OOM-killed); start a fresh pool next time.
+            with _pools_lock:
+                if _pools.get(limit) is pool:
+                    del _pools[limit]
+            raise
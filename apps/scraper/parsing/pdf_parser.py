@@ -2,28 +2,38 @@
 Voyant Scraper - PDF Parser for Structured and Unstructured Data Extraction.
 
 This module provides functionalities for parsing PDF documents to extract
-text content, metadata, and structured tables. It intelligently leverages
-Apache Tika for comprehensive document analysis (especially for image-based
-or complex PDFs) and `pdfplumber` for precise native text and table extraction
-from machine-generated PDFs.
+text content, metadata, and structured tables. It extracts native text with
+`pdfplumber` first (milliseconds per page on machine-generated PDFs), runs
+Tesseract OCR only on pages without a text layer, and falls back to Apache
+Tika when the document yields no usable text at all.
 """
 
+import io
 import logging
-from typing import Any, Dict, List, Optional
+from typing import IO, Any, Dict, List, Optional, Union
 
 logger = logging.getLogger(__name__)
 
+# A file path, or an in-memory/seekable binary stream of the PDF.
+PDFSource = Union[str, IO[bytes]]
+
 
 class PDFParser:
     """
     A parser for extracting various forms of content from PDF documents.
 
-    This class offers a robust approach by combining the broad capabilities of
-    Apache Tika with the precision of `pdfplumber`, allowing for effective
-    processing of diverse PDF types.
+    This class offers a robust approach by combining the precision and speed of
+    `pdfplumber` with per-page OCR and the broad capabilities of Apache Tika,
+    allowing for effective processing of diverse PDF types.
     """
 
-    def __init__(self, tika_url: Optional[str] = None):
+    def __init__(
+        self,
+        tika_url: Optional[str] = None,
+        min_native_chars: int = 200,
+        min_page_chars: int = 20,
+        ocr_language: str = "spa+eng",
+    ):
         """
         Initializes the PDFParser.
 
@@ -31,54 +41,62 @@ class PDFParser:
             tika_url (Optional[str]): The URL of the Apache Tika server. If provided,
                                       the remote Tika server will be used for parsing.
                                       If None, the local Tika client (requiring Java) is used.
+            min_native_chars (int): Minimum characters of text (native plus per-page
+                                    OCR) for the document to skip the Tika fallback.
+            min_page_chars (int): Pages with fewer native characters than this are
+                                  treated as scanned and OCRed individually.
+            ocr_language (str): Tesseract language(s) for scanned pages.
         """
         self.tika_url = tika_url
+        self.min_native_chars = min_native_chars
+        self.min_page_chars = min_page_chars
+        self.ocr_language = ocr_language
 
-    def parse(self, pdf_path: str, extract_tables: bool = False) -> Dict[str, Any]:
+    def parse(
+        self, pdf_path: PDFSource, extract_tables: bool = False
+    ) -> Dict[str, Any]:
         """
         Parses a PDF file to extract its text content and metadata,
         with an option to extract tables.
 
-        This method attempts to use Apache Tika first for comprehensive extraction.
-        If Tika fails or is not configured, it falls back to `pdfplumber` for
-        native text extraction.
+        Native text is extracted with `pdfplumber` first; pages without a text
+        layer are OCRed one by one. Apache Tika is only used when the whole
+        document still yields fewer than `min_native_chars` characters.
 
         Args:
-            pdf_path (str): The file path to the PDF document.
+            pdf_path (Union[str, IO[bytes]]): The file path to the PDF document,
+                                              or a seekable binary stream.
             extract_tables (bool, optional): If True, also attempts to extract
                                            structured tables from the PDF. Defaults to False.
 
         Returns:
             Dict[str, Any]: A dictionary containing the extracted text, metadata,
-                            page count, and optionally extracted tables.
+                            page count, the 1-based numbers of OCRed pages, and
+                            optionally extracted tables.
 
         Raises:
             ImportError: If required Python packages (`tika` or `pdfplumber`) are not installed.
             Exception: For errors during PDF parsing by either engine.
         """
-        result = {
-            "text": "",
-            "metadata": {},
-            "pages": 0,
-        }
+        result = self._parse_with_pdfplumber(pdf_path)
 
-        # Attempt to parse using Apache Tika first for broader document support.
-        try:
-            tika_result = self._parse_with_tika(pdf_path)
-            result["text"] = tika_result.get("content", "").strip()
-            result["metadata"] = tika_result.get("metadata", {})
-            # Tika doesn't directly return page count from `from_file`, infer from metadata or pdfplumber fallback.
-            # For robustness, pages will be updated by pdfplumber if fallback occurs.
-            logger.info("PDF parsed successfully with Apache Tika.")
-        except Exception as e:
-            logger.warning(
-                f"Apache Tika parsing failed: {e}. Falling back to pdfplumber."
-            )
-            # Fallback to pdfplumber if Tika fails or is not available.
-            plumber_result = self._parse_with_pdfplumber(pdf_path)
-            result["text"] = plumber_result.get("text", "")
-            result["pages"] = plumber_result.get("pages", 0)
-            logger.info("PDF parsed successfully with pdfplumber fallback.")
+        if len(result["text"]) >= self.min_native_chars:
+            logger.info("PDF parsed with pdfplumber (native text).")
+        else:
+            # Little or no text layer: let Tika try the whole document.
+            try:
+                tika_result = self._parse_with_tika(pdf_path)
+                tika_text = (tika_result.get("content") or "").strip()
+                if len(tika_text) > len(result["text"]):
+                    result["text"] = tika_text
+                    result["metadata"] = (
+                        tika_result.get("metadata") or result["metadata"]
+                    )
+                logger.info("PDF parsed with Apache Tika fallback.")
+            except Exception as e:
+                logger.warning(
+                    f"Apache Tika parsing failed: {e}. Keeping pdfplumber result."
+                )
 
         # Extract tables if explicitly requested, using pdfplumber which is good for structured tables.
         if extract_tables:
@@ -92,7 +110,7 @@ class PDFParser:
 
         return result
 
-    def _parse_with_tika(self, pdf_path: str) -> Dict[str, Any]:
+    def _parse_with_tika(self, pdf_path: PDFSource) -> Dict[str, Any]:
         """
         Internal method: Parses a PDF file using the Apache Tika client.
 
@@ -108,6 +126,14 @@ class PDFParser:
         """
         from tika import parser as tika_parser
 
+        if not isinstance(pdf_path, str):
+            pdf_path.seek(0)
+            if self.tika_url:
+                return tika_parser.from_buffer(
+                    pdf_path.read(), serverEndpoint=self.tika_url
+                )
+            return tika_parser.from_buffer(pdf_path.read())
+
         if self.tika_url:
             # Use a remote Tika server if URL is provided.
             return tika_parser.from_file(pdf_path, serverEndpoint=self.tika_url)
@@ -115,17 +141,20 @@ class PDFParser:
             # Use a local Tika client (requires a Java Runtime Environment).
             return tika_parser.from_file(pdf_path)
 
-    def _parse_with_pdfplumber(self, pdf_path: str) -> Dict[str, Any]:
+    def _parse_with_pdfplumber(self, pdf_path: PDFSource) -> Dict[str, Any]:
         """
-        Internal method: Parses a PDF file using the `pdfplumber` library for native text extraction.
+        Internal method: Extracts native text with `pdfplumber`, OCRing scanned pages.
 
-        This method is effective for machine-generated PDFs that have selectable text.
+        Pages whose text layer has fewer than `min_page_chars` characters are
+        rendered and passed to Tesseract, so mixed documents only pay OCR cost
+        for their image-only pages.
 
         Args:
-            pdf_path (str): The file path to the PDF document.
+            pdf_path (Union[str, IO[bytes]]): The file path or binary stream.
 
         Returns:
-            Dict[str, Any]: A dictionary containing the concatenated text from all pages and the total page count.
+            Dict[str, Any]: The concatenated text, document metadata, total page
+                            count and the 1-based numbers of OCRed pages.
 
         Raises:
             ImportError: If the `pdfplumber` package is not installed.
@@ -134,21 +163,46 @@ class PDFParser:
         import pdfplumber
 
         text_parts = []
-        page_count = 0
+        ocr_pages = []
 
         with pdfplumber.open(pdf_path) as pdf:
+            metadata = dict(pdf.metadata or {})
             page_count = len(pdf.pages)
-            for page in pdf.pages:
-                text = page.extract_text()
+            for number, page in enumerate(pdf.pages, start=1):
+                text = (page.extract_text() or "").strip()
+                if len(text) < self.min_page_chars:
+                    ocr_text = self._ocr_page(page)
+                    if len(ocr_text) > len(text):
+                        text = ocr_text
+                        ocr_pages.append(number)
                 if text:
                     text_parts.append(text)
 
         return {
             "text": "\n\n".join(text_parts),
+            "metadata": metadata,
             "pages": page_count,
+            "ocr_pages": ocr_pages,
         }
 
-    def _extract_tables(self, pdf_path: str) -> List[Dict[str, Any]]:
+    def _ocr_page(self, page: Any) -> str:
+        """
+        Internal method: Renders a `pdfplumber` page at 200 DPI and OCRs it.
+
+        Returns:
+            str: The recognized text, or "" if rendering or OCR is unavailable.
+        """
+        from .ocr_processor import OCRProcessor
+
+        try:
+            buffer = io.BytesIO()
+            page.to_image(resolution=200).original.save(buffer, format="PNG")
+            return OCRProcessor(self.ocr_language).extract(buffer.getvalue())["text"]
+        except Exception as e:
+            logger.warning(f"OCR failed for PDF page {page.page_number}: {e}")
+            return ""
+
+    def _extract_tables(self, pdf_path: PDFSource) -> List[Dict[str, Any]]:
         """
         Internal method: Extracts structured tables from a PDF using `pdfplumber`.
 
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import urllib.parse
 from typing import Any, Dict, List
@@ -34,46 +35,85 @@ class SearchActivities:
             f"[SEARCH_NODE] Executing Deep Research query for {tenant_id}: '{query}'"
         )
 
-        # Format the URL securely
-        encoded_query = urllib.parse.quote(query)
-        # We request JSON specifically
-        search_url = f"{self.base_url}/search?q={encoded_query}&format=json"
-
         # Vibe Rule 5: Error handling logic implemented robustly
         try:
             async with httpx.AsyncClient(timeout=30.0) as client:
-                # Force specific headers to respect open-source engines
-                response = await client.get(
-                    search_url, headers={"User-Agent": "Voyant Search Node / 1.0"}
-                )
-
-                if response.status_code != 200:
-                    logger.warning(
-                        f"SearXNG failed {response.status_code}. Fallback to exact URL parsing if applicable."
-                    )
-                    return []
-
-                data = response.json()
-                results = data.get("results", [])
-
-                extracted = []
-                # Map structured data specifically ignoring tracking schemas
-                for item in results[:max_results]:
-                    extracted.append(
-                        {
-                            "url": item.get("url"),
-                            "title": item.get("title"),
-                            "snippet": item.get("content", item.get("snippet", "")),
-                        }
-                    )
-
-                logger.info(
-                    f"[SEARCH_NODE] Yielded {len(extracted)} valid URLs for extraction."
-                )
-                return extracted
+                return await self._search(client, query, max_results)
 
         except httpx.RequestError as e:
             # Container might be offline, throw explicit error rather than mocking
             raise RuntimeError(
                 f"Sovereign Search Engine (SearXNG) connection failed: {e}. Is the Docker container running?"
             )
+
+    @activity.defn(name="execute_searxng_queries")
+    async def execute_searxng_queries(
+        self, params: Dict[str, Any]
+    ) -> List[List[Dict[str, str]]]:
+        """
+        Executes many queries concurrently against the sovereign internal engine.
+
+        All queries share one pooled client and at most `concurrency` are in
+        flight, so a batch costs roughly the slowest query instead of the sum.
+        Returns one result list per query, in input order.
+        """
+        queries = params.get("queries", [])
+        max_results = params.get("max_results", 10)
+        tenant_id = params.get("tenant_id", "default")
+        semaphore = asyncio.Semaphore(params.get("concurrency", 8))
+
+        logger.info(
+            f"[SEARCH_NODE] Executing {len(queries)} Deep Research queries for {tenant_id}"
+        )
+
+        async def run(client: httpx.AsyncClient, query: str) -> List[Dict[str, str]]:
+            async with semaphore:
+                return await self._search(client, query, max_results)
+
+        try:
+            async with httpx.AsyncClient(timeout=30.0) as client:
+                return await asyncio.gather(*(run(client, q) for q in queries))
+
+        except httpx.RequestError as e:
+            raise RuntimeError(
+                f"Sovereign Search Engine (SearXNG) connection failed: {e}. Is the Docker container running?"
+            )
+
+    async def _search(
+        self, client: httpx.AsyncClient, query: str, max_results: int
+    ) -> List[Dict[str, str]]:
+        """Runs one query on `client` and maps results to [URL, Title, Snippet]."""
+        # Format the URL securely
+        encoded_query = urllib.parse.quote(query)
+        # We request JSON specifically
+        search_url = f"{self.base_url}/search?q={encoded_query}&format=json"
+
+        # Force specific headers to respect open-source engines
+        response = await client.get(
+            search_url, headers={"User-Agent": "Voyant Search Node / 1.0"}
+        )
+
+        if response.status_code != 200:
+            logger.warning(
+                f"SearXNG failed {response.status_code}. Fallback to exact URL parsing if applicable."
+            )
+            return []
+
+        data = response.json()
+        results = data.get("results", [])
+
+        extracted = []
+        # Map structured data specifically ignoring tracking schemas
+        for item in results[:max_results]:
+            extracted.append(
+                {
+                    "url": item.get("url"),
+                    "title": item.get("title"),
+                    "snippet": item.get("content", item.get("snippet", "")),
+                }
+            )
+
+        logger.info(
+            f"[SEARCH_NODE] Yielded {len(extracted)} valid URLs for extraction."
+        )
+        return extracted
@@ -0,0 +1,38 @@
+"""
+VOYANT DataScraper - API Endpoint Tests
+
+Tests the /extract endpoint's declared response codes.
+"""
+
+from ninja.testing import TestClient
+
+from apps.scraper.api import scrape_router
+
+client = TestClient(scrape_router)
+
+
+def test_extract_returns_fields():
+    response = client.post(
+        "/extract",
+        json={"html": "<div><p>Hola</p></div>", "selectors": {"t": "p"}},
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"t": ["Hola"]}
+
+
+def test_extract_rejects_invalid_selector():
+    response = client.post(
+        "/extract",
+        json={"html": "<div><p>Hola</p></div>", "selectors": {"t": "div["}},
+    )
+
+    assert response.status_code == 400
+    assert response.json()["invalid_selectors"].keys() == {"t"}
+
+
+def test_extract_rejects_invalid_html():
+    response = client.post("/extract", json={"html": "", "selectors": {"t": "p"}})
+
+    assert response.status_code == 400
+    assert response.json()["error"].startswith("Invalid HTML")
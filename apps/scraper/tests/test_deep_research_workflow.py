@@ -0,0 +1,53 @@
+"""
+Tests for DeepResearchWorkflow.
+
+Searches run as one batch activity; scraping fans out per unique URL.
+"""
+
+import logging
+
+import pytest
+
+from apps.scraper import deep_research_workflow as workflow_module
+from apps.scraper.activities import ScrapeActivities
+from apps.scraper.deep_research_workflow import DeepResearchWorkflow
+from apps.scraper.search_activities import SearchActivities
+
+
+@pytest.mark.asyncio
+async def test_queries_searched_in_one_batch(monkeypatch):
+    calls = []
+
+    async def fake_execute_activity(fn, params, **kwargs):
+        calls.append((fn, params))
+        if fn is SearchActivities.execute_searxng_queries:
+            return [
+                [{"url": "https://a.ec"}, {"url": "https://b.ec"}],
+                [{"url": "https://b.ec"}, {"url": None}, {"url": "https://c.ec"}],
+            ]
+        return {"html": "<p></p>"}
+
+    monkeypatch.setattr(
+        workflow_module.workflow, "execute_activity", fake_execute_activity
+    )
+    monkeypatch.setattr(workflow_module.workflow, "logger", logging.getLogger("test"))
+
+    result = await DeepResearchWorkflow().run(
+        {
+            "topic": "ruc ecuador",
+            "queries": ["sri ruc"],
+            "max_urls": 2,
+            "tenant_id": "t1",
+            "job_id": "job-1",
+        }
+    )
+
+    search_calls = [
+        p for fn, p in calls if fn is SearchActivities.execute_searxng_queries
+    ]
+    scraped = [p["url"] for fn, p in calls if fn is ScrapeActivities.fetch_page]
+    assert search_calls == [
+        {"queries": ["ruc ecuador", "sri ruc"], "max_results": 2, "tenant_id": "t1"}
+    ]
+    assert scraped == ["https://a.ec", "https://b.ec"]
+    assert result["urls_processed"] == 2
@@ -0,0 +1,64 @@
+"""
+Tests for FetchActivities helpers that run without Temporal or network access.
+"""
+
+import pytest
+from playwright import async_api
+
+from apps.scraper.activities.fetch_activities import FetchActivities
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+class FakePlaywright:
+    """Stands in for `async_playwright()`, recording browser launches."""
+
+    def __init__(self):
+        self.launched = []
+        self.chromium = self
+
+    async def launch(self, headless=True):
+        browser = FakeBrowser()
+        self.launched.append(browser)
+        return browser
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class TestFetchPagesBatch:
+    """A batch shares one browser and reports per-URL failures in place."""
+
+    @pytest.mark.asyncio
+    async def test_one_browser_for_the_batch(self, monkeypatch):
+        playwright = FakePlaywright()
+        rendered = []
+
+        async def fake_render(self, browser, url, **options):
+            rendered.append((browser, url))
+            return {"html": f"<p>{url}</p>", "url": url}
+
+        monkeypatch.setattr(async_api, "async_playwright", lambda: playwright)
+        monkeypatch.setattr(FetchActivities, "_render_playwright", fake_render)
+        urls = ["http://8.8.8.8/a", "http://127.0.0.1/admin", "http://8.8.4.4/b"]
+
+        result = await FetchActivities().fetch_pages_batch(
+            {"urls": urls, "engine": "playwright"}
+        )
+
+        pages = result["pages"]
+        assert [p["url"] for p in pages] == urls
+        assert pages[0]["html"] == "<p>http://8.8.8.8/a</p>"
+        assert "SSRF blocked" in pages[1]["error"]
+        assert len(playwright.launched) == 1
+        assert playwright.launched[0].closed
+        assert {browser for browser, _ in rendered} == {playwright.launched[0]}
@@ -12,7 +12,13 @@ All 10 Production Personas Active:
 
 import pytest
 
-from apps.scraper.parsing.html_parser import HTMLParser
+from apps.scraper.parsing.html_parser import (
+    HTMLParser,
+    compiled_css,
+    compiled_xpath,
+    condense_html,
+    validate_selectors,
+)
 
 
 class TestCSSSelectors:
@@ -146,6 +152,138 @@ class TestHelperMethods:
         images = parser.get_all_images(html)
         assert len(images) == 2
 
+    def test_parsed_tree_reused_across_helpers(self, parser):
+        """A tree from parse() serves selectors, images and media without re-parsing."""
+        html = """
+        <html>
+        <body>
+            <h1>Catálogo</h1>
+            <img src="/logo.png">
+            <video><source src="/promo.mp4"></video>
+        </body>
+        </html>
+        """
+        tree = parser.parse(html)
+        assert parser.extract_tree(tree, {"heading": "h1"}) == {"heading": ["Catálogo"]}
+        assert parser.get_all_images(tree) == ["/logo.png"]
+        assert parser.get_all_media(tree) == ["/promo.mp4"]
+        assert parser.extract(html, {"heading": "h1"}) == {"heading": ["Catálogo"]}
+
+
+class TestCompiledSelectors:
+    """Test per-process caching of compiled selectors."""
+
+    def test_same_selector_compiled_once(self):
+        """Repeated selector strings return the same compiled object."""
+        assert compiled_css(".company .name") is compiled_css(".company .name")
+        assert compiled_xpath("//td[1]/text()") is compiled_xpath("//td[1]/text()")
+
+    def test_invalid_selector_not_cached(self):
+        """Compilation errors propagate instead of being memoized."""
+        from cssselect import SelectorError
+
+        before = compiled_css.cache_info().currsize
+        with pytest.raises(SelectorError):
+            compiled_css("..invalid..")
+        assert compiled_css.cache_info().currsize == before
+
+
+class TestXPathEvaluation:
+    """Test XPath selectors evaluated against a full document."""
+
+    @pytest.mark.parametrize(
+        "xpath, expected",
+        [
+            ("//a[@title='C:\\xdir']", ["dir"]),
+            ("//a[@href='a\\b']", ["back"]),
+            ("//p[@class='a']", ["1", "3"]),
+        ],
+    )
+    def test_attribute_values_match_literally(self, xpath, expected):
+        parser = HTMLParser()
+        tree = parser.parse(
+            "<html><body>"
+            '<a title="C:\\xdir">dir</a><a href="a\\b">back</a>'
+            '<p class="a">1</p><p class="b">2</p><p class="a">3</p>'
+            "</body></html>"
+        )
+        assert tree.getparent() is None
+
+        result = parser.extract_tree(tree, {"rows": xpath})
+
+        assert [el.text for el in result["rows"]] == expected
+
+
+class TestCondenseHTML:
+    """Test structural pruning of HTML for selector authoring."""
+
+    def test_strips_non_content_and_attributes(self):
+        html = """
+        <html>
+        <head><script>var big = 1;</script><style>p {}</style></head>
+        <body>
+            <!-- tracking -->
+            <div id="main" class="list" data-reactid="42" style="x" aria-label="Empresas">
+                <a href="/ruc" onclick="go()">RUC</a>  tail
+            </div>
+            <noscript>enable js</noscript>
+        </body>
+        </html>
+        """
+        condensed = condense_html(html)
+
+        assert "var big" not in condensed
+        assert "tracking" not in condensed
+        assert "enable js" not in condensed
+        assert "data-reactid" not in condensed
+        assert "onclick" not in condensed
+        assert '<div id="main" class="list" aria-label="Empresas">' in condensed
+        assert '<a href="/ruc">RUC</a> tail' in condensed
+        assert "  " not in condensed
+
+    def test_truncates_after_condensing(self):
+        html = (
+            "<html><head><script>"
+            + "x" * 500
+            + "</script></head><body><p>Quito</p></body></html>"
+        )
+        condensed = condense_html(html, max_length=60)
+
+        assert len(condensed) <= 60
+        assert "<p>Quito</p>" in condensed
+
+
+class TestValidateSelectors:
+    """Test up-front validation of agent-provided selector maps."""
+
+    def test_valid_map_has_no_errors(self):
+        selectors = {
+            "title": "h1",
+            "links": "a::attr(href)",
+            "ruc": "//td[@class='ruc']/text()",
+            "products": {"root": ".product", "fields": {"name": ".name::text"}},
+        }
+        assert validate_selectors(selectors) == {}
+
+    def test_reports_every_invalid_selector(self):
+        selectors = {
+            "ok": "h1",
+            "bad_css": "div[",
+            "bad_xpath": "//div[",
+            "empty": "",
+            "items": {"root": ".item", "fields": {"price": "span::text", "x": ">>"}},
+            "no_fields": {"root": ".row"},
+        }
+        errors = validate_selectors(selectors)
+
+        assert set(errors) == {
+            "bad_css",
+            "bad_xpath",
+            "empty",
+            "items.x",
+            "no_fields.fields",
+        }
+
 
 class TestEdgeCases:
     """Test edge cases and error handling."""
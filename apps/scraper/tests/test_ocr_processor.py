@@ -0,0 +1,211 @@
+"""
+Tests for OCRProcessor result assembly (no Tesseract binary required).
+"""
+
+import sys
+import threading
+import types
+
+import pytest
+
+from apps.scraper.parsing import ocr_processor
+from apps.scraper.parsing.ocr_processor import OCRProcessor, prepare_for_ocr
+
+DATA = {
+    "text": ["", "Acme", "S.A.", "", "Quito,", "Ecuador", "", "RUC"],
+    "conf": ["-1", "96", "91", "-1", "88", "90.5", "-1", "0"],
+    "block_num": [1, 1, 1, 1, 1, 1, 2, 2],
+    "par_num": [1, 1, 1, 1, 1, 1, 1, 1],
+    "line_num": [1, 1, 1, 2, 2, 2, 1, 1],
+}
+
+
+class TestSinglePassExtraction:
+    """Text and confidence come from one image_to_data call."""
+
+    def test_text_layout_rebuilt_from_data(self):
+        assert OCRProcessor._text_from_data(DATA) == (
+            "Acme S.A.\nQuito, Ecuador\n\nRUC"
+        )
+
+    def test_confidence_ignores_non_text_entries(self):
+        assert OCRProcessor._confidence_from_data(DATA) == 0.91
+
+    def test_extract_runs_tesseract_once(self, tmp_path, monkeypatch):
+        import pytesseract
+        from PIL import Image
+
+        calls = []
+
+        def fake_image_to_data(image, **kwargs):
+            calls.append(kwargs)
+            return DATA
+
+        def fail(*args, **kwargs):
+            pytest.fail("image_to_string should not be called")
+
+        monkeypatch.setattr(pytesseract, "image_to_data", fake_image_to_data)
+        monkeypatch.setattr(pytesseract, "image_to_string", fail)
+
+        path = tmp_path / "doc.png"
+        Image.new("RGB", (8, 8), "white").save(path, format="PNG")
+
+        result = OCRProcessor(language="spa").batch_extract([str(path)])
+
+        assert len(calls) == 1
+        assert calls[0]["lang"] == "spa"
+        assert result[0]["text"] == "Acme S.A.\nQuito, Ecuador\n\nRUC"
+        assert result[0]["confidence"] == 0.91
+
+
+class TestBatchPool:
+    """batch_extract reuses one non-forking process pool across calls."""
+
+    def test_pool_reused_until_shutdown(self):
+        processor = OCRProcessor(language="spa")
+        try:
+            first = processor.batch_extract(["/missing/a.png", "/missing/b.png"], 2)
+            pool = ocr_processor._pools[2]
+            processor.batch_extract(["/missing/c.png", "/missing/d.png"], 2)
+
+            assert ocr_processor._pools[2] is pool
+            assert pool._mp_context.get_start_method() != "fork"
+            assert all("error" in r for r in first)
+        finally:
+            ocr_processor.shutdown_ocr_pools()
+        assert ocr_processor._pools == {}
+
+
+class TestPrepareForOcr:
+    """Images are grayscale, capped in size and binarized before Tesseract."""
+
+    def test_downscaled_and_binary(self):
+        from PIL import Image, ImageDraw
+
+        image = Image.new("RGB", (4000, 1000), (200, 220, 240))
+        ImageDraw.Draw(image).rectangle((100, 100, 400, 300), fill=(30, 30, 30))
+
+        prepared = prepare_for_ocr(image)
+
+        assert prepared.mode == "L"
+        assert prepared.size == (2000, 500)
+        assert set(prepared.getdata()) <= {0, 255}
+        assert prepared.getpixel((60, 60)) == 0  # dark text stays black
+        assert prepared.getpixel((1500, 400)) == 255  # flat background turns white
+
+    def test_small_image_not_resized(self):
+        from PIL import Image
+
+        assert prepare_for_ocr(Image.new("RGB", (640, 480), "white")).size == (640, 480)
+
+
+class FakeTessAPI:
+    """Stands in for tesserocr.PyTessBaseAPI."""
+
+    def __init__(self):
+        self.images = []
+
+    def SetImage(self, image):
+        self.images.append(image)
+
+    def GetUTF8Text(self):
+        return "Acme S.A.\n"
+
+    def MeanTextConf(self):
+        return 87
+
+
+class TestTesserocrEngine:
+    """The in-process engine is preferred over pytesseract when installed."""
+
+    def test_extract_uses_cached_engine(self, tmp_path, monkeypatch):
+        import pytesseract
+        from PIL import Image
+
+        api = FakeTessAPI()
+        monkeypatch.setattr(
+            ocr_processor, "_tesserocr_api", lambda lang, psm: (api, threading.Lock())
+        )
+        monkeypatch.setattr(pytesseract, "image_to_data", pytest.fail)
+
+        path = tmp_path / "doc.png"
+        Image.new("RGB", (8, 8), "white").save(path, format="PNG")
+
+        processor = OCRProcessor(language="spa")
+        first = processor.extract(str(path))
+        processor.extract(str(path))
+
+        assert first["text"] == "Acme S.A."
+        assert first["confidence"] == 0.87
+        assert len(api.images) == 2
+
+    def test_image_to_text_falls_back_to_pytesseract(self, monkeypatch):
+        import pytesseract
+        from PIL import Image
+
+        monkeypatch.setattr(ocr_processor, "_tesserocr_api", lambda lang, psm: None)
+        monkeypatch.setattr(
+            pytesseract,
+            "image_to_string",
+            lambda img, lang=None, config="": f" {lang} {config} ",
+        )
+
+        text = ocr_processor.image_to_text(
+            Image.new("L", (8, 8)), "spa", psm=ocr_processor.PSM_SINGLE_BLOCK
+        )
+
+        assert text == "spa --oem 1 --psm 6"
+
+
+class TestTesserocrLocks:
+    """Each cached engine has its own lock, so languages OCR in parallel."""
+
+    @pytest.fixture
+    def fake_tesserocr(self, monkeypatch):
+        barrier = threading.Barrier(2, timeout=5)
+
+        class BlockingAPI(FakeTessAPI):
+            def __init__(self, lang, psm, oem):
+                super().__init__()
+
+            def SetImage(self, image):
+                # Both threads must be inside an engine at once to pass.
+                barrier.wait()
+
+        module = types.SimpleNamespace(
+            OEM=types.SimpleNamespace(LSTM_ONLY=1), PyTessBaseAPI=BlockingAPI
+        )
+        monkeypatch.setitem(sys.modules, "tesserocr", module)
+        ocr_processor._tesserocr_api.cache_clear()
+        yield
+        ocr_processor._tesserocr_api.cache_clear()
+
+    def test_engines_for_different_languages_run_concurrently(self, fake_tesserocr):
+        from PIL import Image
+
+        results = {}
+
+        def run(language):
+            results[language] = ocr_processor.image_to_text(
+                Image.new("L", (8, 8)), language
+            )
+
+        threads = [
+            threading.Thread(target=run, args=(lang,)) for lang in ("spa", "eng")
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == {"spa": "Acme S.A.", "eng": "Acme S.A."}
+
+    def test_same_language_shares_engine_and_lock(self, fake_tesserocr):
+        first = ocr_processor._tesserocr_api("spa", ocr_processor.PSM_AUTO)
+        second = ocr_processor._tesserocr_api("spa", ocr_processor.PSM_AUTO)
+
+        assert first is second
+        assert (
+            first[1]
+            is not ocr_processor._tesserocr_api("eng", ocr_processor.PSM_AUTO)[1]
+        )
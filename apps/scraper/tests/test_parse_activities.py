@@ -0,0 +1,288 @@
+"""
+Tests for ParseActivities helpers that run without Temporal or network access.
+"""
+
+import pytest
+
+from apps.scraper.activities import parse_activities
+from apps.scraper.activities.parse_activities import ParseActivities
+
+
+@pytest.fixture
+def image_file(tmp_path):
+    """Return a factory that writes a small PNG and returns its path."""
+    from PIL import Image
+
+    def _write(name: str) -> str:
+        path = tmp_path / name
+        Image.new("RGB", (8, 8), "white").save(path, format="PNG")
+        return str(path)
+
+    return _write
+
+
+class TestProcessOcrDedup:
+    """OCR work is skipped for duplicate sources and identical image bytes."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        parse_activities._ocr_cache.clear()
+        yield
+        parse_activities._ocr_cache.clear()
+
+    @pytest.fixture
+    def ocr_calls(self, monkeypatch):
+        import pytesseract
+
+        calls = []
+
+        def fake_image_to_string(img, lang=None, config=""):
+            calls.append(lang)
+            return "Acme S.A.\n"
+
+        monkeypatch.setattr(pytesseract, "image_to_string", fake_image_to_string)
+        return calls
+
+    @pytest.mark.asyncio
+    async def test_duplicate_sources_processed_once(self, image_file, ocr_calls):
+        path = image_file("logo.png")
+
+        result = await ParseActivities().process_ocr(
+            {"images": [path, path, path], "language": "eng"}
+        )
+
+        assert len(ocr_calls) == 1
+        assert result["processed"] == 1
+        assert result["results"] == [{"source": path, "text": "Acme S.A."}]
+
+    @pytest.mark.asyncio
+    async def test_identical_bytes_reuse_cached_text(self, image_file, ocr_calls):
+        first = image_file("a.png")
+        second = image_file("b.png")
+
+        result = await ParseActivities().process_ocr(
+            {"images": [first, second], "language": "eng"}
+        )
+
+        assert len(ocr_calls) == 1
+        assert [r["source"] for r in result["results"]] == [first, second]
+        assert result["text"] == "Acme S.A.\n\nAcme S.A."
+
+    @pytest.mark.asyncio
+    async def test_cache_is_keyed_by_language(self, image_file, ocr_calls):
+        path = image_file("logo.png")
+
+        await ParseActivities().process_ocr({"images": [path], "language": "eng"})
+        await ParseActivities().process_ocr({"images": [path], "language": "spa"})
+
+        assert ocr_calls == ["eng", "spa"]
+
+
+class TestTranscribeBackend:
+    """Whisper models load once and faster-whisper output keeps the result schema."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_models(self):
+        parse_activities._load_whisper_model.cache_clear()
+        yield
+        parse_activities._load_whisper_model.cache_clear()
+
+    @pytest.fixture
+    def fake_faster_whisper(self, monkeypatch):
+        import sys
+        import types
+        from collections import namedtuple
+
+        Segment = namedtuple("Segment", "id start end text")
+        calls = {"loaded": [], "batch_sizes": [], "inputs": []}
+
+        class WhisperModel:
+            def __init__(self, name, device, compute_type):
+                calls["loaded"].append((name, device, compute_type))
+
+        class BatchedInferencePipeline:
+            def __init__(self, model):
+                self.model = model
+
+            def transcribe(self, audio, language=None, batch_size=None):
+                if isinstance(audio, str) and audio == "/tmp/broken.mp3":
+                    raise RuntimeError("invalid data found when processing input")
+                calls["batch_sizes"].append(batch_size)
+                calls["inputs"].append(audio)
+                segments = iter(
+                    [Segment(1, 0.0, 1.5, " Hola"), Segment(2, 1.5, 3.0, " mundo.")]
+                )
+                return segments, None
+
+        module = types.ModuleType("faster_whisper")
+        module.WhisperModel = WhisperModel
+        module.BatchedInferencePipeline = BatchedInferencePipeline
+        monkeypatch.setitem(sys.modules, "faster_whisper", module)
+        monkeypatch.setattr(
+            parse_activities.settings, "scraper_whisper_backend", "faster-whisper"
+        )
+        return calls
+
+    def test_segments_materialized_to_whisper_schema(self, fake_faster_whisper):
+        [result] = parse_activities._transcribe_many(["/tmp/a.mp3"], "es")
+
+        assert result["text"] == " Hola mundo."
+        assert result["segments"][1] == {
+            "id": 2,
+            "start": 1.5,
+            "end": 3.0,
+            "text": " mundo.",
+        }
+
+    def test_batch_loads_model_once(self, fake_faster_whisper):
+        results = parse_activities._transcribe_many(
+            ["/tmp/a.mp3", "/tmp/broken.mp3", "/tmp/b.mp3"], "es"
+        )
+        parse_activities._transcribe_many(["/tmp/c.mp3"], "es")
+
+        assert len(fake_faster_whisper["loaded"]) == 1
+        assert fake_faster_whisper["loaded"][0][2] == "int8"
+        assert fake_faster_whisper["batch_sizes"] == [16, 16, 16]
+        assert "error" in results[1]
+        assert results[2]["text"] == " Hola mundo."
+
+    def test_concurrent_first_calls_load_model_once(
+        self, fake_faster_whisper, monkeypatch
+    ):
+        import sys
+        import threading
+        import time
+
+        module = sys.modules["faster_whisper"]
+        base = module.WhisperModel
+
+        class SlowWhisperModel(base):
+            def __init__(self, *args, **kwargs):
+                time.sleep(0.05)
+                super().__init__(*args, **kwargs)
+
+        monkeypatch.setattr(module, "WhisperModel", SlowWhisperModel)
+        threads = [
+            threading.Thread(
+                target=parse_activities._transcribe_many, args=(["/tmp/a.mp3"], "es")
+            )
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(fake_faster_whisper["loaded"]) == 1
+
+    def test_release_drops_cached_model(self, fake_faster_whisper):
+        parse_activities._transcribe_many(["/tmp/a.mp3"], "es")
+        parse_activities.release_whisper_models()
+        parse_activities._transcribe_many(["/tmp/b.mp3"], "es")
+
+        assert len(fake_faster_whisper["loaded"]) == 2
+        assert fake_faster_whisper["loaded"][0][1] == "auto"
+
+    @pytest.mark.parametrize("device", ["cuda", "cpu"])
+    def test_openai_whisper_fp16_follows_model_device(self, monkeypatch, device):
+        import contextlib
+        import sys
+        import types
+
+        calls = []
+
+        class Model:
+            def __init__(self):
+                self.device = types.SimpleNamespace(type=device)
+
+            def transcribe(self, audio, language=None, fp16=True):
+                calls.append((fp16, torch.grad_disabled))
+                return {"text": " Hola", "segments": []}
+
+        torch = types.ModuleType("torch")
+        torch.grad_disabled = False
+        # A GPU exists either way; only the model's device decides FP16.
+        torch.cuda = types.SimpleNamespace(is_available=lambda: True)
+
+        @contextlib.contextmanager
+        def inference_mode():
+            torch.grad_disabled = True
+            yield
+            torch.grad_disabled = False
+
+        torch.inference_mode = inference_mode
+        whisper = types.ModuleType("whisper")
+        whisper.load_model = lambda name, device=None: Model()
+        monkeypatch.setitem(sys.modules, "torch", torch)
+        monkeypatch.setitem(sys.modules, "whisper", whisper)
+        monkeypatch.setattr(
+            parse_activities.settings, "scraper_whisper_backend", "openai-whisper"
+        )
+
+        [result] = parse_activities._transcribe_many(["/tmp/a.mp3"], "es")
+
+        assert calls == [(device == "cuda", True)]
+        assert result["text"] == " Hola"
+
+    def test_bytes_passed_in_memory(self, fake_faster_whisper):
+        import io
+
+        [result] = parse_activities._transcribe_many([b"ID3fake-mp3"], "es")
+
+        [audio] = fake_faster_whisper["inputs"]
+        assert isinstance(audio, io.BytesIO)
+        assert audio.getvalue() == b"ID3fake-mp3"
+        assert result["text"] == " Hola mundo."
+
+    def test_whisper_ready_wav_skips_decode(self, fake_faster_whisper):
+        import io
+        import wave
+
+        import numpy as np
+
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as w:
+            w.setnchannels(1)
+            w.setsampwidth(2)
+            w.setframerate(16000)
+            w.writeframes(np.array([0, 16384, -16384], np.int16).tobytes())
+
+        parse_activities._transcribe_many([buffer.getvalue()], "es")
+
+        [audio] = fake_faster_whisper["inputs"]
+        assert isinstance(audio, np.ndarray)
+        assert audio.tolist() == [0.0, 0.5, -0.5]
+
+    def test_other_wav_formats_are_decoded(self):
+        import io
+        import wave
+
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as w:
+            w.setnchannels(2)
+            w.setsampwidth(2)
+            w.setframerate(44100)
+            w.writeframes(b"\x00\x00" * 8)
+
+        assert parse_activities._whisper_ready_wav(buffer.getvalue()) is None
+        assert parse_activities._whisper_ready_wav(b"ID3not-a-wav") is None
+
+
+@pytest.mark.asyncio
+async def test_parse_pdf_defaults_to_configured_ocr_language(monkeypatch, tmp_path):
+    from apps.scraper.parsing import pdf_parser
+
+    languages = []
+
+    def fake_parse(self, source, extract_tables):
+        languages.append(self.ocr_language)
+        return {"text": ""}
+
+    monkeypatch.setattr(pdf_parser.PDFParser, "parse", fake_parse)
+    monkeypatch.setattr(
+        parse_activities.settings, "scraper_default_ocr_language", "por"
+    )
+
+    await ParseActivities().parse_pdf({"pdf_url": str(tmp_path / "doc.pdf")})
+
+    assert languages == ["por"]
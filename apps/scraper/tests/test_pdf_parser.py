@@ -0,0 +1,83 @@
+"""
+Tests for PDFParser native-text-first extraction (no Tika or Tesseract required).
+"""
+
+import io
+
+import pytest
+
+from apps.scraper.parsing.pdf_parser import PDFParser
+
+
+def _text_pdf(text: str) -> bytes:
+    """Build a minimal one-page PDF with a Helvetica text layer."""
+    stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode()
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R"
+        b" /Resources << /Font << /F1 5 0 R >> >> >>",
+        b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    out = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref,
+    )
+    return out
+
+
+@pytest.fixture
+def no_tika(monkeypatch):
+    def fail(self, pdf_path):
+        pytest.fail("Tika should not be used when native text is sufficient")
+
+    monkeypatch.setattr(PDFParser, "_parse_with_tika", fail)
+
+
+class TestNativeFirst:
+    """Born-digital PDFs never reach OCR or Tika."""
+
+    def test_native_text_skips_ocr_and_tika(self, no_tika, monkeypatch):
+        monkeypatch.setattr(
+            PDFParser, "_ocr_page", lambda self, page: pytest.fail("no OCR")
+        )
+        text = "Servicio de Rentas Internas - Registro Unico de Contribuyentes"
+
+        result = PDFParser(min_native_chars=20).parse(io.BytesIO(_text_pdf(text)))
+
+        assert result["text"] == text
+        assert result["pages"] == 1
+        assert result["ocr_pages"] == []
+
+    def test_sparse_page_is_ocred(self, no_tika, monkeypatch):
+        ocr_text = "Factura 001-002-000123456 Quito Ecuador"
+        monkeypatch.setattr(PDFParser, "_ocr_page", lambda self, page: ocr_text)
+
+        result = PDFParser(min_native_chars=20, min_page_chars=20).parse(
+            io.BytesIO(_text_pdf("p. 1"))
+        )
+
+        assert result["text"] == ocr_text
+        assert result["ocr_pages"] == [1]
+
+    def test_tika_fallback_when_no_text(self, monkeypatch):
+        monkeypatch.setattr(PDFParser, "_ocr_page", lambda self, page: "")
+        monkeypatch.setattr(
+            PDFParser,
+            "_parse_with_tika",
+            lambda self, pdf_path: {"content": " Texto Tika ", "metadata": {"a": 1}},
+        )
+
+        result = PDFParser().parse(io.BytesIO(_text_pdf("x")))
+
+        assert result["text"] == "Texto Tika"
+        assert result["metadata"] == {"a": 1}
@@ -0,0 +1,46 @@
+"""
+Tests for the streaming sitemap parser used by ScrapyClient.crawl_sitemap.
+"""
+
+import pytest
+
+from apps.scraper.browser.scrapy_client import iter_sitemap_locs
+
+URLSET = b"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <url><loc>https://www.sri.gob.ec/</loc><lastmod>2024-01-01</lastmod></url>
+  <url><loc>
+    https://www.sri.gob.ec/ruc
+  </loc></url>
+</urlset>
+"""
+
+
+class TestIterSitemapLocs:
+    """Sitemap <loc> extraction over chunked input."""
+
+    def test_single_chunk(self):
+        assert list(iter_sitemap_locs([URLSET])) == [
+            "https://www.sri.gob.ec/",
+            "https://www.sri.gob.ec/ruc",
+        ]
+
+    def test_chunks_split_mid_element(self):
+        chunks = [URLSET[i : i + 7] for i in range(0, len(URLSET), 7)]
+        assert list(iter_sitemap_locs(chunks)) == [
+            "https://www.sri.gob.ec/",
+            "https://www.sri.gob.ec/ruc",
+        ]
+
+    def test_sitemap_index_without_namespace(self):
+        index = (
+            b"<sitemapindex><sitemap><loc>https://sercop.gob.ec/a.xml</loc>"
+            b"</sitemap></sitemapindex>"
+        )
+        assert list(iter_sitemap_locs([index])) == ["https://sercop.gob.ec/a.xml"]
+
+    def test_malformed_xml_raises(self):
+        from lxml import etree
+
+        with pytest.raises(etree.XMLSyntaxError):
+            list(iter_sitemap_locs([b"<urlset><url><loc>x</url>"]))
@@ -0,0 +1,218 @@
+"""
+Tests for SeleniumClient against a fake WebDriver.
+"""
+
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("selenium")
+
+from selenium.common.exceptions import NoSuchElementException
+
+from apps.scraper.browser import selenium_client
+from apps.scraper.browser.selenium_client import SeleniumClient
+
+
+class FakeElement:
+    def __init__(self, driver, selector):
+        self.driver = driver
+        self.selector = selector
+
+    def click(self):
+        self.driver.calls.append(("click", self.selector))
+
+    def clear(self):
+        self.driver.calls.append(("clear", self.selector))
+
+    def send_keys(self, value):
+        self.driver.calls.append(("send_keys", self.selector, value))
+
+
+class FakeDriver:
+    """Records WebDriver calls; `script_results` feeds execute_script returns."""
+
+    instances = []
+    fail_urls = set()
+    page_delay = 0.0
+    live = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def __init__(self, options=None):
+        self.calls = []
+        self.script_results = []
+        self.page_source = "<html></html>"
+        self.quit_count = 0
+        with FakeDriver.lock:
+            FakeDriver.instances.append(self)
+            FakeDriver.live += 1
+            FakeDriver.peak = max(FakeDriver.peak, FakeDriver.live)
+
+    def get(self, url):
+        self.calls.append(("get", url))
+        time.sleep(FakeDriver.page_delay)
+        if url in FakeDriver.fail_urls:
+            raise RuntimeError("chrome not reachable")
+
+    def set_page_load_timeout(self, timeout):
+        pass
+
+    def find_element(self, by, selector):
+        self.calls.append(("find_element", selector))
+        return FakeElement(self, selector)
+
+    def execute_script(self, script, *args):
+        self.calls.append(("execute_script", args))
+        return self.script_results.pop(0) if self.script_results else None
+
+    def quit(self):
+        with FakeDriver.lock:
+            self.quit_count += 1
+            FakeDriver.live -= 1
+
+
+@pytest.fixture(autouse=True)
+def fake_chrome(monkeypatch):
+    FakeDriver.instances = []
+    FakeDriver.fail_urls = set()
+    FakeDriver.page_delay = 0.0
+    FakeDriver.live = FakeDriver.peak = 0
+    monkeypatch.setattr(selenium_client.webdriver, "Chrome", FakeDriver)
+    return FakeDriver
+
+
+ACTIONS = [
+    {"type": "fill", "selector": "#q", "value": "ruc"},
+    {"type": "click", "selector": "#go"},
+    {"type": "scroll"},
+]
+
+
+class TestPerformActions:
+    """Default WebDriver path and the opt-in in-page batch."""
+
+    def test_default_uses_webdriver_click_and_send_keys(self):
+        client = SeleniumClient()
+        client.perform_actions("https://www.sri.gob.ec/", ACTIONS)
+        (driver,) = FakeDriver.instances
+        assert driver.calls == [
+            ("get", "https://www.sri.gob.ec/"),
+            ("find_element", "#q"),
+            ("clear", "#q"),
+            ("send_keys", "#q", "ruc"),
+            ("find_element", "#go"),
+            ("click", "#go"),
+            ("execute_script", ()),
+        ]
+
+    def test_batch_actions_runs_one_script_per_wait(self, monkeypatch):
+        monkeypatch.setattr(selenium_client.time, "sleep", lambda s: None)
+        client = SeleniumClient()
+        client.perform_actions(
+            "https://www.sri.gob.ec/",
+            [*ACTIONS, {"type": "wait", "timeout": 10}, {"type": "scroll"}],
+            batch_actions=True,
+        )
+        (driver,) = FakeDriver.instances
+        scripts = [c for c in driver.calls if c[0] == "execute_script"]
+        assert len(scripts) == 2
+        assert [a["type"] for a in scripts[0][1][0]] == ["fill", "click", "scroll"]
+        assert [a["type"] for a in scripts[1][1][0]] == ["scroll"]
+        assert not any(c[0] in ("click", "send_keys") for c in driver.calls)
+
+    def test_batch_falls_back_to_send_keys_and_resumes(self):
+        client = SeleniumClient()
+        driver = client._get_driver()
+        driver.script_results = [{"index": 0, "slow": True}, None]
+        client.perform_actions("https://www.sri.gob.ec/", ACTIONS, batch_actions=True)
+        assert ("send_keys", "#q", "ruc") in driver.calls
+        scripts = [c for c in driver.calls if c[0] == "execute_script"]
+        assert [a["type"] for a in scripts[1][1][0]] == ["click", "scroll"]
+
+    def test_batch_missing_element_raises(self):
+        client = SeleniumClient()
+        driver = client._get_driver()
+        driver.script_results = [{"index": 1, "error": "#go not found"}]
+        with pytest.raises(NoSuchElementException):
+            client.perform_actions(
+                "https://www.sri.gob.ec/", ACTIONS, batch_actions=True
+            )
+
+
+def wait_until(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+class TestDriverRotation:
+    """Single-driver standby swap after `max_pages_per_driver` pages."""
+
+    def test_standby_swapped_in_between_pages(self):
+        client = SeleniumClient(max_pages_per_driver=2)
+        client.fetch_page("https://www.sri.gob.ec/a")
+        client.fetch_page("https://www.sri.gob.ec/b")
+        client._spawner.join()
+        first, standby = FakeDriver.instances
+
+        client.fetch_page("https://www.sri.gob.ec/c")
+        assert client._driver is standby
+        assert ("get", "https://www.sri.gob.ec/c") in standby.calls
+        wait_until(lambda: first.quit_count == 1)
+
+        client.close()
+        assert standby.quit_count == 1
+
+
+class TestFetchManyPool:
+    """Pooled drivers used by fetch_many."""
+
+    def test_retires_driver_after_max_pages(self):
+        client = SeleniumClient(max_pages_per_driver=2)
+        urls = [f"https://www.sri.gob.ec/{i}" for i in range(3)]
+        results = client.fetch_many(urls, concurrency=1)
+        assert [r["url"] for r in results] == urls
+        assert all("html" in r for r in results)
+        first, second = FakeDriver.instances
+        wait_until(lambda: first.quit_count == 1)
+        assert second.quit_count == 0
+
+    def test_discards_driver_after_error(self):
+        FakeDriver.fail_urls = {"https://www.sri.gob.ec/bad"}
+        client = SeleniumClient()
+        results = client.fetch_many(
+            ["https://www.sri.gob.ec/bad", "https://www.sri.gob.ec/ok"],
+            concurrency=1,
+        )
+        assert results[0]["error"] == "chrome not reachable"
+        assert "html" in results[1]
+        broken, fresh = FakeDriver.instances
+        assert broken.quit_count == 1
+        assert fresh.quit_count == 0
+
+    def test_live_drivers_never_exceed_cap(self):
+        FakeDriver.page_delay = 0.02
+        FakeDriver.fail_urls = {f"https://www.sri.gob.ec/{i}" for i in range(0, 24, 5)}
+        client = SeleniumClient(max_pages_per_driver=2)
+        urls = [f"https://www.sri.gob.ec/{i}" for i in range(24)]
+        client.fetch_many(urls, concurrency=3)
+        assert FakeDriver.peak <= 3
+
+    def test_resizes_when_concurrency_changes(self):
+        client = SeleniumClient()
+        urls = [f"https://www.sri.gob.ec/{i}" for i in range(8)]
+        FakeDriver.page_delay = 0.02
+
+        client.fetch_many(urls, concurrency=2)
+        assert client._pool.size == 2
+
+        client.fetch_many(urls, concurrency=4)
+        assert client._pool.size == 4
+        assert len(FakeDriver.instances) > 2
+
+        client.fetch_many(urls, concurrency=1)
+        assert client._pool.size == 1
+        assert FakeDriver.live == 1
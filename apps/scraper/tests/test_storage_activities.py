@@ -0,0 +1,77 @@
+"""
+Tests for StorageActivities.store_artifacts.
+
+Artifacts go through one bulk insert per call; only the ones recorded for
+the first time count towards the job's progress.
+"""
+
+from apps.scraper.activities.storage_activities import StorageActivities
+
+
+class FakeQuerySet:
+    def __init__(self, ids):
+        self.ids = ids
+
+    def values_list(self, field, flat=False):
+        return list(self.ids)
+
+
+class FakeManager:
+    def __init__(self, existing):
+        self.existing = existing
+
+    def filter(self, artifact_id__in):
+        return FakeQuerySet(i for i in artifact_id__in if i in self.existing)
+
+
+def _fakes(existing):
+    calls = {"bulk": [], "progress": []}
+
+    class FakeArtifact:
+        objects = FakeManager(existing)
+
+        @staticmethod
+        def bulk_record(job_id, records):
+            calls["bulk"].append([r["artifact_id"] for r in records])
+
+    class FakeJob:
+        def __init__(self, job_id):
+            self.job_id = job_id
+
+        def increment_progress(self, **counts):
+            calls["progress"].append(counts)
+
+    return FakeJob, FakeArtifact, calls
+
+
+def _record(job_id, tenant_id, url, data):
+    return {
+        "artifact_id": f"scrape-{job_id}-{data['hash']}",
+        "storage_path": data["hash"],
+        "content_hash": data["hash"],
+        "size_bytes": 1,
+        "source_url": url,
+    }
+
+
+def test_store_artifacts_counts_only_new_records(monkeypatch):
+    FakeJob, FakeArtifact, calls = _fakes(existing={"scrape-j1-old"})
+    monkeypatch.setattr(
+        StorageActivities, "_load_models", staticmethod(lambda: (FakeJob, FakeArtifact))
+    )
+    monkeypatch.setattr(StorageActivities, "_write_artifact", staticmethod(_record))
+
+    result = StorageActivities().store_artifacts(
+        {
+            "job_id": "j1",
+            "items": [
+                {"url": "a", "data": {"hash": "old"}, "bytes_processed": 5},
+                {"url": "b", "data": {"hash": "new"}, "bytes_processed": 7},
+                {"url": "c", "data": {"hash": "new"}, "bytes_processed": 7},
+            ],
+        }
+    )
+
+    assert calls["bulk"] == [["scrape-j1-old", "scrape-j1-new", "scrape-j1-new"]]
+    assert calls["progress"] == [{"pages": 1, "bytes_": 7, "artifacts": 1}]
+    assert [a["url"] for a in result["artifacts"]] == ["a", "b", "c"]
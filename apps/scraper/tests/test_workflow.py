@@ -2,8 +2,13 @@
 Integration tests for ScrapeWorkflow.
 """
 
+import asyncio
+import logging
+
 import pytest
 
+from apps.scraper import workflow as workflow_module
+from apps.scraper.activities import ScrapeActivities
 from apps.scraper.workflow import ScrapeWorkflow
 
 
@@ -29,3 +34,234 @@ class TestScrapeWorkflow:
         # In a real environment, we would use temporalio.testing.WorkflowEnvironment
         # But setting that up here might be heavy.
         # We will assume the E2E tests cover the actual execution.
+
+
+class TestBatchedFetch:
+    """URLs are fetched in concurrent batches; later steps run per URL."""
+
+    @pytest.mark.asyncio
+    async def test_urls_fetched_in_parallel_batches(self, monkeypatch):
+        state = {"active": 0, "peak": 0, "batches": [], "stores": []}
+        finalized = {}
+
+        async def fake_execute_activity(fn, params, **kwargs):
+            if fn is ScrapeActivities.fetch_pages_batch:
+                state["batches"].append(params["urls"])
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+                await asyncio.sleep(0.01)
+                state["active"] -= 1
+                if "https://example.ec/down" in params["urls"]:
+                    raise RuntimeError("worker lost")
+                return {
+                    "pages": [
+                        {"url": u, "error": "timeout"}
+                        if u.endswith("/broken")
+                        else {"html": "<p>" + u + "</p>"}
+                        for u in params["urls"]
+                    ]
+                }
+            if fn is ScrapeActivities.store_artifacts:
+                state["stores"].append([i["url"] for i in params["items"]])
+                return {"artifacts": [{"url": i["url"]} for i in params["items"]]}
+            if fn is ScrapeActivities.finalize_job:
+                finalized.update(params, progress=wf.progress())
+                return {}
+            pytest.fail(f"unexpected activity {fn}")
+
+        monkeypatch.setattr(
+            workflow_module.workflow, "execute_activity", fake_execute_activity
+        )
+        wf = ScrapeWorkflow()
+        urls = [f"https://example.ec/{i}" for i in range(5)] + [
+            "https://example.ec/broken",
+            "https://example.ec/down",
+            "https://example.ec/5",
+        ]
+
+        result = await wf.run(
+            {
+                "job_id": "j1",
+                "urls": urls,
+                "options": {"max_concurrency": 4, "fetch_batch_size": 2},
+            }
+        )
+
+        assert state["batches"] == [urls[i : i + 2] for i in range(0, 8, 2)]
+        assert state["peak"] == 2
+        assert state["stores"] == [urls[0:2], urls[2:4], urls[4:5]]
+        assert [a["url"] for a in result["artifacts"]] == urls[:5]
+        assert result["errors"] == [
+            {"url": "https://example.ec/broken", "error": "timeout"},
+            {"url": "https://example.ec/down", "error": "worker lost"},
+            {"url": "https://example.ec/5", "error": "worker lost"},
+        ]
+        assert result["pages_fetched"] == 5
+        assert finalized["error_count"] == 3
+        assert finalized["progress"] == {"total": 8, "completed": 5, "failed": 3}
+
+    @pytest.mark.asyncio
+    async def test_progress_counts_urls_as_they_finish(self, monkeypatch):
+        wf = ScrapeWorkflow()
+        seen = []
+
+        async def fake_execute_activity(fn, params, **kwargs):
+            if fn is ScrapeActivities.fetch_pages_batch:
+                # The second batch is slower; the first batch's URL is
+                # already counted before it returns.
+                await asyncio.sleep(0.05 if params["urls"] == ["b"] else 0)
+                seen.append(wf.progress())
+                return {"pages": [{"html": "x"} for _ in params["urls"]]}
+            return {"artifacts": [{"url": i["url"]} for i in params.get("items", [])]}
+
+        monkeypatch.setattr(
+            workflow_module.workflow, "execute_activity", fake_execute_activity
+        )
+
+        await wf.run(
+            {
+                "job_id": "j1",
+                "urls": ["a", "b"],
+                "options": {"max_concurrency": 2, "fetch_batch_size": 1},
+            }
+        )
+
+        assert seen == [
+            {"total": 2, "completed": 0, "failed": 0},
+            {"total": 2, "completed": 1, "failed": 0},
+        ]
+        assert wf.progress() == {"total": 2, "completed": 2, "failed": 0}
+
+    @pytest.mark.asyncio
+    async def test_batch_size_clamped_to_max_concurrency(self, monkeypatch):
+        batches = []
+
+        async def fake_execute_activity(fn, params, **kwargs):
+            if fn is ScrapeActivities.fetch_pages_batch:
+                batches.append(params["urls"])
+                return {"pages": [{"html": "x"} for _ in params["urls"]]}
+            return {"artifacts": [{"url": i["url"]} for i in params.get("items", [])]}
+
+        monkeypatch.setattr(
+            workflow_module.workflow, "execute_activity", fake_execute_activity
+        )
+
+        await ScrapeWorkflow().run(
+            {
+                "job_id": "j1",
+                "urls": ["a", "b", "c", "d", "e"],
+                "options": {"max_concurrency": 2, "fetch_batch_size": 5},
+            }
+        )
+
+        assert batches == [["a", "b"], ["c", "d"], ["e"]]
+
+    @pytest.mark.asyncio
+    async def test_short_fetch_result_fails_missing_urls(self, monkeypatch):
+        wf = ScrapeWorkflow()
+
+        async def fake_execute_activity(fn, params, **kwargs):
+            if fn is ScrapeActivities.fetch_pages_batch:
+                return {"pages": [{"html": "x"}]}
+            return {"artifacts": [{"url": i["url"]} for i in params.get("items", [])]}
+
+        monkeypatch.setattr(
+            workflow_module.workflow, "execute_activity", fake_execute_activity
+        )
+
+        result = await wf.run({"job_id": "j1", "urls": ["a", "b", "c"], "options": {}})
+
+        assert [a["url"] for a in result["artifacts"]] == ["a"]
+        assert result["errors"] == [
+            {"url": "b", "error": "missing_page"},
+            {"url": "c", "error": "missing_page"},
+        ]
+        assert wf.progress() == {"total": 3, "completed": 1, "failed": 2}
+
+
+class TestDedupe:
+    """Duplicate URLs are fetched once unless dedupe is disabled."""
+
+    async def _fetched_urls(self, monkeypatch, urls, options):
+        fetched = []
+
+        async def fake_execute_activity(fn, params, **kwargs):
+            if fn is ScrapeActivities.fetch_pages_batch:
+                fetched.extend(params["urls"])
+                return {"pages": [{"html": "x"} for _ in params["urls"]]}
+            return {"artifacts": [{"url": i["url"]} for i in params.get("items", [])]}
+
+        monkeypatch.setattr(
+            workflow_module.workflow, "execute_activity", fake_execute_activity
+        )
+        monkeypatch.setattr(workflow_module.workflow, "logger", logging.getLogger())
+        await ScrapeWorkflow().run({"job_id": "j1", "urls": urls, "options": options})
+        return fetched
+
+    @pytest.mark.asyncio
+    async def test_duplicates_fetched_once_in_order(self, monkeypatch):
+        fetched = await self._fetched_urls(monkeypatch, ["b", "a", "b", "c", "a"], {})
+
+        assert fetched == ["b", "a", "c"]
+
+    @pytest.mark.asyncio
+    async def test_dedupe_can_be_disabled(self, monkeypatch):
+        fetched = await self._fetched_urls(monkeypatch, ["a", "a"], {"dedupe": False})
+
+        assert fetched == ["a", "a"]
+
+
+@pytest.mark.asyncio
+async def test_empty_and_error_pages_skip_downstream_activities(monkeypatch):
+    stored = []
+    pages = {
+        "ok": {"html": "<p>ok</p>", "status_code": 200},
+        "empty": {"html": "", "status_code": 200},
+        "missing": {"html": "<h1>Not Found</h1>", "status_code": 404},
+    }
+
+    async def fake_execute_activity(fn, params, **kwargs):
+        if fn is ScrapeActivities.fetch_pages_batch:
+            return {"pages": [pages[u] for u in params["urls"]]}
+        if fn is ScrapeActivities.store_artifacts:
+            stored.extend(i["url"] for i in params["items"])
+            return {"artifacts": [{"url": i["url"]} for i in params["items"]]}
+        if fn is ScrapeActivities.finalize_job:
+            return {}
+        pytest.fail(f"unexpected activity {fn}")
+
+    monkeypatch.setattr(
+        workflow_module.workflow, "execute_activity", fake_execute_activity
+    )
+
+    result = await ScrapeWorkflow().run(
+        {"job_id": "j1", "urls": ["ok", "empty", "missing"], "options": {}}
+    )
+
+    assert stored == ["ok"]
+    assert result["errors"] == [
+        {"url": "empty", "error": "empty_html"},
+        {"url": "missing", "error": "http_status_404"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_bytes_processed_counts_encoded_bytes(monkeypatch):
+    items = []
+
+    async def fake_execute_activity(fn, params, **kwargs):
+        if fn is ScrapeActivities.fetch_pages_batch:
+            return {"pages": [{"html": "<p>Año</p>"}]}
+        if fn is ScrapeActivities.store_artifacts:
+            items.extend(params["items"])
+            return {"artifacts": [{"url": i["url"]} for i in params["items"]]}
+        return {}
+
+    monkeypatch.setattr(
+        workflow_module.workflow, "execute_activity", fake_execute_activity
+    )
+
+    result = await ScrapeWorkflow().run({"job_id": "j1", "urls": ["a"], "options": {}})
+
+    assert items[0]["bytes_processed"] == len("<p>Año</p>") + 1
+    assert result["bytes_processed"] == len("<p>Año</p>") + 1
@@ -13,8 +13,9 @@ The workflow coordinates a series of activities to:
 - Store extracted data and artifacts.
 """
 
+import asyncio
 from datetime import timedelta
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from temporalio import workflow
 
@@ -37,6 +38,14 @@ class ScrapeWorkflow:
     - It returns the raw processed results and artifacts for the Agent to interpret.
     """
 
+    def __init__(self) -> None:
+        self._progress: Dict[str, int] = {"total": 0, "completed": 0, "failed": 0}
+
+    @workflow.query
+    def progress(self) -> Dict[str, int]:
+        """Returns URL counts, updated as each URL finishes rather than at the end."""
+        return dict(self._progress)
+
     @workflow.run
     async def run(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -48,7 +57,8 @@ class ScrapeWorkflow:
                 - `urls` (List[str]): A list of URLs to scrape.
                 - `selectors` (Dict): Agent-provided CSS/XPath selectors for data extraction.
                 - `options` (Dict): Configuration for the scraping engine
-                                    (e.g., 'engine', 'timeout', 'scroll', 'ocr', 'transcribe').
+                                    (e.g., 'engine', 'timeout', 'scroll', 'ocr', 'transcribe',
+                                    'fetch_batch_size', 'max_concurrency', 'dedupe').
                 - `tenant_id` (str): Identifier of the tenant initiating the job.
 
         Returns:
@@ -67,100 +77,181 @@ class ScrapeWorkflow:
                 "List of URLs is required for scraping.", non_retryable=True
             )
 
-        # Initialize tracking variables for the workflow's progress and results.
-        pages_fetched = 0
-        bytes_processed = 0
-        artifacts = []
-        errors = []
+        # Duplicate URLs would each pay the full fetch -> store pipeline.
+        if options.get("dedupe", True):
+            unique_urls = list(dict.fromkeys(urls))
+            if len(unique_urls) != len(urls):
+                workflow.logger.info(
+                    "Deduplicated %d URLs to %d", len(urls), len(unique_urls)
+                )
+            urls = unique_urls
 
-        # Iterate through each URL to be scraped, processing them sequentially within the workflow.
-        for url in urls:
-            try:
-                # 1. Fetch Page Activity: Retrieves the content of the specified URL.
-                fetch_result = await workflow.execute_activity(
-                    ScrapeActivities.fetch_page,
+        async def _process_page(
+            url: str, fetch_result: Dict[str, Any], outcome: Dict[str, Any]
+        ) -> None:
+            """Runs extract -> OCR -> media for one fetched page into `outcome`."""
+            html = fetch_result.get("html", "")
+            outcome.update(fetched=True, bytes=len(html.encode("utf-8")))
+
+            # 2. Extract Data Activity: Parses the fetched HTML using agent-provided selectors.
+            extract_result: Dict[str, Any]
+            if selectors:
+                extract_result = await workflow.execute_activity(
+                    ScrapeActivities.extract_data,
                     {
+                        "html": html,
+                        "selectors": selectors,
                         "url": url,
-                        "engine": options.get(
-                            "engine", "playwright"
-                        ),  # e.g., 'playwright', 'httpx'.
-                        "wait_for": options.get("wait_for"),
-                        "scroll": options.get("scroll", False),
-                        "timeout": options.get("timeout", 30),
+                    },
+                    start_to_close_timeout=timedelta(minutes=1),
+                )
+            else:
+                # If no selectors are provided, return the raw HTML for the agent to process directly.
+                extract_result = {
+                    "raw_html": html,
+                    "url": url,
+                    "fetched_at": fetch_result.get("fetched_at"),
+                }
+
+            # 3. Process OCR Activity (Optional): If OCR is enabled and images are found.
+            if options.get("ocr") and extract_result.get("images"):
+                ocr_result = await workflow.execute_activity(
+                    ScrapeActivities.process_ocr,
+                    {
+                        "images": extract_result.get("images", []),
+                        "language": options.get("ocr_language", "spa+eng"),
                     },
                     start_to_close_timeout=timedelta(minutes=5),
                 )
+                extract_result["ocr_text"] = ocr_result.get("text", "")
 
-                pages_fetched += 1
-                html = fetch_result.get("html", "")
-                bytes_processed += len(html)
-
-                # 2. Extract Data Activity: Parses the fetched HTML using agent-provided selectors.
-                extract_result: Dict[str, Any]
-                if selectors:
-                    extract_result = await workflow.execute_activity(
-                        ScrapeActivities.extract_data,
-                        {
-                            "html": html,
-                            "selectors": selectors,
-                            "url": url,
-                        },
-                        start_to_close_timeout=timedelta(minutes=1),
-                    )
-                else:
-                    # If no selectors are provided, return the raw HTML for the agent to process directly.
-                    extract_result = {
-                        "raw_html": html,
-                        "url": url,
-                        "fetched_at": fetch_result.get("fetched_at"),
-                    }
-
-                # 3. Process OCR Activity (Optional): If OCR is enabled and images are found.
-                if options.get("ocr") and extract_result.get("images"):
-                    ocr_result = await workflow.execute_activity(
-                        ScrapeActivities.process_ocr,
-                        {
-                            "images": extract_result.get("images", []),
-                            "language": options.get("ocr_language", "spa+eng"),
-                        },
-                        start_to_close_timeout=timedelta(minutes=5),
-                    )
-                    extract_result["ocr_text"] = ocr_result.get("text", "")
-
-                # 4. Transcribe Media Activity (Optional): If transcription is enabled and media URLs are found.
-                if (
-                    settings.scraper_enable_transcribe
-                    and options.get("transcribe")
-                    and extract_result.get("media_urls")
-                ):
-                    media_result = await workflow.execute_activity(
-                        ScrapeActivities.transcribe_media,
-                        {
-                            "media_urls": extract_result.get("media_urls", []),
-                            "language": options.get("media_language", "es"),
-                        },
-                        start_to_close_timeout=timedelta(minutes=10),
-                    )
-                    extract_result["transcriptions"] = media_result.get(
-                        "transcriptions", []
-                    )
+            # 4. Transcribe Media Activity (Optional): If transcription is enabled and media URLs are found.
+            if (
+                settings.scraper_enable_transcribe
+                and options.get("transcribe")
+                and extract_result.get("media_urls")
+            ):
+                media_result = await workflow.execute_activity(
+                    ScrapeActivities.transcribe_media,
+                    {
+                        "media_urls": extract_result.get("media_urls", []),
+                        "language": options.get("media_language", "es"),
+                    },
+                    start_to_close_timeout=timedelta(minutes=10),
+                )
+                extract_result["transcriptions"] = media_result.get(
+                    "transcriptions", []
+                )
 
-                # 5. Store Artifact Activity: Persists the processed data/artifacts.
-                artifact = await workflow.execute_activity(
-                    ScrapeActivities.store_artifact,
+            # Stored with the rest of its fetch batch (step 5).
+            outcome["data"] = extract_result
+
+        # 1. Fetch Pages Activity: URLs are fetched in batches so one browser
+        # serves a whole batch. Batches run concurrently, bounded so at most
+        # `max_concurrency` pages are in flight at once.
+        max_concurrency = max(1, int(options.get("max_concurrency", 5)))
+        batch_size = min(
+            max(1, int(options.get("fetch_batch_size", 5))), max_concurrency
+        )
+        semaphore = asyncio.Semaphore(max(1, max_concurrency // batch_size))
+        fetch_params = {
+            # e.g., 'playwright', 'httpx'.
+            "engine": options.get("engine", "playwright"),
+            "wait_for": options.get("wait_for"),
+            "scroll": options.get("scroll", False),
+            "timeout": options.get("timeout", 30),
+        }
+
+        self._progress["total"] = len(urls)
+
+        def _finish(outcome: Dict[str, Any]) -> Dict[str, Any]:
+            self._progress["failed" if "error" in outcome else "completed"] += 1
+            return outcome
+
+        async def _after_fetch(url: str, page: Dict[str, Any]) -> Dict[str, Any]:
+            # Failed, empty or error-status pages skip the downstream activities.
+            error = page.get("error")
+            if error is None and not page.get("html"):
+                error = "empty_html"
+            elif error is None and (page.get("status_code") or 0) >= 400:
+                error = f"http_status_{page['status_code']}"
+            if error is not None:
+                return _finish({"error": {"url": url, "error": error}})
+            outcome: Dict[str, Any] = {}
+            try:
+                await _process_page(url, page, outcome)
+            except Exception as e:
+                # Collect errors for individual URLs; the other URLs continue.
+                outcome["error"] = {"url": url, "error": str(e)}
+                return _finish(outcome)
+            return outcome
+
+        async def _store_batch(
+            batch: List[str], outcomes: List[Dict[str, Any]]
+        ) -> None:
+            # 5. Store Artifacts Activity: one bulk insert per fetch batch.
+            pending = [(url, o) for url, o in zip(batch, outcomes) if "data" in o]
+            if not pending:
+                return
+            try:
+                stored = await workflow.execute_activity(
+                    ScrapeActivities.store_artifacts,
                     {
                         "job_id": job_id,
                         "tenant_id": tenant_id,
-                        "url": url,
-                        "data": extract_result,
+                        "items": [
+                            {
+                                "url": url,
+                                "data": o["data"],
+                                "bytes_processed": o["bytes"],
+                            }
+                            for url, o in pending
+                        ],
                     },
                     start_to_close_timeout=timedelta(minutes=2),
                 )
-                artifacts.append(artifact)
+                for (_, o), artifact in zip(pending, stored["artifacts"]):
+                    o["artifact"] = artifact
+            except Exception as e:
+                for url, o in pending:
+                    o["error"] = {"url": url, "error": str(e)}
+            for _, o in pending:
+                del o["data"]
+                _finish(o)
 
+        async def _run_batch(batch: List[str]) -> List[Dict[str, Any]]:
+            try:
+                async with semaphore:
+                    fetched = await workflow.execute_activity(
+                        ScrapeActivities.fetch_pages_batch,
+                        {**fetch_params, "urls": batch},
+                        start_to_close_timeout=timedelta(minutes=10),
+                    )
             except Exception as e:
-                # Log and collect errors for individual URLs, allowing the workflow to continue for other URLs.
-                errors.append({"url": url, "error": str(e)})
+                return [
+                    _finish({"error": {"url": url, "error": str(e)}}) for url in batch
+                ]
+            pages = fetched.get("pages", [])
+            outcomes = await asyncio.gather(
+                *[_after_fetch(url, page) for url, page in zip(batch, pages)]
+            )
+            # A short result must not drop URLs: count the unanswered ones as failed.
+            outcomes += [
+                _finish({"error": {"url": url, "error": "missing_page"}})
+                for url in batch[len(pages) :]
+            ]
+            await _store_batch(batch, outcomes)
+            return outcomes
+
+        batches = [urls[i : i + batch_size] for i in range(0, len(urls), batch_size)]
+        batch_outcomes = await asyncio.gather(*[_run_batch(b) for b in batches])
+        outcomes = [outcome for batch in batch_outcomes for outcome in batch]
+
+        # Results come back in input order, keeping the workflow deterministic.
+        pages_fetched = sum(1 for o in outcomes if o.get("fetched"))
+        bytes_processed = sum(o.get("bytes", 0) for o in outcomes)
+        artifacts = [o["artifact"] for o in outcomes if "artifact" in o]
+        errors = [o["error"] for o in outcomes if "error" in o]
 
         # 6. Finalize Job Activity: Updates the overall job status in the database.
         await workflow.execute_activity(
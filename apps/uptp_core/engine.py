@@ -6,7 +6,7 @@ from django.conf import settings
 from django.core.exceptions import ValidationError
 
 from apps.core.api_utils import run_async
-from apps.core.lib.temporal_client import get_temporal_client
+from apps.core.lib.temporal_client import start_workflow
 from apps.uptp_core.schemas import TemplateExecutionRequest
 
 logger = logging.getLogger(__name__)
@@ -39,18 +39,17 @@ class UPTPExecutionEngine:
             f"urn:voyant:job:{request.tenant_id}:{request.template_id}:{job_uuid}"
         )
 
-        client = run_async(get_temporal_client)
-
         if request.category == "ingestion":
             if request.template_id == "ingest.web.deep_research":
                 # Route natively to Autonomous Deep Research Loop
                 from apps.scraper.deep_research_workflow import DeepResearchWorkflow
 
                 run_async(
-                    client.start_workflow,
+                    start_workflow,
                     DeepResearchWorkflow.run,
                     {
                         "topic": request.params.get("topic"),
+                        "queries": request.params.get("queries", []),
                         "max_urls": request.params.get("max_urls", 10),
                         "tenant_id": request.tenant_id,
                         "job_id": execution_urn,
@@ -64,7 +63,7 @@ class UPTPExecutionEngine:
                 from apps.scraper.workflow import ScrapeWorkflow
 
                 run_async(
-                    client.start_workflow,
+                    start_workflow,
                     ScrapeWorkflow.run,
                     {
                         "url": request.params.get("url"),
@@ -80,7 +79,7 @@ class UPTPExecutionEngine:
                 from apps.worker.workflows.ingest_workflow import IngestDataWorkflow
 
                 run_async(
-                    client.start_workflow,
+                    start_workflow,
                     IngestDataWorkflow.run,
                     {
                         "generic_uri": request.params.get("generic_uri"),
@@ -97,7 +96,7 @@ class UPTPExecutionEngine:
             from apps.worker.workflows.sandbox_workflow import SandboxWorkflow
 
             run_async(
-                client.start_workflow,
+                start_workflow,
                 SandboxWorkflow.run,
                 {
                     "script": request.params.get("script"),
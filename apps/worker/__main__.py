@@ -4,9 +4,7 @@ Usage:
     python -m apps.worker.worker_main
 """
 
-import asyncio
-
-from .worker_main import main
+from .worker_main import run
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run()
@@ -0,0 +1,82 @@
+"""
+Data References
+
+Resolve a `data_ref` handle into records inside an activity, so workflows can
+pass a table name or file URI instead of carrying the rows through Temporal
+history.
+"""
+
+import os
+import re
+from typing import Any, Dict, List
+
+import duckdb
+from temporalio.exceptions import ApplicationError
+
+from apps.core.config import get_settings
+
+_SAFE_TABLE_NAME = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*)?$")
+_FILE_READERS = {
+    ".parquet": "read_parquet",
+    ".csv": "read_csv_auto",
+    ".json": "read_json_auto",
+}
+# Remote stores a file ref may point at; http(s) and the rest are refused.
+_REMOTE_SCHEMES = frozenset({"s3"})
+
+
+def _unsupported(data_ref: str, reason: str) -> ApplicationError:
+    return ApplicationError(
+        f"Unsupported data_ref: {data_ref!r} ({reason})", non_retryable=True
+    )
+
+
+def _file_location(data_ref: str) -> str:
+    """
+    Where DuckDB may read a file ref from.
+
+    Workflow params come from an external agent, so local paths must resolve
+    inside the data root (the DuckDB database's directory) and remote refs
+    must use an allowed scheme.
+    """
+    if "://" in data_ref:
+        if data_ref.split("://", 1)[0].lower() in _REMOTE_SCHEMES:
+            return data_ref
+        raise _unsupported(data_ref, "scheme not allowed")
+    root = os.path.realpath(os.path.dirname(get_settings().duckdb_path) or ".")
+    path = os.path.realpath(os.path.join(root, data_ref))
+    if os.path.commonpath([root, path]) != root:
+        raise _unsupported(data_ref, "outside the data root")
+    return path
+
+
+def load_records(data_ref: str) -> List[Dict[str, Any]]:
+    """
+    Load every row behind `data_ref` as a list of dicts.
+
+    A ref ending in .parquet, .csv or .json is read as a file (a path under
+    the data root, or an s3:// URI); anything else must be a table in the
+    configured DuckDB database.
+    """
+    reader = _FILE_READERS.get(os.path.splitext(data_ref)[1].lower())
+    if reader:
+        location = _file_location(data_ref)
+        conn = duckdb.connect()
+        query, args = f"SELECT * FROM {reader}(?)", [location]
+    elif _SAFE_TABLE_NAME.match(data_ref):
+        conn = duckdb.connect(database=get_settings().duckdb_path, read_only=True)
+        query, args = f"SELECT * FROM {data_ref}", []
+    else:
+        raise _unsupported(data_ref, "not a file or table name")
+    try:
+        return conn.execute(query, args).df().to_dict(orient="records")
+    finally:
+        conn.close()
+
+
+def resolve_records(params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Rows from `params["data_ref"]` when given, else inline `params["data"]`."""
+    data_ref = params.get("data_ref")
+    if data_ref:
+        return load_records(data_ref)
+    return params.get("data", [])
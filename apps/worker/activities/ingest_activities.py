@@ -8,10 +8,11 @@ import asyncio
 import logging
 import re
 from datetime import datetime, timezone
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 import duckdb
 from temporalio import activity
+from temporalio.exceptions import ApplicationError
 
 from apps.core.config import get_settings
 from apps.core.lib.circuit_breaker import CircuitBreakerOpenError
@@ -50,49 +51,22 @@ class IngestActivities:
         try:
             # Ingestion pipeline steps with regular heartbeating.
 
-            # Step 1: Fetch source configuration.
-            activity.heartbeat("Fetching source configuration")
-            await asyncio.sleep(1)
-
-            # Step 2: Determine ingestion method based on source type and mode.
+            # Step 1: Validate the requested ingestion mode.
             activity.heartbeat("Determining ingestion method")
             if mode not in ("full", "incremental"):
-                raise activity.ApplicationError(
+                raise ApplicationError(
                     f"Unsupported ingestion mode: {mode}",
                     non_retryable=True,
                 )
-            await asyncio.sleep(1)
 
-            # Step 3: Execute the core ingestion pipeline.
+            # Step 2: Execute the core ingestion pipeline. The DuckDB work
+            # runs in a thread so concurrent ingests don't block the loop.
             activity.heartbeat("Executing core ingestion logic")
+            row_count = await asyncio.to_thread(self._count_rows, source_id)
 
-            # Baseline ingestion verification via real DuckDB connectivity.
-            conn = duckdb.connect(database=self.settings.duckdb_path, read_only=True)
-            conn.close()
-
-            # Step 4: Metadata
+            # Step 3: Metadata
             activity.heartbeat("Registering lineage")
 
-            # Vibe Rule #4: Real implementations only
-            # Query actual row count from DuckDB
-            try:
-                conn = duckdb.connect(
-                    database=self.settings.duckdb_path, read_only=True
-                )
-                if not source_id or not _SAFE_IDENTIFIER.match(source_id):
-                    raise ValueError(
-                        f"Invalid source identifier for row count query: {source_id}"
-                    )
-                row_count = conn.execute(
-                    f"SELECT COUNT(*) FROM {source_id}"
-                ).fetchone()[0]
-                conn.close()
-            except Exception as count_error:
-                activity.logger.warning(
-                    f"Could not count rows in {source_id}: {count_error}"
-                )
-                row_count = 0  # Graceful degradation
-
             result = {
                 "job_id": job_id,
                 "source_id": source_id,
@@ -112,17 +86,91 @@ class IngestActivities:
             activity.logger.error(f"DuckDB error during ingestion: {e}")
             raise
         except CircuitBreakerOpenError:
-            raise activity.ApplicationError(
+            raise ApplicationError(
                 "Ingestion service circuit breaker is open", non_retryable=True
             )
         except ValueError as e:
-            raise activity.ApplicationError(
+            raise ApplicationError(
                 f"Invalid ingestion parameters: {e}", non_retryable=True
             )
         except Exception as e:
             activity.logger.error(f"Ingestion failed: {e}")
             raise
 
+    def _count_rows(self, source_id: str) -> int:
+        """
+        Row count of `source_id` in the configured DuckDB database.
+
+        One read-only connection both verifies DuckDB connectivity and serves
+        the count; a missing or invalid table degrades to zero rows.
+        """
+        conn = duckdb.connect(database=self.settings.duckdb_path, read_only=True)
+        try:
+            # Vibe Rule #4: Real implementations only
+            # Query actual row count from DuckDB
+            try:
+                if not source_id or not _SAFE_IDENTIFIER.match(source_id):
+                    raise ValueError(
+                        f"Invalid source identifier for row count query: {source_id}"
+                    )
+                return conn.execute(f"SELECT COUNT(*) FROM {source_id}").fetchone()[0]
+            except Exception as count_error:
+                activity.logger.warning(
+                    f"Could not count rows in {source_id}: {count_error}"
+                )
+                return 0  # Graceful degradation
+        finally:
+            conn.close()
+
+    @activity.defn(name="run_ingestion_batch")
+    async def run_ingestion_batch(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Ingest several sources in one activity invocation.
+
+        Params:
+            job_prefix: suffix appended to each per-source job id
+            source_ids: sources to ingest
+            mode: "full" or "incremental"
+            max_parallel: sources ingested at once (default 8)
+
+        Returns one run_ingestion result per source, in source order. A source
+        that fails with a non-retryable error (bad mode or identifier, open
+        circuit breaker) gets a "failed" entry instead of failing the batch;
+        any other error fails the activity so Temporal retries it. Heartbeats
+        once per finished source.
+        """
+        job_prefix = params.get("job_prefix", "")
+        mode = params.get("mode", "full")
+        # Bound the fan-out so a long competitor list doesn't open a
+        # connection per source against the same backend at once.
+        limit = asyncio.Semaphore(max(1, int(params.get("max_parallel", 8))))
+        source_ids = params.get("source_ids", [])
+        finished = 0
+
+        async def ingest(source_id: str) -> Dict[str, Any]:
+            nonlocal finished
+            job_id = f"ingest_{source_id}_{job_prefix}"
+            async with limit:
+                try:
+                    result = await self.run_ingestion(
+                        {"job_id": job_id, "source_id": source_id, "mode": mode}
+                    )
+                except ApplicationError as e:
+                    if not e.non_retryable:
+                        raise
+                    activity.logger.warning(f"Ingestion of {source_id} failed: {e}")
+                    result = {
+                        "job_id": job_id,
+                        "source_id": source_id,
+                        "status": "failed",
+                        "error": str(e),
+                    }
+            finished += 1
+            activity.heartbeat(f"{finished}/{len(source_ids)} sources ingested")
+            return result
+
+        return list(await asyncio.gather(*(ingest(s) for s in source_ids)))
+
     @activity.defn(name="sync_airbyte")
     async def sync_airbyte(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -163,7 +211,7 @@ class IngestActivities:
                 )
 
             if not connection_id:
-                raise activity.ApplicationError(
+                raise ApplicationError(
                     "connection_id or generic_uri is exclusively required",
                     non_retryable=True,
                 )
@@ -201,14 +249,15 @@ class IngestActivities:
 
         except CircuitBreakerOpenError:
             activity.logger.error("Airbyte circuit breaker is OPEN")
-            raise activity.ApplicationError(
+            raise ApplicationError(
                 "Airbyte service circuit breaker is open - service unavailable",
                 non_retryable=True,
             )
         except TimeoutError as e:
             activity.logger.error(f"Airbyte sync timed out: {e}")
-            raise activity.ApplicationError(
-                f"Airbyte sync timed out: {e}", non_retryable=False  # Retry may succeed
+            raise ApplicationError(
+                f"Airbyte sync timed out: {e}",
+                non_retryable=False,  # Retry may succeed
             )
         except Exception as e:
             activity.logger.error(f"Airbyte sync failed: {e}")
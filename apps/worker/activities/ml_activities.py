@@ -2,26 +2,28 @@
 Machine Learning Activities: Building Blocks for ML Workflows.
 
 This module defines Temporal activities that execute various machine learning
-and forecasting operations. These activities leverage specialized ML primitives
-to perform tasks such as data clustering, model training for classification
-and regression, and time series forecasting.
+operations. These activities leverage specialized ML primitives to perform
+tasks such as data clustering and model training for classification and
+regression. Time series forecasting lives in OperationalActivities.
 """
 
 import logging
 from typing import Any, Dict
 
+import pandas as pd
 from temporalio import activity
+from temporalio.exceptions import ApplicationError
 
-from apps.analysis.lib.forecast_primitives import ForecastPrimitives
 from apps.analysis.lib.ml_primitives import MLPrimitives
 from apps.core.lib.errors import AnalysisError
+from apps.worker.activities.data_refs import resolve_records
 
 logger = logging.getLogger(__name__)
 
 
 class MLActivities:
     """
-    A collection of Temporal activities related to machine learning and forecasting.
+    A collection of Temporal activities related to machine learning.
 
     These activities encapsulate the logic for common ML tasks, making them
     orchestrable within Temporal workflows.
@@ -29,10 +31,9 @@ class MLActivities:
 
     def __init__(self):
         """
-        Initializes the MLActivities with instances of MLPrimitives and ForecastPrimitives.
+        Initializes the MLActivities with an instance of MLPrimitives.
         """
         self.ml = MLPrimitives()
-        self.forecast = ForecastPrimitives()
 
     @activity.defn(name="cluster_data")
     def cluster_data(self, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -42,6 +43,7 @@ class MLActivities:
         Args:
             params: A dictionary containing clustering parameters:
                 - `data` (List[Dict[str, float]]): The input data for clustering.
+                - `data_ref` (str, optional): Table or file URI to load `data` from instead.
                 - `clusters` (int, optional): The number of clusters to form. Defaults to 3.
 
         Returns:
@@ -55,11 +57,11 @@ class MLActivities:
         PhD Analyst: Clustering complexity is O(n*k*i) where n=samples, k=clusters, i=iterations.
         """
         try:
-            data = params.get("data", [])
+            data = resolve_records(params)
             n_clusters = params.get("clusters", 3)
 
             if not data:
-                raise activity.ApplicationError(
+                raise ApplicationError(
                     "No data provided for clustering activity.", non_retryable=True
                 )
 
@@ -68,20 +70,67 @@ class MLActivities:
             )
             return self.ml.cluster_kmeans(data, n_clusters)
 
+        except ApplicationError:
+            raise
         except AnalysisError as e:
             activity.logger.error(f"Clustering failed: {e}")
-            raise activity.ApplicationError(
+            raise ApplicationError(
                 f"Data clustering failed: {e}", non_retryable=True
             ) from e
         except Exception as e:
             activity.logger.error(
                 f"An unexpected error occurred during clustering: {e}"
             )
-            raise activity.ApplicationError(
+            raise ApplicationError(
                 f"Data clustering failed due to unexpected error: {e}",
                 non_retryable=False,
             ) from e
 
+    @activity.defn(name="summarize_clusters")
+    def summarize_clusters(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Builds per-segment size and average feature profiles from cluster assignments.
+
+        Args:
+            params: A dictionary containing:
+                - `data` (List[Dict[str, float]]): The records that were clustered.
+                - `data_ref` (str, optional): Table or file URI to load `data` from instead.
+                - `clusters` (List[int]): The cluster assignment for each record.
+                - `n_segments` (int, optional): Cluster ids to report. Defaults to 3.
+
+        Returns:
+            A dictionary keyed by `segment_<id>` with `size`, `percentage` and
+            `average_profile` for every non-empty segment. Each profile averages
+            the features present on the segment's first record.
+        """
+        data = resolve_records(params)
+        clusters = params.get("clusters", [])
+        n_segments = params.get("n_segments", 3)
+        if not data or not clusters:
+            return {}
+
+        df = pd.DataFrame(data[: len(clusters)])
+        df["_c"] = clusters[: len(df)]
+        grouped = df.groupby("_c", sort=True)
+        means = grouped.mean(numeric_only=True)
+        sizes = grouped.size()
+        first_rows = grouped.head(1).index
+
+        profiles = {}
+        for row in first_rows:
+            cluster_id = clusters[row]
+            if not 0 <= cluster_id < n_segments:
+                continue
+            size = int(sizes[cluster_id])
+            profiles[cluster_id] = {
+                "size": size,
+                "percentage": size / len(data) * 100,
+                "average_profile": {
+                    key: float(means.at[cluster_id, key]) for key in data[row]
+                },
+            }
+        return {f"segment_{cid}": profiles[cid] for cid in sorted(profiles)}
+
     @activity.defn(name="train_classifier_model")
     def train_classifier_model(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -90,6 +139,7 @@ class MLActivities:
         Args:
             params: A dictionary containing classification model training parameters:
                 - `data` (List[Dict[str, Any]]): The input training data.
+                - `data_ref` (str, optional): Table or file URI to load `data` from instead.
                 - `target_col` (str): The name of the target (dependent) variable column.
                 - `feature_cols` (List[str]): A list of feature (independent) variable column names.
 
@@ -102,12 +152,12 @@ class MLActivities:
         QA Engineer: Heartbeats are essential to prevent Temporal timeouts during long training sessions.
         """
         try:
-            data = params.get("data", [])
+            data = resolve_records(params)
             target = params.get("target_col", "target")
             features = params.get("feature_cols", [])
 
             if not data:
-                raise activity.ApplicationError(
+                raise ApplicationError(
                     "No data provided for classification model training.",
                     non_retryable=True,
                 )
@@ -118,75 +168,22 @@ class MLActivities:
             )
             return self.ml.train_classifier(data, target, features)
 
+        except ApplicationError:
+            raise
         except AnalysisError as e:
             activity.logger.error(f"Classification model training failed: {e}")
-            raise activity.ApplicationError(
+            raise ApplicationError(
                 f"Classification model training failed: {e}", non_retryable=True
             ) from e
         except Exception as e:
             activity.logger.error(
                 f"An unexpected error occurred during classification model training: {e}"
             )
-            raise activity.ApplicationError(
+            raise ApplicationError(
                 f"Classification model training failed due to unexpected error: {e}",
                 non_retryable=False,
             ) from e
 
-    @activity.defn(name="forecast_time_series")
-    def forecast_time_series(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Generates a time series forecast using algorithms like Prophet or EMA.
-
-        Args:
-            params: A dictionary containing forecasting parameters:
-                - `dates` (List[str]): A list of ISO 8601 date strings for historical data.
-                - `values` (List[float]): A list of corresponding numerical values for historical data.
-                - `periods` (int, optional): The number of future periods to forecast. Defaults to 30.
-                - `method` (str, optional): The forecasting method (e.g., "prophet", "ema").
-                - `confidence_level` (float, optional): The confidence level for prediction intervals.
-
-        Returns:
-            A dictionary containing the forecast results, including predicted values
-            and confidence intervals.
-
-        Raises:
-            activity.ApplicationError: If dates/values are missing or forecasting fails.
-
-        Performance Engineer: Prophet models can be computationally intensive; activity has a 15-minute timeout.
-        """
-        try:
-            dates = params.get("dates", [])
-            values = params.get("values", [])
-            periods = params.get("periods", 30)
-
-            if not dates or not values:
-                raise activity.ApplicationError(
-                    "Dates and values are required for time series forecasting.",
-                    non_retryable=True,
-                )
-
-            activity.heartbeat(f"Forecasting {periods} periods.")
-            activity.logger.info(
-                f"Forecasting {periods} periods with method: {params.get('method', 'default')}."
-            )
-            return self.forecast.forecast_prophet(
-                dates, values, periods
-            )  # Assuming Prophet for now, but method can be dynamic.
-
-        except AnalysisError as e:
-            activity.logger.error(f"Time series forecasting failed: {e}")
-            raise activity.ApplicationError(
-                f"Time series forecasting failed: {e}", non_retryable=True
-            ) from e
-        except Exception as e:
-            activity.logger.error(
-                f"An unexpected error occurred during time series forecasting: {e}"
-            )
-            raise activity.ApplicationError(
-                f"Time series forecasting failed due to unexpected error: {e}",
-                non_retryable=False,
-            ) from e
-
     @activity.defn(name="train_regression_model")
     def train_regression_model(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -195,11 +192,13 @@ class MLActivities:
         Args:
             params: A dictionary containing regression model training parameters:
                 - `data` (List[Dict[str, float]]): The input training data.
+                - `data_ref` (str, optional): Table or file URI to load `data` from instead.
                 - `target_col` (str): The name of the target (dependent) variable column.
                 - `feature_cols` (List[str]): A list of feature (independent) variable column names.
 
         Returns:
-            A dictionary containing the trained model's coefficients, intercept, and metrics like R-squared.
+            A dictionary containing the trained model's coefficients, intercept, and metrics like R-squared,
+            plus a formatted `equation` and a qualitative `quality` rating.
 
         Raises:
             activity.ApplicationError: If no data is provided or regression training fails.
@@ -207,12 +206,12 @@ class MLActivities:
         It ensures proper error handling for invalid inputs and robust model training.
         """
         try:
-            data = params.get("data", [])
+            data = resolve_records(params)
             target = params.get("target_col", "target")
             features = params.get("feature_cols", [])
 
             if not data:
-                raise activity.ApplicationError(
+                raise ApplicationError(
                     "No data provided for regression model training.",
                     non_retryable=True,
                 )
@@ -221,18 +220,66 @@ class MLActivities:
             activity.logger.info(
                 f"Training regression on {len(data)} records for target '{target}'."
             )
-            return self.ml.train_regression(data, target, features)
+            result = self.ml.train_regression(data, target, features)
+            result["equation"] = self._format_equation(result)
+            result["quality"] = self._interpret_r2(result.get("r2_score", 0))
+            return result
 
+        except ApplicationError:
+            raise
         except AnalysisError as e:
             activity.logger.error(f"Regression model training failed: {e}")
-            raise activity.ApplicationError(
+            raise ApplicationError(
                 f"Regression model training failed: {e}", non_retryable=True
             ) from e
         except Exception as e:
             activity.logger.error(
                 f"An unexpected error occurred during regression model training: {e}"
             )
-            raise activity.ApplicationError(
+            raise ApplicationError(
                 f"Regression model training failed due to unexpected error: {e}",
                 non_retryable=False,
             ) from e
+
+    @staticmethod
+    def _format_equation(result: Dict[str, Any]) -> str:
+        """
+        Formats the regression model's coefficients into a human-readable equation string.
+
+        Args:
+            result: The raw results dictionary from MLPrimitives.train_regression.
+
+        Returns:
+            A string representing the regression equation (e.g., "y = 1.23 + 0.45*x1 - 0.12*x2").
+        """
+        target = result.get("target", "y")
+        intercept = result.get("intercept", 0)
+        coefs = result.get("coefficients", [])
+        features = result.get("features", [])
+
+        terms = [f"{intercept:.2f}"]
+        for feat, coef in zip(features, coefs):
+            sign = "+" if coef >= 0 else "-"
+            terms.append(f"{sign} {abs(coef):.2f}*{feat}")
+
+        return f"{target} = " + " ".join(terms)
+
+    @staticmethod
+    def _interpret_r2(r2: float) -> str:
+        """
+        Interprets the R-squared score qualitatively.
+
+        Args:
+            r2: The R-squared value of the regression model (0.0 to 1.0).
+
+        Returns:
+            A qualitative assessment string (e.g., "excellent", "good", "poor").
+        """
+        if r2 >= 0.9:
+            return "excellent"
+        elif r2 >= 0.7:
+            return "good"
+        elif r2 >= 0.5:
+            return "moderate"
+        else:
+            return "poor"
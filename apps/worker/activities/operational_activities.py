@@ -11,15 +11,18 @@ quality checks, anomaly monitoring, and predictive analytics.
 """
 
 import logging
-from typing import Any, Dict, List
+from collections import Counter
+from typing import Any, Dict
 
 from temporalio import activity
+from temporalio.exceptions import ApplicationError
 
 from apps.analysis.lib.cleaning_primitives import DataCleaningPrimitives
 from apps.analysis.lib.forecast_primitives import PROPHET_AVAILABLE, ForecastPrimitives
 from apps.analysis.lib.forecasting import forecast
 from apps.analysis.lib.ml_primitives import MLPrimitives
 from apps.analysis.lib.nlp_primitives import NLPPrimitives
+from apps.worker.activities.data_refs import resolve_records
 
 logger = logging.getLogger(__name__)
 
@@ -50,13 +53,14 @@ class OperationalActivities:
         Args:
             params: A dictionary containing cleaning parameters:
                 - `data` (List[Dict]): The raw input data (list of dictionaries).
+                - `data_ref` (str, optional): Table or file URI to load `data` from instead.
                 - `strategies` (Dict): A dictionary specifying cleaning strategies
                                      (e.g., for missing values, outliers).
 
         Returns:
             A dictionary containing the cleaned data and a report of cleaning actions.
         """
-        data = params.get("data", [])
+        data = resolve_records(params)
         strategies = params.get("strategies", {})
 
         activity.logger.info(
@@ -73,13 +77,14 @@ class OperationalActivities:
         Args:
             params: A dictionary containing anomaly detection parameters:
                 - `data` (List[Dict]): The input data for anomaly detection.
+                - `data_ref` (str, optional): Table or file URI to load `data` from instead.
                 - `contamination` (float, optional): The expected proportion of outliers in the data. Defaults to 0.05.
 
         Returns:
             A dictionary containing the results of the anomaly detection,
             typically including anomaly scores and labels for each data point.
         """
-        data = params.get("data", [])
+        data = resolve_records(params)
         contamination = params.get("contamination", 0.05)
 
         activity.logger.info(
@@ -89,7 +94,7 @@ class OperationalActivities:
         return self.ml.detect_anomalies(data, contamination)
 
     @activity.defn(name="analyze_sentiment_batch")
-    def analyze_sentiment_batch(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def analyze_sentiment_batch(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
         Analyzes the sentiment of a batch of text inputs.
 
@@ -98,13 +103,21 @@ class OperationalActivities:
                 - `texts` (List[str]): A list of text strings to analyze.
 
         Returns:
-            A list of dictionaries, each containing the sentiment analysis
-            result for a corresponding text input.
+            A dictionary with the `total` number of texts, a `breakdown` of
+            positive/negative/neutral counts, and the per-text `details`.
         """
         texts = params.get("texts", [])
         activity.logger.info(f"Analyzing sentiment for {len(texts)} texts.")
         # Delegates to NLPPrimitives for the actual sentiment analysis logic.
-        return self.nlp.analyze_sentiment(texts)
+        results = self.nlp.analyze_sentiment(texts)
+        counts = Counter(r["sentiment"] for r in results)
+        return {
+            "total": len(results),
+            "breakdown": {
+                label: counts[label] for label in ("positive", "negative", "neutral")
+            },
+            "details": results,
+        }
 
     @activity.defn(name="fix_data_quality")
     def fix_data_quality(self, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -119,6 +132,7 @@ class OperationalActivities:
         Args:
             params: A dictionary containing data quality fixing parameters:
                 - `data` (List[Dict]): The records to clean.
+                - `data_ref` (str, optional): Table or file URI to load `data` from instead.
                 - `numeric_columns` (List[str]): Names of numeric columns.
                 - `categorical_columns` (List[str]): Names of categorical columns.
                 - `imputation_strategy` (str, optional): Strategy for missing values
@@ -133,7 +147,7 @@ class OperationalActivities:
         It leverages statistical methods for imputation and outlier treatment, and is
         optimized for efficient in-memory operations on datasets.
         """
-        data = params.get("data", [])
+        data = resolve_records(params)
 
         # Configure cleaning strategies based on parameters.
         strategies = {
@@ -239,7 +253,7 @@ class OperationalActivities:
         activity.logger.info(f"Forecasting {periods} periods using method: '{method}'.")
 
         if not values:
-            raise activity.ApplicationError(
+            raise ApplicationError(
                 "No values provided for forecasting activity.", non_retryable=True
             )
 
@@ -274,6 +288,6 @@ class OperationalActivities:
             activity.logger.error(
                 f"Forecasting activity failed with method '{method}': {e}"
             )
-            raise activity.ApplicationError(
+            raise ApplicationError(
                 f"Forecasting failed: {e}", non_retryable=True
             ) from e
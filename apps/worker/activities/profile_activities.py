@@ -8,16 +8,21 @@ effectively even on large datasets.
 """
 
 import logging
+import re
+from datetime import datetime, timezone
 from typing import Any, Dict
 
 import duckdb
-import pandas as pd
 from temporalio import activity
+from temporalio.exceptions import ApplicationError
 
 from apps.analysis.lib.adaptive_sampling import SamplingStrategy, sample_table
 from apps.core.config import get_settings
 
 logger = logging.getLogger(__name__)
+# Table names are interpolated into SQL, so only plain (optionally
+# schema-qualified) identifiers are accepted.
+_SAFE_TABLE_NAME = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*)?$")
 
 
 class ProfileActivities:
@@ -54,7 +59,7 @@ class ProfileActivities:
             row counts, and sampling details.
 
         Raises:
-            activity.ApplicationError: If an error occurs during data fetching or profiling.
+            ApplicationError: If an error occurs during data fetching or profiling.
         """
         source_id = params.get("source_id")
         table_name = params.get("table") or source_id
@@ -64,6 +69,12 @@ class ProfileActivities:
             f"Profiling '{table_name}' (target sample size: {requested_sample_size} rows)."
         )
 
+        if not table_name or not _SAFE_TABLE_NAME.match(table_name):
+            raise ApplicationError(
+                f"Invalid table name for profiling: {table_name!r}", non_retryable=True
+            )
+
+        conn = None
         try:
             # 1. Connect to DuckDB and determine total row count.
             conn = duckdb.connect(database=self.settings.duckdb_path, read_only=True)
@@ -88,23 +99,22 @@ class ProfileActivities:
                     f"Fetching full dataset (total rows: {total_rows}) as it's within limits."
                 )
 
-            # Fetch data into a Pandas DataFrame, then convert to list of dicts for generic processing.
+            # Fetch data into a Pandas DataFrame. DuckDB builds the columns
+            # natively, so the frame is never boxed into per-row dicts.
             df = conn.execute(query).df()
-            conn.close()
-            data_list = df.to_dict(orient="records")
 
             # 3. Apply Python-side Adaptive Sampling (refines SQL sample or entire small dataset).
-            # This ensures the final sample adheres to the requested size and strategy (e.g., stratified).
+            # The strategy picks row positions, which are then taken from the frame.
             sample_result = sample_table(
-                data=data_list,
+                data=list(range(len(df))),
                 sample_size=requested_sample_size,
                 strategy=SamplingStrategy.ADAPTIVE,
             )
-            sampled_data = sample_result.data
+            sample_df = df.take(sample_result.data)
             sampling_stats = sample_result.stats
 
             activity.logger.info(
-                f"Obtained final sample of {len(sampled_data)} records using {sampling_stats.strategy} strategy."
+                f"Obtained final sample of {len(sample_df)} records using {sampling_stats.strategy} strategy."
             )
 
             # 4. Generate Profile Summary (Lightweight, manual profiling).
@@ -112,13 +122,12 @@ class ProfileActivities:
             # this implementation provides a lighter, custom profile summary.
             profile_summary = {
                 "columns": {},
-                "rows_analyzed": len(sampled_data),
+                "rows_analyzed": len(sample_df),
                 "total_rows_estimated": total_rows,
                 "sampling_stats": sampling_stats.to_dict(),
             }
 
-            if sampled_data:
-                sample_df = pd.DataFrame(sampled_data)
+            if not sample_df.empty:
                 descriptive_stats = sample_df.describe(include="all").to_dict()
                 null_counts = sample_df.isnull().sum().to_dict()
 
@@ -135,11 +144,16 @@ class ProfileActivities:
                 "source_id": source_id,
                 "table": table_name,
                 "profile": profile_summary,
-                "generated_at": pd.Timestamp.now().isoformat() + "Z",
+                "generated_at": datetime.now(timezone.utc)
+                .isoformat(timespec="seconds")
+                .replace("+00:00", "Z"),
             }
 
         except Exception as e:
             activity.logger.error(f"Profiling activity for '{table_name}' failed: {e}")
-            raise activity.ApplicationError(
+            raise ApplicationError(
                 f"Profiling failed due to an unexpected error: {e}", non_retryable=False
             ) from e
+        finally:
+            if conn is not None:
+                conn.close()
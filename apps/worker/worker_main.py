@@ -24,6 +24,7 @@ from apps.core.lib.interceptors import MetricsInterceptor
 from apps.core.lib.monitoring import MetricsRegistry
 from apps.core.lib.temporal_client import get_temporal_client
 from apps.scraper.deep_research_workflow import DeepResearchWorkflow
+from apps.scraper.parsing.ocr_processor import shutdown_ocr_pools
 from apps.scraper.search_activities import SearchActivities
 
 # DataScraper Module
@@ -64,6 +65,23 @@ logging.basicConfig(
 )
 logger = logging.getLogger("voyant.worker")
 
+# Activity classes served in full mode, alongside the DataScraper ones.
+ACTIVITY_CLASSES = (
+    IngestActivities,
+    ProfileActivities,
+    AnalysisActivities,
+    GenerationActivities,
+    KPIActivities,
+    QualityActivities,
+    StatsActivities,
+    MLActivities,
+    DiscoveryActivities,
+    OperationalActivities,
+    SearchActivities,
+    StreamingActivities,  # Flink Integration (FR-21)
+    SandboxActivities,
+)
+
 
 def _setup_django() -> None:
     """
@@ -85,61 +103,131 @@ def _setup_django() -> None:
         )
 
 
-async def run_worker():
+def _activity_limits(settings) -> tuple[int, int]:
     """
-    Runs the Temporal worker process.
+    Size the activity thread pool and the number of activities run at once.
+
+    Full mode is dominated by synchronous, CPU-bound analytics (pandas, R,
+    ML), so by default the worker only claims as many activities as it has
+    threads; extra tasks stay on the queue for other workers instead of
+    waiting in this one's executor with their timeouts running. Scraper mode
+    is mostly async network fetches, which don't occupy a thread, so it keeps
+    Temporal's default limit.
+    """
+    cpu_count = os.cpu_count() or 2
+    max_workers = (
+        settings.temporal_activity_max_workers
+        if settings.temporal_activity_max_workers
+        and settings.temporal_activity_max_workers > 0
+        else min(32, cpu_count * 5)
+    )
+    if settings.temporal_max_concurrent_activities > 0:
+        max_concurrent = settings.temporal_max_concurrent_activities
+    elif settings.worker_mode == "scraper":
+        max_concurrent = 100
+    else:
+        max_concurrent = max_workers
+    return max_workers, max_concurrent
 
-    This function performs the following steps:
-    1.  Initializes a Prometheus metrics server for observability.
-    2.  Establishes a connection to the Temporal cluster.
-    3.  Registers all application workflows and activities with the worker.
-    4.  Configures signal handlers for graceful shutdown.
-    5.  Starts the worker to poll tasks from the configured task queue.
 
-    Raises:
-        Exception: If the worker fails to connect to Temporal or crashes during execution.
+def _workflow_task_limit(settings) -> int:
     """
-    settings = get_settings()
-    logger.info("Worker mode: %s", settings.worker_mode)
+    Number of workflow tasks processed at once.
 
-    _setup_django()
+    Workflow tasks are short deterministic replays, but they share the
+    process's CPU with synchronous activities; a small container gets a
+    proportionally smaller share instead of the SDK's flat 100.
+    """
+    if settings.temporal_max_concurrent_workflow_tasks > 0:
+        return settings.temporal_max_concurrent_workflow_tasks
+    return min(100, (os.cpu_count() or 2) * 8)
 
-    # 0. Start Metrics Server for Prometheus exposition.
-    metrics = MetricsRegistry()
-    metrics.start_server(port=9090)
 
-    # 1. Connect to the Temporal Cluster.
+# Read by OpenMP, OpenBLAS and MKL when each library is first loaded.
+_NATIVE_THREAD_VARS = ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS")
+
+
+def _limit_native_threads(settings) -> None:
+    """
+    Cap BLAS/OpenMP threads so parallel activities don't oversubscribe cores.
+
+    Each activity thread running numpy or scikit-learn would otherwise start
+    its own pool of one native thread per core. In full mode the cores are
+    split across the activity threads by exporting the thread-count variables,
+    which libraries loaded later (scikit-learn is imported lazily) pick up;
+    `_cap_native_threads` applies the same cap to those already loaded. An
+    explicit OMP_NUM_THREADS in the environment is left alone.
+    """
+    if settings.worker_mode == "scraper" or "OMP_NUM_THREADS" in os.environ:
+        return
+    max_workers, _ = _activity_limits(settings)
+    limit = str(max(1, (os.cpu_count() or 2) // max_workers))
+    for var in _NATIVE_THREAD_VARS:
+        os.environ.setdefault(var, limit)
+
+
+def _cap_native_threads() -> None:
+    """
+    Activity executor initializer: apply OMP_NUM_THREADS in this thread.
+
+    OpenMP limits are per thread and already-loaded BLAS libraries ignore the
+    environment, so the cap is set through threadpoolctl in every activity
+    thread as it starts.
+    """
     try:
-        client = await get_temporal_client()
-    except Exception as e:
-        logger.critical(f"Failed to connect to Temporal cluster: {e}")
+        limit = int(os.environ.get("OMP_NUM_THREADS", ""))
+        from threadpoolctl import threadpool_limits
+    except (ValueError, ImportError):
         return
+    threadpool_limits(limit)
+
+
+def _activity_executor(max_workers: int) -> ThreadPoolExecutor:
+    """Thread pool for synchronous activities, with native threads capped."""
+    return ThreadPoolExecutor(
+        max_workers=max_workers,
+        thread_name_prefix="voyant-activity",
+        initializer=_cap_native_threads,
+    )
+
+
+def _activity_methods(*instances) -> list:
+    """
+    Bound @activity.defn methods of each instance, in definition order.
+
+    Walking the classes registers a new activity as soon as it is decorated,
+    instead of also needing an entry in a hand-kept list.
+    """
+    return [
+        getattr(instance, name)
+        for instance in instances
+        for name, member in vars(type(instance)).items()
+        if hasattr(member, "__temporal_activity_definition")
+    ]
+
+
+def build_registrations(settings) -> tuple[list, list]:
+    """
+    Instantiate the workflows and activities this worker mode registers.
+
+    Called once per process, before the event loop starts, so the imports and
+    activity constructors it triggers are not paid on the loop or again when
+    the worker is restarted.
+    """
+    from apps.scraper.activities import (
+        FetchActivities,
+        ParseActivities,
+        StorageActivities,
+    )
+
+    scraper_classes = (FetchActivities, ParseActivities, StorageActivities)
 
-    # 2. Define and Register Workflows and Activities.
     # Temporal validates workflows in a sandbox. Some optional modules used by
     # non-scraper workflows can violate sandbox restrictions at import-time.
     # We support a dedicated "scraper" mode to run scraping workflows/tools reliably.
     if settings.worker_mode == "scraper":
-        from apps.scraper.activities import (
-            FetchActivities,
-            ParseActivities,
-            StorageActivities,
-        )
-
-        _fetch = FetchActivities()
-        _parse = ParseActivities()
-        _store = StorageActivities()
         workflows = [ScrapeWorkflow]
-        activities = [
-            _fetch.fetch_page,
-            _fetch.deep_archive,
-            _parse.extract_data,
-            _parse.process_ocr,
-            _parse.transcribe_media,
-            _parse.parse_pdf,
-            _store.store_artifact,
-            _store.finalize_job,
-        ]
+        activity_classes = scraper_classes
     else:
         workflows = [
             IngestDataWorkflow,
@@ -158,61 +246,79 @@ async def run_worker():
             StreamingJobWorkflow,  # Flink Integration (FR-21)
             SandboxWorkflow,
         ]
-        activities = [
-            IngestActivities().run_ingestion,
-            IngestActivities().sync_airbyte,
-            ProfileActivities().profile_data,
-            AnalysisActivities().fetch_sample,
-            AnalysisActivities().run_analyzers,
-            GenerationActivities().run_generators,
-            KPIActivities().run_kpis,
-            QualityActivities().fetch_sample,
-            QualityActivities().run_quality_checks,
-            StatsActivities().calculate_market_share,
-            StatsActivities().perform_hypothesis_test,
-            StatsActivities().describe_distribution,
-            StatsActivities().calculate_correlation,
-            StatsActivities().fit_distribution,
-            MLActivities().cluster_data,
-            MLActivities().train_classifier_model,
-            MLActivities().forecast_time_series,
-            MLActivities().train_regression_model,
-            DiscoveryActivities().search_for_apis,
-            DiscoveryActivities().scan_spec_url,
-            OperationalActivities().detect_anomalies,
-            OperationalActivities().analyze_sentiment_batch,
-            OperationalActivities().fix_data_quality,
-            OperationalActivities().clean_data,
-            # DataScraper activities — registered per domain class (Rule-245 split)
-            FetchActivities().fetch_page,
-            FetchActivities().deep_archive,
-            ParseActivities().extract_data,
-            ParseActivities().process_ocr,
-            ParseActivities().transcribe_media,
-            ParseActivities().parse_pdf,
-            StorageActivities().store_artifact,
-            StorageActivities().finalize_job,
-            SearchActivities().execute_searxng_query,
-            # Streaming activities (Flink - FR-21)
-            StreamingActivities().get_cluster_overview,
-            StreamingActivities().list_running_jobs,
-            StreamingActivities().submit_streaming_job,
-            SandboxActivities().run_python_sandbox,
-        ]
+        # DataScraper activities are registered per domain class (Rule-245 split).
+        activity_classes = ACTIVITY_CLASSES + scraper_classes
+
+    # One instance per class: several constructors build clients (R engine,
+    # ML primitives, search) that every method of the class can share.
+    activities = _activity_methods(*(cls() for cls in activity_classes))
+    return workflows, activities
+
+
+async def _run_until_stopped(worker, stop_event: asyncio.Event) -> None:
+    """
+    Run the worker until it exits on its own or stop_event is set.
+
+    Whichever completes first drives teardown: a requested stop drains the
+    worker through worker.shutdown(), while an error from worker.run()
+    propagates to the caller.
+    """
+    worker_task = asyncio.create_task(worker.run())
+    stop_task = asyncio.create_task(stop_event.wait())
+    try:
+        done, _ = await asyncio.wait(
+            {worker_task, stop_task}, return_when=asyncio.FIRST_COMPLETED
+        )
+        if stop_task in done:
+            await worker.shutdown()
+        await worker_task
+    finally:
+        stop_task.cancel()
+        worker_task.cancel()
+
+
+async def run_worker(workflows=None, activities=None):
+    """
+    Runs the Temporal worker process.
+
+    This function performs the following steps:
+    1.  Initializes a Prometheus metrics server for observability.
+    2.  Establishes a connection to the Temporal cluster.
+    3.  Registers the given workflows and activities with the worker, building
+        them for the configured mode if none are passed.
+    4.  Configures signal handlers for graceful shutdown.
+    5.  Starts the worker to poll tasks from the configured task queue.
+
+    Raises:
+        Exception: If the worker fails to connect to Temporal or crashes during execution.
+    """
+    settings = get_settings()
+    logger.info("Worker mode: %s", settings.worker_mode)
+
+    _setup_django()
+
+    # 0. Start Metrics Server for Prometheus exposition.
+    metrics = MetricsRegistry()
+    metrics.start_server(port=9090)
+
+    # 1. Connect to the Temporal Cluster.
+    try:
+        client = await get_temporal_client()
+    except Exception as e:
+        logger.critical(f"Failed to connect to Temporal cluster: {e}")
+        return
+
+    # 2. Define and Register Workflows and Activities.
+    if workflows is None or activities is None:
+        workflows, activities = build_registrations(settings)
 
     task_queue = settings.temporal_task_queue
     logger.info(f"Starting worker and listening on task queue: {task_queue}")
 
     # Temporal Python requires an activity executor when any registered activity is synchronous.
     # We use a thread pool sized from config (or derived from CPU) to keep this production-safe.
-    cpu_count = os.cpu_count() or 2
-    max_workers = (
-        settings.temporal_activity_max_workers
-        if settings.temporal_activity_max_workers
-        and settings.temporal_activity_max_workers > 0
-        else min(32, cpu_count * 5)
-    )
-    activity_executor = ThreadPoolExecutor(max_workers=max_workers)
+    max_workers, max_concurrent_activities = _activity_limits(settings)
+    activity_executor = _activity_executor(max_workers)
 
     # 3. Create the Temporal Worker instance.
     worker = Worker(
@@ -221,6 +327,9 @@ async def run_worker():
         workflows=workflows,
         activities=activities,
         activity_executor=activity_executor,
+        max_concurrent_activities=max_concurrent_activities,
+        max_concurrent_workflow_tasks=_workflow_task_limit(settings),
+        disable_eager_activity_execution=settings.temporal_disable_eager_activities,
         interceptors=[
             MetricsInterceptor()
         ],  # Interceptors for cross-cutting concerns like metrics.
@@ -240,17 +349,20 @@ async def run_worker():
 
     # 5. Run the Worker, awaiting its completion or a shutdown signal.
     try:
-        await worker.run()
+        await _run_until_stopped(worker, stop_event)
     except asyncio.CancelledError:
         logger.info("Temporal worker run was cancelled (e.g., via shutdown signal).")
     except Exception as e:
         logger.critical(f"Temporal worker crashed unexpectedly: {e}", exc_info=True)
     finally:
         logger.info("Temporal worker shutdown complete.")
-        activity_executor.shutdown(wait=False)
+        # Drop activities still queued behind the pool; don't block exit on a
+        # hung synchronous activity (Temporal will retry it elsewhere).
+        activity_executor.shutdown(wait=False, cancel_futures=True)
+        shutdown_ocr_pools()
 
 
-async def main():
+async def main(workflows=None, activities=None):
     """
     Main entry point for the Voyant Temporal worker application.
 
@@ -258,10 +370,22 @@ async def main():
     function, handling keyboard interrupts for graceful exit during development.
     """
     try:
-        await run_worker()
+        await run_worker(workflows, activities)
     except KeyboardInterrupt:
         logger.info("Worker process interrupted by user (Ctrl+C). Exiting.")
 
 
+def run() -> None:
+    """
+    Process entry point: build registrations up front, then start the loop.
+    """
+    settings = get_settings()
+    # Before any activity constructor can load a native thread pool.
+    _limit_native_threads(settings)
+    _setup_django()
+    workflows, activities = build_registrations(settings)
+    asyncio.run(main(workflows, activities))
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    run()
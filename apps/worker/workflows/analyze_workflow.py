@@ -10,10 +10,12 @@ The workflow is designed to be flexible, allowing different stages of the
 analysis to be enabled or disabled based on the input parameters.
 """
 
+import asyncio
 from datetime import timedelta
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from temporalio import workflow
+from temporalio.exceptions import ApplicationError
 
 # This context manager is necessary to allow importing non-workflow/activity
 # modules within the workflow definition. It passes control to the Python
@@ -25,6 +27,10 @@ with workflow.unsafe.imports_passed_through():
     from apps.worker.activities.profile_activities import ProfileActivities
 
 
+# Patch marker for running stages 1-3 concurrently; see `workflow.patched`.
+_CONCURRENT_STAGES_PATCH = "analyze-concurrent-stages"
+
+
 @workflow.defn
 class AnalyzeWorkflow:
     """
@@ -59,43 +65,50 @@ class AnalyzeWorkflow:
             from profiling, KPIs, analyzers, and generated artifacts.
 
         Raises:
-            workflow.ApplicationError: If essential parameters are missing or invalid.
+            ApplicationError: If essential parameters are missing or invalid.
         """
-        table = params.get("table") or params.get("source_id")
+        source_id = params.get("source_id")
+        table = params.get("table") or source_id
         if not table:
-            raise workflow.ApplicationError("table or source_id is required")
+            raise ApplicationError("table or source_id is required")
+        sample_size = params.get("sample_size", 10000)
+        kpi_queries = params.get("kpis")
 
-        profile_summary = None
-        analyzer_results: Dict[str, Any] = {}
-        kpi_results: List[Dict[str, Any]] = []
         generator_results: Dict[str, Any] = {}
 
+        # Stages 1-3 are independent of each other, so they run concurrently;
+        # only the analyzers wait on their own sample fetch.
+
         # Stage 1: Data Profiling
         # Execute the ProfileActivities.profile_data to generate a statistical summary of the dataset.
-        if params.get("profile", True):
-            profile_summary = await workflow.execute_activity(
+        async def profile() -> Optional[Dict[str, Any]]:
+            if not params.get("profile", True):
+                return None
+            return await workflow.execute_activity(
                 ProfileActivities.profile_data,
                 {
-                    "source_id": params.get("source_id") or table,
+                    "source_id": source_id or table,
                     "table": table,
-                    "sample_size": params.get("sample_size", 10000),
+                    "sample_size": sample_size,
                 },
                 start_to_close_timeout=timedelta(minutes=15),
             )
 
         # Stage 2: Run Analyzers
         # Fetch a sample of data, then execute configured analyzer plugins to extract insights.
-        if params.get("run_analyzers", True):
+        async def analyze() -> Dict[str, Any]:
+            if not params.get("run_analyzers", True):
+                return {}
             sample_data = await workflow.execute_activity(
                 AnalysisActivities.fetch_sample,
                 {
                     "table": table,
-                    "sample_size": params.get("sample_size", 10000),
+                    "sample_size": sample_size,
                 },
                 start_to_close_timeout=timedelta(minutes=5),
             )
 
-            analyzer_results = await workflow.execute_activity(
+            return await workflow.execute_activity(
                 AnalysisActivities.run_analyzers,
                 {
                     "data": sample_data,
@@ -107,13 +120,25 @@ class AnalyzeWorkflow:
 
         # Stage 3: Calculate KPIs
         # Execute custom KPI queries provided in the workflow parameters.
-        if params.get("kpis"):
-            kpi_results = await workflow.execute_activity(
+        async def kpis() -> List[Dict[str, Any]]:
+            if not kpi_queries:
+                return []
+            return await workflow.execute_activity(
                 KPIActivities.run_kpis,
-                {"kpis": params.get("kpis")},
+                {"kpis": kpi_queries},
                 start_to_close_timeout=timedelta(minutes=10),
             )
 
+        # Runs started before the stages overlapped replay them in order.
+        if workflow.patched(_CONCURRENT_STAGES_PATCH):
+            profile_summary, analyzer_results, kpi_results = await asyncio.gather(
+                profile(), analyze(), kpis()
+            )
+        else:
+            profile_summary = await profile()
+            analyzer_results = await analyze()
+            kpi_results = await kpis()
+
         # Stage 4: Generate Artifacts
         # Create visual reports and other artifacts based on the analysis results.
         if params.get("generate_artifacts", True):
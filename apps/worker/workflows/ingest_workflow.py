@@ -11,6 +11,8 @@ from datetime import timedelta
 from typing import Any, Dict
 
 from temporalio import workflow
+from temporalio.common import RetryPolicy
+from temporalio.exceptions import ApplicationError
 
 # This context manager is necessary to allow importing non-workflow/activity
 # modules within the workflow definition. It passes control to the Python
@@ -18,6 +20,24 @@ from temporalio import workflow
 with workflow.unsafe.imports_passed_through():
     from apps.worker.activities.ingest_activities import IngestActivities
 
+# Standard retry policy for activities within this workflow. It balances
+# resilience against transient failures with preventing indefinite retries on
+# permanent issues. Built once per process rather than on every run.
+_RETRY_POLICY = RetryPolicy(
+    initial_interval=timedelta(seconds=1),
+    backoff_coefficient=2.0,
+    maximum_interval=timedelta(seconds=60),
+    maximum_attempts=3,
+    non_retryable_error_types=[
+        "ValidationError",
+        "AuthenticationError",
+        "AuthorizationError",
+        "ApplicationError",
+    ],
+)
+_LOCAL_TIMEOUT = timedelta(seconds=10)
+_INGEST_TIMEOUT = timedelta(minutes=10)
+
 
 @workflow.defn
 class IngestDataWorkflow:
@@ -47,36 +67,24 @@ class IngestDataWorkflow:
         """
         workflow.logger.info(f"IngestWorkflow started for job {params.get('job_id')}")
 
-        # Define a standard retry policy for activities within this workflow.
-        # This policy balances resilience against transient failures with
-        # preventing indefinite retries on permanent issues.
-        retry_policy = workflow.RetryPolicy(
-            initial_interval=timedelta(seconds=1),
-            backoff_coefficient=2.0,
-            maximum_interval=timedelta(seconds=60),
-            maximum_attempts=3,
-            non_retryable_error_types=[
-                "ValidationError",
-                "AuthenticationError",
-                "AuthorizationError",
-                "ApplicationError",
-            ],
-        )
-
         # 1. Validate Data Contract (Governance P5)
         # This activity ensures that the incoming data adheres to predefined
         # schema and quality contracts before actual ingestion proceeds.
-        validation = await workflow.execute_activity(
+        # Contract and lineage steps are short in-process bookkeeping, so they
+        # run as local activities: no task-queue round trip through the server.
+        # No patch marker is needed: the version that scheduled them as regular
+        # activities failed on `workflow.RetryPolicy` before recording any.
+        validation = await workflow.execute_local_activity(
             IngestActivities.validate_contract_activity,
             params,
-            start_to_close_timeout=timedelta(minutes=1),
-            retry_policy=retry_policy,
+            start_to_close_timeout=_LOCAL_TIMEOUT,
+            retry_policy=_RETRY_POLICY,
         )
 
         if not validation.get("valid", True):
             # If contract validation fails, raise an ApplicationError to halt
             # the workflow and signal a business-level failure.
-            raise workflow.ApplicationError(f"Contract validation failed: {validation}")
+            raise ApplicationError(f"Contract validation failed: {validation}")
 
         # 2. Execute Data Ingestion
         # This activity performs the actual data transfer from the source to
@@ -84,18 +92,18 @@ class IngestDataWorkflow:
         result = await workflow.execute_activity(
             IngestActivities.run_ingestion,
             params,
-            start_to_close_timeout=timedelta(minutes=10),
-            retry_policy=retry_policy,
+            start_to_close_timeout=_INGEST_TIMEOUT,
+            retry_policy=_RETRY_POLICY,
         )
 
         # 3. Record Data Lineage (Governance P5)
         # This activity records the provenance of the ingested data, linking
         # it back to its source and the ingestion job for auditability.
-        await workflow.execute_activity(
+        await workflow.execute_local_activity(
             IngestActivities.record_lineage_activity,
             params,
-            start_to_close_timeout=timedelta(minutes=1),
-            retry_policy=retry_policy,
+            start_to_close_timeout=_LOCAL_TIMEOUT,
+            retry_policy=_RETRY_POLICY,
         )
 
         workflow.logger.info(f"IngestWorkflow completed for job {params.get('job_id')}")
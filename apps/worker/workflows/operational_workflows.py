@@ -39,21 +39,35 @@ class DetectAnomaliesWorkflow:
         Args:
             params: A dictionary containing anomaly detection configuration:
                 - `data` (List[Any]): The input data for anomaly detection.
+                - `data_ref` (str, optional): Table or file URI holding the data;
+                  passed to the activity instead of `data` when given.
                 - `contamination` (float): The expected proportion of outliers in the data.
 
         Returns:
             A dictionary containing the results of the anomaly detection.
         """
         workflow.logger.info("DetectAnomaliesWorkflow started.")
+        data_ref = params.get("data_ref")
+        source = (
+            {"data_ref": data_ref} if data_ref else {"data": params.get("data", [])}
+        )
+        contamination = params.get("contamination", 0.1)
+
+        # Nothing to score: answer without a round trip to an activity worker.
+        if not data_ref and not source["data"]:
+            return {
+                "total_records": 0,
+                "anomaly_count": 0,
+                "anomaly_indices": [],
+                "contamination_params": contamination,
+                "anomalies": [],
+            }
 
         # Execute the activity to perform the actual anomaly detection.
         # This activity uses algorithms (e.g., Isolation Forest) to identify outliers.
         result = await workflow.execute_activity(
             OperationalActivities.detect_anomalies,
-            {
-                "data": params.get("data", []),
-                "contamination": params.get("contamination", 0.1),
-            },
+            {**source, "contamination": contamination},
             start_to_close_timeout=timedelta(minutes=5),
         )
         workflow.logger.info("DetectAnomaliesWorkflow completed.")
@@ -72,8 +86,8 @@ class AnalyzeSentimentWorkflow:
         Executes the sentiment analysis process on a list of text inputs.
 
         This workflow delegates the text processing to the
-        `OperationalActivities.analyze_sentiment_batch` activity and
-        then aggregates the results.
+        `OperationalActivities.analyze_sentiment_batch` activity, which also
+        aggregates the results.
 
         Args:
             params: A dictionary containing sentiment analysis configuration:
@@ -84,31 +98,24 @@ class AnalyzeSentimentWorkflow:
         """
         workflow.logger.info("AnalyzeSentimentWorkflow started.")
         texts = params.get("texts", [])
-
-        # Execute the activity to perform batch sentiment analysis on the provided texts.
-        results = await workflow.execute_activity(
+        if not texts:
+            return {
+                "total": 0,
+                "breakdown": {"positive": 0, "negative": 0, "neutral": 0},
+                "details": [],
+            }
+
+        # Execute the activity to perform and aggregate batch sentiment analysis.
+        result = await workflow.execute_activity(
             OperationalActivities.analyze_sentiment_batch,
             {"texts": texts},
             start_to_close_timeout=timedelta(minutes=10),
         )
 
-        # Aggregate the sentiment results for a high-level overview.
-        positive = sum(1 for r in results if r["sentiment"] == "positive")
-        negative = sum(1 for r in results if r["sentiment"] == "negative")
-        neutral = sum(1 for r in results if r["sentiment"] == "neutral")
-
         workflow.logger.info(
-            f"AnalyzeSentimentWorkflow completed with {len(results)} texts."
+            f"AnalyzeSentimentWorkflow completed with {result['total']} texts."
         )
-        return {
-            "total": len(results),
-            "breakdown": {
-                "positive": positive,
-                "negative": negative,
-                "neutral": neutral,
-            },
-            "details": results,  # Detailed results from the activity
-        }
+        return result
 
 
 @workflow.defn
@@ -129,6 +136,8 @@ class FixDataQualityWorkflow:
         Args:
             params: A dictionary containing data quality fixing configuration:
                 - `data` (List[Dict[str, Any]]): The input data (list of dictionaries/rows).
+                - `data_ref` (str, optional): Table or file URI holding the data;
+                  passed to the activity instead of `data` when given.
                 - `numeric_columns` (List[str]): Columns to apply numeric fixes to.
                 - `categorical_columns` (List[str]): Columns to apply categorical fixes to.
                 - `imputation_strategy` (str): Strategy for missing values (e.g., "median").
@@ -140,7 +149,23 @@ class FixDataQualityWorkflow:
             including a cleaned dataset and a report of changes.
         """
         workflow.logger.info("FixDataQualityWorkflow started.")
-        data = params.get("data", [])
+        data_ref = params.get("data_ref")
+        source = (
+            {"data_ref": data_ref} if data_ref else {"data": params.get("data", [])}
+        )
+        if not data_ref and not source["data"]:
+            return {
+                "cleaned_data": [],
+                "quality_report": {
+                    "original_rows": 0,
+                    "cleaned_rows": 0,
+                    "missing_value_fixes": 0,
+                    "outliers_treated": 0,
+                    "quality_score_before": 0.0,
+                    "quality_score_after": 0.0,
+                    "improvement": 0.0,
+                },
+            }
         numeric_columns = params.get("numeric_columns", [])
         categorical_columns = params.get("categorical_columns", [])
 
@@ -148,7 +173,7 @@ class FixDataQualityWorkflow:
         result = await workflow.execute_activity(
             OperationalActivities.fix_data_quality,
             {
-                "data": data,
+                **source,
                 "numeric_columns": numeric_columns,
                 "categorical_columns": categorical_columns,
                 "imputation_strategy": params.get("imputation_strategy", "median"),
@@ -6,10 +6,21 @@ from datetime import timedelta
 from typing import Any, Dict
 
 from temporalio import workflow
+from temporalio.common import RetryPolicy
+from temporalio.exceptions import ApplicationError
 
 with workflow.unsafe.imports_passed_through():
     from apps.worker.activities.quality_activities import QualityActivities
 
+_RETRY_POLICY = RetryPolicy(
+    initial_interval=timedelta(seconds=1),
+    backoff_coefficient=2.0,
+    maximum_interval=timedelta(seconds=30),
+    maximum_attempts=3,
+)
+_SAMPLE_TIMEOUT = timedelta(minutes=5)
+_CHECKS_TIMEOUT = timedelta(minutes=10)
+
 
 @workflow.defn
 class QualityWorkflow:
@@ -24,29 +35,22 @@ class QualityWorkflow:
         """
         table = params.get("table") or params.get("source_id")
         if not table:
-            raise workflow.ApplicationError(
+            raise ApplicationError(
                 "table or source_id is required for quality workflow"
             )
 
-        retry_policy = workflow.RetryPolicy(
-            initial_interval=timedelta(seconds=1),
-            backoff_coefficient=2.0,
-            maximum_interval=timedelta(seconds=30),
-            maximum_attempts=3,
-        )
-
         sample = await workflow.execute_activity(
             QualityActivities.fetch_sample,
             params,
-            start_to_close_timeout=timedelta(minutes=5),
-            retry_policy=retry_policy,
+            start_to_close_timeout=_SAMPLE_TIMEOUT,
+            retry_policy=_RETRY_POLICY,
         )
 
         result = await workflow.execute_activity(
             QualityActivities.run_quality_checks,
             {"data": sample, "checks": params.get("checks")},
-            start_to_close_timeout=timedelta(minutes=10),
-            retry_policy=retry_policy,
+            start_to_close_timeout=_CHECKS_TIMEOUT,
+            retry_policy=_RETRY_POLICY,
         )
 
         return {
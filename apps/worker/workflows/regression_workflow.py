@@ -37,6 +37,8 @@ class LinearRegressionWorkflow:
         Args:
             params: A dictionary containing the regression configuration:
                 - `data` (List[Dict[str, float]]): The input dataset for training.
+                - `data_ref` (str, optional): Table or file URI holding the dataset;
+                  passed to the activity instead of `data` when given.
                 - `target_col` (str): The name of the target (dependent) variable column.
                 - `feature_cols` (List[str]): A list of feature (independent) variable column names.
 
@@ -44,7 +46,10 @@ class LinearRegressionWorkflow:
             A dictionary containing the analysis results, including model coefficients,
             metrics, a formatted equation, and a qualitative assessment of model quality.
         """
-        data = params.get("data", [])
+        data_ref = params.get("data_ref")
+        source = (
+            {"data_ref": data_ref} if data_ref else {"data": params.get("data", [])}
+        )
         target_col = params.get("target_col", "target")
         feature_cols = params.get("feature_cols", [])
 
@@ -56,59 +61,22 @@ class LinearRegressionWorkflow:
         # This offloads the heavy computation to a separate activity worker.
         result = await workflow.execute_activity(
             MLActivities.train_regression_model,
-            {"data": data, "target_col": target_col, "feature_cols": feature_cols},
+            {**source, "target_col": target_col, "feature_cols": feature_cols},
             start_to_close_timeout=timedelta(
                 minutes=10
             ),  # Allow up to 10 minutes for model training.
         )
 
-        # Post-process results for a user-friendly summary.
+        # The activity formats the summary once, so replays don't redo it.
+        # Results recorded before it did are formatted here, as they were then.
+        equation = result.get("equation")
+        if equation is None:
+            equation = MLActivities._format_equation(result)
+        quality = result.get("quality")
+        if quality is None:
+            quality = MLActivities._interpret_r2(result.get("r2_score", 0))
         return {
             "status": "completed",
             "analysis": result,
-            "model_summary": {
-                "equation": self._format_equation(result),
-                "quality": self._interpret_r2(result.get("r2_score", 0)),
-            },
+            "model_summary": {"equation": equation, "quality": quality},
         }
-
-    def _format_equation(self, result: Dict[str, Any]) -> str:
-        """
-        Formats the regression model's coefficients into a human-readable equation string.
-
-        Args:
-            result: The raw results dictionary from the regression activity.
-
-        Returns:
-            A string representing the regression equation (e.g., "y = 1.23 + 0.45*x1 - 0.12*x2").
-        """
-        target = result.get("target", "y")
-        intercept = result.get("intercept", 0)
-        coefs = result.get("coefficients", [])
-        features = result.get("features", [])
-
-        terms = [f"{intercept:.2f}"]
-        for i, (feat, coef) in enumerate(zip(features, coefs)):
-            sign = "+" if coef >= 0 else "-"
-            terms.append(f"{sign} {abs(coef):.2f}*{feat}")
-
-        return f"{target} = " + " ".join(terms)
-
-    def _interpret_r2(self, r2: float) -> str:
-        """
-        Interprets the R-squared score qualitatively.
-
-        Args:
-            r2: The R-squared value of the regression model (0.0 to 1.0).
-
-        Returns:
-            A qualitative assessment string (e.g., "excellent", "good", "poor").
-        """
-        if r2 >= 0.9:
-            return "excellent"
-        elif r2 >= 0.7:
-            return "good"
-        elif r2 >= 0.5:
-            return "moderate"
-        else:
-            return "poor"
@@ -11,6 +11,7 @@ from datetime import timedelta
 from typing import Any, Dict
 
 from temporalio import workflow
+from temporalio.exceptions import ApplicationError
 
 # This context manager is necessary to allow importing non-workflow/activity
 # modules within the workflow definition. It passes control to the Python
@@ -36,6 +37,8 @@ class SegmentCustomersWorkflow:
         Args:
             params: A dictionary containing the segmentation configuration:
                 - `data` (List[Dict[str, float]]): The input feature data for clustering.
+                - `data_ref` (str, optional): Table or file URI holding the feature
+                  data; passed to the activities instead of `data` when given.
                 - `n_segments` (int): The desired number of customer segments (default: 3).
 
         Returns:
@@ -44,50 +47,39 @@ class SegmentCustomersWorkflow:
             and cluster assignments for each data point.
         """
         data = params.get("data", [])
+        data_ref = params.get("data_ref")
+        source = {"data_ref": data_ref} if data_ref else {"data": data}
         n_segments = params.get("n_segments", 3)
+        if not data_ref and not data:
+            # cluster_data would reject this too; fail without the round trip.
+            raise ApplicationError(
+                "No data provided for clustering activity.", non_retryable=True
+            )
 
         workflow.logger.info(
-            f"Starting SEGMENT_CUSTOMERS: {len(data)} records into {n_segments} segments."
+            f"Starting SEGMENT_CUSTOMERS: {data_ref or f'{len(data)} records'} "
+            f"into {n_segments} segments."
         )
 
         # Execute the activity that performs the clustering analysis (e.g., K-Means).
         # This offloads the heavy computation to a dedicated activity worker.
         result = await workflow.execute_activity(
             MLActivities.cluster_data,
-            {"data": data, "clusters": n_segments},
+            {**source, "clusters": n_segments},
             start_to_close_timeout=timedelta(
                 minutes=10
             ),  # Allow up to 10 minutes for clustering.
         )
 
-        # Post-processing: Enrich results with segment profiles for better interpretation.
+        # Post-processing: Enrich results with segment profiles for better
+        # interpretation. The aggregation is vectorized in a local activity so
+        # the workflow thread does no per-record work.
         clusters = result.get("clusters", [])
-        segment_profiles = {}
-
-        # Calculate average profile for each segment.
-        for cluster_id in range(n_segments):
-            # Identify all data points belonging to the current cluster.
-            cluster_members = [
-                data[i] for i, c in enumerate(clusters) if c == cluster_id
-            ]
-            if cluster_members:
-                avg_profile = {}
-                # For each feature, calculate the average value within the cluster.
-                if (
-                    cluster_members
-                ):  # Ensure cluster_members is not empty before accessing keys
-                    keys = cluster_members[0].keys()
-                    for key in keys:
-                        values = [m[key] for m in cluster_members if key in m]
-                        avg_profile[key] = sum(values) / len(values) if values else 0
-
-                segment_profiles[f"segment_{cluster_id}"] = {
-                    "size": len(cluster_members),
-                    "percentage": (
-                        len(cluster_members) / len(data) * 100 if len(data) > 0 else 0
-                    ),
-                    "average_profile": avg_profile,
-                }
+        segment_profiles = await workflow.execute_local_activity(
+            MLActivities.summarize_clusters,
+            {**source, "clusters": clusters, "n_segments": n_segments},
+            start_to_close_timeout=timedelta(minutes=2),
+        )
 
         workflow.logger.info(
             f"SEGMENT_CUSTOMERS workflow completed. Found {n_segments} segments."
@@ -95,7 +87,7 @@ class SegmentCustomersWorkflow:
         return {
             "status": "completed",
             "n_segments": n_segments,
-            "total_customers": len(data),
+            "total_customers": len(clusters) if data_ref else len(data),
             "silhouette_score": result.get(
                 "silhouette_score"
             ),  # A metric for cluster quality.
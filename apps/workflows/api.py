@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import io
 import logging
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
 
 from django.http import StreamingHttpResponse
 from ninja import Field, Router, Schema
@@ -28,7 +29,7 @@ from apps.core.lib.namespace_analyzer import (
     NamespaceViolationError,
     validate_table_access,
 )
-from apps.core.lib.temporal_client import get_temporal_client
+from apps.core.lib.temporal_client import cancel_workflow, start_workflow
 from apps.core.middleware import get_soma_session_id, get_tenant_id
 from apps.worker.workflows.ingest_workflow import IngestDataWorkflow
 from apps.worker.workflows.profile_workflow import ProfileWorkflow
@@ -184,9 +185,8 @@ def trigger_ingest(request, payload: IngestRequest):
     )
 
     try:
-        client = run_async(get_temporal_client)
         run_async(
-            client.start_workflow,
+            start_workflow,
             IngestDataWorkflow.run,
             IngestParams(
                 job_id=str(job.job_id),
@@ -230,9 +230,8 @@ def trigger_profile(request, payload: ProfileRequest):
     )
 
     try:
-        client = run_async(get_temporal_client)
         run_async(
-            client.start_workflow,
+            start_workflow,
             ProfileWorkflow.run,
             {
                 "source_id": payload.source_id,
@@ -276,9 +275,8 @@ def trigger_quality(request, payload: QualityRequest):
     )
 
     try:
-        client = run_async(get_temporal_client)
         run_async(
-            client.start_workflow,
+            start_workflow,
             QualityWorkflow.run,
             {
                 "source_id": payload.source_id,
@@ -334,14 +332,13 @@ def cancel_job(request, job_id: str):
         raise HttpError(404, "Job not found")
 
     try:
-        client = run_async(get_temporal_client)
-        for prefix in ("ingest", "profile", "quality", "analyze"):
-            try:
-                handle = client.get_workflow_handle(f"{prefix}-{job_id}")
-                run_async(handle.cancel)
-                break
-            except Exception:
-                continue
+        run_async(
+            cancel_workflow,
+            *(
+                f"{prefix}-{job_id}"
+                for prefix in ("ingest", "profile", "quality", "analyze")
+            ),
+        )
     except Exception:
         pass
 
@@ -405,58 +402,59 @@ def download_artifact(request, job_id: str, artifact_type: str, format: str = "j
         raise HttpError(404, f"Artifact download failed: {exc}") from exc
 
 
-PRESETS: Dict[str, Dict[str, Any]] = {
-    "quality.data_profiling": {
-        "name": "Data Profiling",
-        "category": "quality",
-        "description": "Profile table quality and distribution",
-        "parameters": ["source_id", "table", "sample_size"],
-        "output_artifacts": ["profile"],
-        "job_type": "profile",
-    },
-    "quality.data_checks": {
-        "name": "Data Quality Checks",
-        "category": "quality",
-        "description": "Run quality checks for a table",
-        "parameters": ["source_id", "table", "checks"],
-        "output_artifacts": ["quality"],
-        "job_type": "quality",
-    },
-}
+PRESETS: Mapping[str, Dict[str, Any]] = MappingProxyType(
+    {
+        "quality.data_profiling": {
+            "name": "Data Profiling",
+            "category": "quality",
+            "description": "Profile table quality and distribution",
+            "parameters": ["source_id", "table", "sample_size"],
+            "output_artifacts": ["profile"],
+            "job_type": "profile",
+        },
+        "quality.data_checks": {
+            "name": "Data Quality Checks",
+            "category": "quality",
+            "description": "Run quality checks for a table",
+            "parameters": ["source_id", "table", "checks"],
+            "output_artifacts": ["quality"],
+            "job_type": "quality",
+        },
+    }
+)
+
+# The definitions are static, so their response schemas are built once at
+# import rather than re-validated on every list/get request.
+_PRESET_INFO: Mapping[str, PresetInfo] = MappingProxyType(
+    {
+        key: PresetInfo(
+            name=preset["name"],
+            category=preset["category"],
+            description=preset["description"],
+            parameters=preset["parameters"],
+            output_artifacts=preset["output_artifacts"],
+        )
+        for key, preset in PRESETS.items()
+    }
+)
 
 
 @presets_router.get("", response=Dict[str, List[PresetInfo]])
 def list_presets(request, category: Optional[str] = None):
     grouped: Dict[str, List[PresetInfo]] = {}
-    for preset in PRESETS.values():
-        if category and preset["category"] != category:
+    for info in _PRESET_INFO.values():
+        if category and info.category != category:
             continue
-        grouped.setdefault(preset["category"], []).append(
-            PresetInfo(
-                **{
-                    "name": preset["name"],
-                    "category": preset["category"],
-                    "description": preset["description"],
-                    "parameters": preset["parameters"],
-                    "output_artifacts": preset["output_artifacts"],
-                }
-            )
-        )
+        grouped.setdefault(info.category, []).append(info)
     return grouped
 
 
 @presets_router.get("/{preset_name}", response=PresetInfo)
 def get_preset(request, preset_name: str):
-    preset = PRESETS.get(preset_name)
-    if not preset:
+    info = _PRESET_INFO.get(preset_name)
+    if info is None:
         raise HttpError(404, "Preset not found")
-    return PresetInfo(
-        name=preset["name"],
-        category=preset["category"],
-        description=preset["description"],
-        parameters=preset["parameters"],
-        output_artifacts=preset["output_artifacts"],
-    )
+    return info
 
 
 @presets_router.post("/{preset_name}/execute", response=Dict[str, str])
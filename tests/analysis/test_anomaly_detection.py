@@ -2,10 +2,14 @@
 Tests for Anomaly Detection Service.
 """
 
+import subprocess
+import sys
+
 import numpy as np
 import pandas as pd
 import pytest
 
+from apps.analysis.lib import anomaly_detection
 from apps.analysis.lib.anomaly_detection import (
     SKLEARN_AVAILABLE,
     AnomalyDetector,
@@ -65,3 +69,77 @@ def test_input_conversion(detector):
     assert result["status"] == "success"
     # 1000 should be anomalous
     assert result["anomaly_count"] > 0
+
+
+@pytest.mark.skipif(not SKLEARN_AVAILABLE, reason="scikit-learn not installed")
+def test_top_anomalies_sorted_and_plot_split(detector):
+    """Top anomalies are the most severe first; plot data splits every row."""
+    rng = np.random.default_rng(7)
+    df = pd.DataFrame({"x": rng.normal(0, 1, 200), "y": rng.normal(0, 1, 200)})
+    df.loc[:4, ["x", "y"]] = 50.0
+
+    result = detector.analyze(df, {"features": ["x", "y"]})
+
+    scores = [r["anomaly_score"] for r in result["top_anomalies"]]
+    assert scores == sorted(scores)
+    assert len(scores) == min(20, result["anomaly_count"])
+    data = result["visualization"]["data"]
+    assert len(data["outliers"]["x"]) == result["anomaly_count"]
+    assert len(data["inliers"]["y"]) + len(data["outliers"]["y"]) == 200
+    assert 50.0 in data["outliers"]["x"]
+
+
+@pytest.mark.skipif(not SKLEARN_AVAILABLE, reason="scikit-learn not installed")
+def test_large_input_fits_on_subsample(detector, monkeypatch):
+    """Large inputs fit on a subset but every row is scored."""
+    fitted = []
+
+    class RecordingForest(anomaly_detection._isolation_forest()):
+        def fit(self, X, y=None, sample_weight=None):
+            fitted.append((X.shape, X.dtype, self.n_estimators, self.max_samples))
+            return super().fit(X, y, sample_weight)
+
+    monkeypatch.setattr(anomaly_detection, "IsolationForest", RecordingForest)
+    monkeypatch.setattr(anomaly_detection, "FIT_SAMPLE_THRESHOLD", 500)
+    monkeypatch.setattr(anomaly_detection, "FIT_SAMPLE_SIZE", 100)
+    df = pd.DataFrame({"value": np.random.default_rng(3).normal(0, 1, 1000)})
+
+    result = detector.analyze(df, {"n_estimators": 20})
+
+    assert fitted == [((100, 1), np.float32, 20, 256)]
+    assert result["analyzed_rows"] == 1000
+    total = result["visualization"]["data"]
+    assert len(total["inliers"]["value"]) + len(total["outliers"]["value"]) == 1000
+
+
+def test_sklearn_not_imported_at_module_load():
+    """Importing the plugin module does not pull in scikit-learn."""
+    code = (
+        "import sys, apps.analysis.lib.anomaly_detection; "
+        "print('sklearn' in sys.modules)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert out.stdout.strip() == "False"
+
+
+@pytest.mark.parametrize(
+    "records",
+    [
+        [{"a": 1.5, "b": 2.0}, {"a": 3.0, "b": 4}],
+        [{"a": 1.5, "b": 2.0}, {"a": None, "b": 4.0}],
+        [{"a": 1.5, "b": 2.0}, {"a": "x", "b": 4.0}],
+        [{"a": 1.5, "b": 2.0}, {"a": 3.0, "c": 4.0}],
+        [{"a": 1, "b": True}, {"a": 2, "b": False}],
+        [{"a": 1.5}, {"a": True}],
+        [{"a": 1.5}, {"a": "2.5"}],
+        [{"a": 1.5, "b": 2.0}, {"a": 3.0, "b": float("nan")}],
+    ],
+)
+def test_records_conversion_matches_pandas(records):
+    """The columnar fast path yields the same frame as pd.DataFrame(records)."""
+    pd.testing.assert_frame_equal(
+        AnomalyDetector._records_to_dataframe(records), pd.DataFrame(records)
+    )
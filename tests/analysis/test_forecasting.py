@@ -2,11 +2,13 @@
 Tests for Time Series Forecasting Service.
 """
 
+import json
+
 import numpy as np
 import pandas as pd
 import pytest
 
-from apps.analysis.lib.services_forecasting import SKLEARN_AVAILABLE, TimeForecaster
+from apps.analysis.lib.services_forecasting import TimeForecaster
 
 
 @pytest.fixture
@@ -14,7 +16,6 @@ def forecaster():
     return TimeForecaster()
 
 
-@pytest.mark.skipif(not SKLEARN_AVAILABLE, reason="scikit-learn not installed")
 def test_linear_trend_forecast(forecaster):
     """Test forecasting a simple perfect linear trend."""
     # Create 100 days of data: y = 2x
@@ -27,11 +28,11 @@ def test_linear_trend_forecast(forecaster):
     result = forecaster.analyze(df, {"horizon": 10})
 
     assert result["status"] == "success"
-    assert len(result["forecast"]) == 10
+    assert len(result["forecast"]["date"]) == 10
 
     # Check predictions roughly follow trend
     # Last value was 198, next should be 200, 202...
-    forecast_values = [r["forecast"] for r in result["forecast"]]
+    forecast_values = result["forecast"]["forecast"]
     first_pred = forecast_values[0]
     last_pred = forecast_values[-1]
 
@@ -40,7 +41,6 @@ def test_linear_trend_forecast(forecaster):
     assert 217 < last_pred < 219
 
 
-@pytest.mark.skipif(not SKLEARN_AVAILABLE, reason="scikit-learn not installed")
 def test_missing_values_handling(forecaster):
     """Test resilience to missing dates/values."""
     dates = pd.date_range(start="2023-01-01", periods=20, freq="D")
@@ -53,7 +53,7 @@ def test_missing_values_handling(forecaster):
     result = forecaster.analyze(df, {"horizon": 5})
     assert result["status"] == "success"
     # Should automatically resample and fill, producing a forecast
-    assert len(result["forecast"]) == 5
+    assert len(result["forecast"]["date"]) == 5
 
 
 def test_empty_data(forecaster):
@@ -65,3 +65,161 @@ def test_empty_data(forecaster):
 def test_unsupported_data_type(forecaster):
     with pytest.raises(Exception):  # AnalysisError
         forecaster.analyze("string_data", {})
+
+
+def test_constant_month_feature_does_not_skew_forecast(forecaster):
+    """A feature constant over the history (one month) gets no weight."""
+    dates = pd.date_range(start="2023-03-01", periods=20, freq="D")
+    df = pd.DataFrame({"date": dates, "value": np.arange(20) * 2.0})
+
+    # The horizon runs into April; the month change must not shift the trend.
+    result = forecaster.analyze(df, {"horizon": 20})
+
+    forecast_values = result["forecast"]["forecast"]
+    assert np.allclose(forecast_values, np.arange(20, 40) * 2.0)
+
+
+def test_weekly_cycle_is_captured(forecaster):
+    """Day-of-week seasonality is fitted through its sin/cos encoding."""
+    dates = pd.date_range(start="2023-01-02", periods=70, freq="D")
+    angle = 2 * np.pi * dates.dayofweek / 7
+    values = 10 + 3 * np.sin(angle) + np.cos(angle)
+    df = pd.DataFrame({"date": dates, "value": values})
+
+    result = forecaster.analyze(df, {"horizon": 7})
+
+    future = pd.date_range(start="2023-03-13", periods=7, freq="D")
+    future_angle = 2 * np.pi * future.dayofweek / 7
+    expected = 10 + 3 * np.sin(future_angle) + np.cos(future_angle)
+    assert result["rmse"] < 1e-6
+    assert np.allclose(result["forecast"]["forecast"], expected)
+
+
+def test_output_is_columnar(forecaster):
+    dates = pd.date_range(start="2023-01-01", periods=30, freq="D")
+    df = pd.DataFrame({"date": dates, "value": np.arange(30.0)})
+
+    result = forecaster.analyze(df, {"horizon": 3})
+
+    forecast = result["forecast"]
+    assert forecast["date"] == ["2023-01-31", "2023-02-01", "2023-02-02"]
+    assert set(forecast) == {"date", "forecast", "lower_bound", "upper_bound"}
+    history = result["visualization"]["data"]["history"]
+    assert history["date"][0] == "2023-01-01"
+    assert history["value"] == list(np.arange(30.0))
+    json.dumps(result)
+
+
+@pytest.mark.parametrize("freq", ["D", "h", "7D", "W"])
+def test_resample_matches_pandas(freq):
+    rng = np.random.default_rng(7)
+    index = pd.DatetimeIndex(
+        pd.Timestamp("2023-01-03 05:17")
+        + pd.to_timedelta(rng.integers(0, 60 * 24 * 90, 400), unit="min"),
+        name="date",
+    )
+    values = rng.normal(size=400)
+    values[rng.random(400) < 0.2] = np.nan
+    series = pd.Series(values, index=index, name="value")
+
+    expected = series.resample(freq).mean().ffill().fillna(0)
+
+    pd.testing.assert_series_equal(
+        TimeForecaster._resample_mean(series, freq), expected
+    )
+
+
+@pytest.mark.parametrize("periods", [20, 120])  # one month (rank-deficient), four
+def test_rmse_and_bounds_from_training_residuals(forecaster, periods):
+    rng = np.random.default_rng(3)
+    dates = pd.date_range(start="2023-03-01", periods=periods, freq="D")
+    values = np.arange(periods) * 0.5 + rng.normal(size=periods)
+    df = pd.DataFrame({"date": dates, "value": values})
+
+    result = forecaster.analyze(df, {"horizon": 5})
+
+    X, _ = forecaster._create_features(dates)
+    design = np.column_stack([np.ones(periods), X])
+    beta, *_ = np.linalg.lstsq(design, values, rcond=None)
+    residuals = values - design @ beta
+    assert result["rmse"] == pytest.approx(np.sqrt(np.mean(residuals**2)))
+    forecast = result["forecast"]
+    assert np.allclose(
+        np.subtract(forecast["upper_bound"], forecast["forecast"]),
+        1.96 * result["rmse"],
+    )
+
+
+def test_input_frame_is_left_untouched(forecaster):
+    df = pd.DataFrame(
+        {
+            "label": ["x"] * 30,
+            "date": pd.date_range("2023-01-01", periods=30, freq="D").strftime(
+                "%Y-%m-%d"
+            ),
+            "units": np.arange(30.0),
+        }
+    )
+    before = df.copy()
+
+    result = forecaster.analyze(df, {"horizon": 3})
+
+    pd.testing.assert_frame_equal(df, before)
+    assert result["visualization"]["y"] == "units"
+    assert result["visualization"]["data"]["history"]["date"][0] == "2023-01-01"
+    assert np.allclose(result["forecast"]["forecast"], [30.0, 31.0, 32.0])
+
+
+@pytest.mark.parametrize(
+    "dates, expected",
+    [
+        (
+            pd.date_range("2023-01-01", periods=2, freq="D"),
+            ["2023-01-01", "2023-01-02"],
+        ),
+        (
+            pd.date_range("2023-01-01 23:00", periods=2, freq="h"),
+            ["2023-01-01T23:00:00", "2023-01-02T00:00:00"],
+        ),
+        (
+            pd.date_range("2023-01-01", periods=2, freq="D", tz="Europe/Madrid"),
+            ["2023-01-01", "2023-01-02"],
+        ),
+    ],
+)
+def test_iso_dates(dates, expected):
+    assert TimeForecaster._iso_dates(dates) == expected
+
+
+def test_value_cols_match_individual_forecasts(forecaster):
+    rng = np.random.default_rng(5)
+    dates = pd.date_range(start="2023-01-01", periods=90, freq="D")
+    df = pd.DataFrame(
+        {
+            "date": dates,
+            "revenue": np.arange(90) * 3.0 + rng.normal(size=90),
+            "orders": 50 - np.arange(90) * 0.2 + rng.normal(size=90),
+        }
+    )
+
+    result = forecaster.analyze(
+        df, {"horizon": 7, "value_cols": ["revenue", "orders", "missing"]}
+    )
+
+    assert result["value_cols"] == ["revenue", "orders"]
+    for col in ("revenue", "orders"):
+        single = forecaster.analyze(df, {"horizon": 7, "value_col": col})
+        assert result["rmse_by_column"][col] == pytest.approx(single["rmse"])
+        assert np.allclose(
+            result["forecasts"][col]["forecast"], single["forecast"]["forecast"]
+        )
+        spec = result["visualizations"][col]
+        assert spec["data"]["history"] == single["visualization"]["data"]["history"]
+
+
+def test_datetime_column_is_not_reparsed(forecaster, monkeypatch):
+    dates = pd.date_range(start="2023-01-01", periods=30, freq="D")
+    df = pd.DataFrame({"date": dates, "value": np.arange(30.0)})
+    monkeypatch.setattr(pd, "to_datetime", lambda *a, **k: pytest.fail("parsed"))
+
+    assert forecaster.analyze(df, {"horizon": 3})["status"] == "success"
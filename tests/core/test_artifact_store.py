@@ -0,0 +1,28 @@
+"""
+Test artifact store compression
+
+Verifies zstd round-trips and that a fresh store reads the codec an
+artifact was written with from its metadata.
+"""
+
+import pytest
+
+from apps.core.lib.artifact_store import ArtifactStore, CompressionType, StoreConfig
+
+pytest.importorskip("zstandard")
+
+
+def test_zstd_round_trip_and_codec_from_metadata(tmp_path):
+    payload = b'{"results": [' + b'{"column": "amount", "passed": true},' * 500 + b"]}"
+    writer = ArtifactStore(
+        StoreConfig(base_path=str(tmp_path), compression=CompressionType.ZSTD)
+    )
+    ref = writer.store(payload, "quality")
+
+    stored = next(tmp_path.rglob("*.bin")).read_bytes()
+    assert len(stored) < len(payload) // 10
+    assert writer.retrieve(ref.hash) == payload
+
+    reader = ArtifactStore(StoreConfig(base_path=str(tmp_path)))
+    assert reader.config.compression == CompressionType.GZIP
+    assert reader.retrieve(ref.hash) == payload
@@ -0,0 +1,39 @@
+"""
+Test K8s mounted-secrets backend
+
+Verifies warm reads come from cache and file changes are picked up.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from apps.core.lib.secrets import K8sSecretsBackend
+
+
+@pytest.mark.asyncio
+async def test_warm_read_skips_file_open(tmp_path, monkeypatch):
+    (tmp_path / "db_password").write_text("s3cret\n", encoding="utf-8")
+    backend = K8sSecretsBackend(root=str(tmp_path))
+
+    assert await backend.get("db_password") == "s3cret"
+
+    monkeypatch.setattr(Path, "read_text", lambda *a, **k: pytest.fail("re-read"))
+    assert await backend.get("db_password") == "s3cret"
+
+
+@pytest.mark.asyncio
+async def test_changed_and_removed_files_are_seen(tmp_path):
+    secret = tmp_path / "db_password"
+    secret.write_text("old", encoding="utf-8")
+    backend = K8sSecretsBackend(root=str(tmp_path))
+    assert await backend.get("db_password") == "old"
+
+    secret.write_text("new", encoding="utf-8")
+    st = secret.stat()
+    os.utime(secret, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert await backend.get("db_password") == "new"
+
+    secret.unlink()
+    assert await backend.get("db_password") is None
@@ -0,0 +1,213 @@
+"""
+Test Keycloak JWKS caching
+
+Verifies TTL expiry, single-flight refresh and forced refresh on unknown kid.
+"""
+
+import threading
+import time
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from django.test import RequestFactory
+from ninja.errors import HttpError
+
+from apps.core.security import auth as auth_module
+from apps.core.security.auth import KeycloakAuth
+
+PRIVATE_KEY = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+PUBLIC_JWK = jwt.algorithms.RSAAlgorithm.to_jwk(PRIVATE_KEY.public_key(), as_dict=True)
+
+
+def _kids(jwks):
+    return [key["kid"] for key in jwks["keys"]]
+
+
+@pytest.fixture
+def keycloak(monkeypatch):
+    """KeycloakAuth whose JWKS fetch returns numbered key sets."""
+    fetches = []
+
+    def fake_fetch(self):
+        time.sleep(0.01)
+        fetches.append(1)
+        self._jwks = {"keys": [{**PUBLIC_JWK, "kid": f"k{len(fetches)}"}]}
+        self._signing_keys = self._parse_signing_keys(self._jwks)
+        self._jwks_fetched_at = time.monotonic()
+
+    monkeypatch.setattr(KeycloakAuth, "_fetch_jwks", fake_fetch)
+    auth = KeycloakAuth()
+    auth.client_id = "voyant-api"
+    return auth, fetches
+
+
+def test_jwks_cached_within_ttl(keycloak):
+    auth, fetches = keycloak
+
+    assert _kids(auth._get_jwks()) == ["k1"]
+    assert _kids(auth._get_jwks()) == ["k1"]
+    assert len(fetches) == 1
+
+
+def test_jwks_refetched_after_ttl(keycloak):
+    auth, fetches = keycloak
+    auth._get_jwks()
+    auth._jwks_fetched_at -= auth._jwks_ttl + 1
+
+    assert _kids(auth._get_jwks()) == ["k2"]
+
+
+def test_concurrent_cold_start_fetches_once(keycloak):
+    auth, fetches = keycloak
+    threads = [threading.Thread(target=auth._get_jwks) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(fetches) == 1
+
+
+def test_near_expiry_serves_cache_and_refreshes_in_background(keycloak):
+    auth, fetches = keycloak
+    auth._get_jwks()
+    auth._jwks_fetched_at -= auth._jwks_ttl - auth_module.JWKS_REFRESH_AHEAD_SECONDS + 1
+
+    assert _kids(auth._get_jwks()) == ["k1"]
+    for _ in range(100):
+        if len(fetches) == 2:
+            break
+        time.sleep(0.01)
+    assert _kids(auth._get_jwks()) == ["k2"]
+
+
+def test_forced_refresh_is_rate_limited(keycloak):
+    auth, fetches = keycloak
+    auth._get_jwks()
+
+    auth._get_jwks(force=True)
+    assert len(fetches) == 1
+
+    auth._jwks_fetched_at -= auth_module.JWKS_FORCED_REFRESH_INTERVAL_SECONDS
+    assert _kids(auth._get_jwks(force=True)) == ["k2"]
+
+
+def test_unknown_kid_forces_one_refresh(keycloak):
+    auth, fetches = keycloak
+    auth._get_jwks()
+    auth._jwks_fetched_at -= auth_module.JWKS_FORCED_REFRESH_INTERVAL_SECONDS
+    token = jwt.encode(
+        {"sub": "u1"}, PRIVATE_KEY, algorithm="RS256", headers={"kid": "rotated"}
+    )
+
+    with pytest.raises(HttpError) as exc_info:
+        auth.validate_token(token)
+
+    assert exc_info.value.status_code == 401
+    assert len(fetches) == 2
+
+
+def test_http_client_is_shared():
+    client = auth_module._get_http_client()
+
+    assert client is auth_module._get_http_client()
+    assert not client.is_closed
+
+
+class TestValidatedTokenCache:
+    """Repeated bearer tokens skip signature verification."""
+
+    @pytest.fixture
+    def decode_calls(self, keycloak, monkeypatch):
+        calls = []
+        decode = jwt.decode
+
+        def counting_decode(token, *args, **kwargs):
+            calls.append(token)
+            return decode(token, *args, **kwargs)
+
+        monkeypatch.setattr(jwt, "decode", counting_decode)
+        return calls
+
+    def _token(self, auth, **claims):
+        claims = {
+            "sub": "u1",
+            "preferred_username": "ana",
+            "aud": auth.client_id,
+            "iss": auth._issuer,
+            **claims,
+        }
+        return jwt.encode(claims, PRIVATE_KEY, algorithm="RS256", headers={"kid": "k1"})
+
+    def test_same_token_verified_once(self, keycloak, decode_calls):
+        auth, _ = keycloak
+        token = self._token(auth, exp=int(time.time()) + 300)
+
+        first = auth.validate_token(token)
+        second = auth.validate_token(token)
+
+        assert second is first
+        assert second.token == token
+        assert decode_calls == [token]
+
+    def test_cache_never_outlives_token(self, keycloak, decode_calls):
+        auth, _ = keycloak
+        token = self._token(auth, exp=int(time.time()) + 1)
+        auth._validated.set = lambda *args, **kwargs: pytest.fail("cached")
+
+        auth.validate_token(token)
+
+
+def test_permissions_union_of_roles():
+    permissions = KeycloakAuth()._derive_permissions(
+        ["voyant-analyst", "voyant-viewer", "unknown-role"]
+    )
+
+    assert permissions == {
+        "read:*",
+        "execute:sql",
+        "execute:presets",
+        "read:dashboards",
+        "read:reports",
+        "read:artifacts",
+    }
+    assert isinstance(permissions, frozenset)
+    assert KeycloakAuth()._derive_permissions([]) == frozenset()
+
+
+def test_bearer_token_parsed_once_per_request():
+    request = RequestFactory().get("/", HTTP_AUTHORIZATION="Bearer  abc.def ")
+
+    assert auth_module._get_bearer_token(request) == "abc.def"
+    request.META["HTTP_AUTHORIZATION"] = "Bearer other"
+    del request.headers
+    assert auth_module._get_bearer_token(request) == "abc.def"
+
+    assert auth_module._get_bearer_token(RequestFactory().get("/")) is None
+    basic = RequestFactory().get("/", HTTP_AUTHORIZATION="Basic abc")
+    assert auth_module._get_bearer_token(basic) is None
+
+
+def test_admin_flag_short_circuits_checks():
+    def user(roles):
+        roles = frozenset(roles)
+        return auth_module.User(
+            user_id="u1",
+            email="",
+            username="ana",
+            tenant_id="default",
+            roles=roles,
+            permissions=KeycloakAuth()._derive_permissions(roles),
+            token="t",
+        )
+
+    admin = user(["voyant-admin"])
+    viewer = user(["voyant-viewer"])
+
+    assert admin.is_admin
+    assert admin.has_role("voyant-engineer") and admin.has_permission("write:jobs")
+    assert not viewer.is_admin
+    assert viewer.has_role("voyant-viewer") and not viewer.has_role("voyant-admin")
+    assert viewer.has_permission("read:reports")
+    assert not viewer.has_permission("write:jobs")
@@ -98,3 +98,22 @@ def test_missing_column(clean_df):
     res = rule.check(clean_df)
     assert not res.passed
     assert "error" in res.details
+
+
+def test_unique_check_counts_nulls_like_pandas():
+    df = pd.DataFrame({"code": ["a", None, None, float("nan"), "a", "b"]})
+
+    res = UniqueCheck("code").check(df)
+
+    assert res.details == {
+        "duplicates": int(df.duplicated(subset=["code"]).sum()),
+        "total": 6,
+        "unique": df["code"].nunique(),
+    }
+
+
+def test_engine_summary_uses_plain_types(dirty_df):
+    summary = QualityEngine([NullCheck("score"), UniqueCheck("id")]).validate(dirty_df)
+
+    assert type(summary["passed"]) is int
+    assert all(type(r["passed"]) is bool for r in summary["results"])
@@ -0,0 +1,63 @@
+"""
+Test the sync-to-async bridge
+
+run_async reuses one background event loop, keeps the caller's context
+variables and re-raises coroutine errors in the caller. Blocking coroutines
+run through run_async_isolated and never hold up the bridge.
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+
+import pytest
+
+from apps.core.api_utils import run_async, run_async_isolated
+
+request_id = contextvars.ContextVar("request_id", default=None)
+
+
+async def _current_loop_and_request():
+    return asyncio.get_running_loop(), request_id.get()
+
+
+async def _fail():
+    raise ValueError("boom")
+
+
+def test_calls_share_one_loop_and_caller_context():
+    request_id.set("req-1")
+
+    first_loop, seen = run_async(_current_loop_and_request)
+    second_loop, _ = run_async(_current_loop_and_request)
+
+    assert first_loop is second_loop
+    assert seen == "req-1"
+
+
+def test_errors_propagate_to_caller():
+    with pytest.raises(ValueError, match="boom"):
+        run_async(_fail)
+
+
+async def _block(started: threading.Event):
+    started.set()
+    time.sleep(1.0)
+
+
+async def _quick():
+    return "done"
+
+
+def test_blocking_isolated_call_does_not_delay_bridge():
+    started = threading.Event()
+    blocker = threading.Thread(target=run_async_isolated, args=(_block, started))
+    blocker.start()
+    try:
+        assert started.wait(timeout=5)
+        begin = time.monotonic()
+        assert run_async(_quick) == "done"
+        assert time.monotonic() - begin < 0.5
+    finally:
+        blocker.join()
@@ -0,0 +1,89 @@
+"""
+Test the Temporal client helpers
+
+start_workflow and cancel_workflow resolve the shared client and act on it
+inside a single coroutine; concurrent first callers share one connection.
+"""
+
+import asyncio
+
+import pytest
+
+from apps.core.lib import temporal_client
+
+
+class FakeHandle:
+    def __init__(self, workflow_id, client):
+        self.workflow_id = workflow_id
+        self.client = client
+
+    async def cancel(self):
+        if self.workflow_id not in self.client.running:
+            raise RuntimeError(f"{self.workflow_id} not found")
+        self.client.cancelled.append(self.workflow_id)
+
+
+class FakeClient:
+    def __init__(self, running=()):
+        self.running = set(running)
+        self.cancelled = []
+        self.started = []
+
+    async def start_workflow(self, workflow, arg, **kwargs):
+        self.started.append((workflow, arg, kwargs))
+        return "handle"
+
+    def get_workflow_handle(self, workflow_id):
+        return FakeHandle(workflow_id, self)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    fake = FakeClient(running={"profile-1"})
+    monkeypatch.setattr(temporal_client, "_client", fake)
+    return fake
+
+
+@pytest.mark.asyncio
+async def test_start_workflow_uses_shared_client(client):
+    handle = await temporal_client.start_workflow("wf", {"a": 1}, id="wf-1")
+
+    assert handle == "handle"
+    assert client.started == [("wf", {"a": 1}, {"id": "wf-1"})]
+
+
+@pytest.mark.asyncio
+async def test_cancel_workflow_stops_at_first_match(client):
+    cancelled = await temporal_client.cancel_workflow("ingest-1", "profile-1")
+
+    assert cancelled == "profile-1"
+    assert client.cancelled == ["profile-1"]
+
+
+@pytest.mark.asyncio
+async def test_cancel_workflow_raises_when_nothing_matches(client):
+    with pytest.raises(RuntimeError, match="quality-1 not found"):
+        await temporal_client.cancel_workflow("ingest-1", "quality-1")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_connect_once(monkeypatch):
+    connects = []
+
+    class FakeConnector:
+        @staticmethod
+        async def connect(target_host, namespace):
+            connects.append(target_host)
+            await asyncio.sleep(0)
+            return FakeClient()
+
+    monkeypatch.setattr(temporal_client, "_client", None)
+    monkeypatch.setattr(temporal_client, "_connect_lock", asyncio.Lock())
+    monkeypatch.setattr(temporal_client, "Client", FakeConnector)
+
+    clients = await asyncio.gather(
+        *(temporal_client.get_temporal_client() for _ in range(5))
+    )
+
+    assert len(connects) == 1
+    assert all(c is clients[0] for c in clients)
@@ -0,0 +1,90 @@
+"""
+Test Vault secrets backend read cache
+
+Verifies repeated reads within the TTL skip Vault and writes invalidate.
+"""
+
+import sys
+import types
+
+import pytest
+
+from apps.core.lib import secrets
+from apps.core.lib.secrets import VaultSecretsBackend
+
+
+class FakeKV:
+    def __init__(self):
+        self.data = {"db/password": "s3cret"}
+        self.reads = 0
+
+    def read_secret_version(self, path, mount_point):
+        self.reads += 1
+        return {"data": {"data": {"value": self.data[path]}}}
+
+    def create_or_update_secret(self, path, secret, mount_point):
+        self.data[path] = secret["value"]
+
+
+@pytest.fixture
+def vault():
+    kv = FakeKV()
+    backend = VaultSecretsBackend(addr="http://vault:8200", token="t")
+    backend._client = types.SimpleNamespace(
+        secrets=types.SimpleNamespace(kv=types.SimpleNamespace(v2=kv))
+    )
+    return backend, kv
+
+
+@pytest.mark.asyncio
+async def test_reads_cached_within_ttl(vault):
+    backend, kv = vault
+
+    assert await backend.get("db/password") == "s3cret"
+    assert await backend.get("db/password") == "s3cret"
+    assert kv.reads == 1
+
+
+@pytest.mark.asyncio
+async def test_expired_entry_is_refetched(vault):
+    backend, kv = vault
+    backend._cache_ttl = 0
+
+    await backend.get("db/password")
+    await backend.get("db/password")
+
+    assert kv.reads == 2
+
+
+@pytest.mark.asyncio
+async def test_set_invalidates_cached_value(vault):
+    backend, kv = vault
+    await backend.get("db/password")
+
+    assert await backend.set("db/password", "rotated")
+    assert await backend.get("db/password") == "rotated"
+
+
+@pytest.mark.asyncio
+async def test_failed_auth_is_not_rechecked_every_call(monkeypatch):
+    clients = []
+
+    class FakeClient:
+        def __init__(self, url, token, session):
+            self.session = session
+            clients.append(self)
+
+        def is_authenticated(self):
+            return False
+
+    monkeypatch.setitem(sys.modules, "hvac", types.SimpleNamespace(Client=FakeClient))
+    backend = VaultSecretsBackend(addr="http://vault:8200", token="t")
+
+    assert await backend.get("db/password") is None
+    assert await backend.get("db/password") is None
+    assert len(clients) == 1
+    assert clients[0].session.get_adapter("https://vault")._pool_maxsize == 20
+
+    backend._auth_checked_at -= secrets.VAULT_AUTH_RECHECK_SECONDS
+    await backend.get("db/password")
+    assert len(clients) == 2
@@ -0,0 +1,111 @@
+"""
+Tests for AnalyzeWorkflow orchestration
+
+Profiling, analyzers and KPIs overlap; artifact generation waits for all.
+Runs started before that replay the stages in order.
+"""
+
+import asyncio
+
+import pytest
+
+from apps.worker.activities.analysis_activities import AnalysisActivities
+from apps.worker.activities.generation_activities import GenerationActivities
+from apps.worker.activities.kpi_activities import KPIActivities
+from apps.worker.activities.profile_activities import ProfileActivities
+from apps.worker.workflows import analyze_workflow
+from apps.worker.workflows.analyze_workflow import AnalyzeWorkflow
+
+RESULTS = {
+    ProfileActivities.profile_data: {"rows": 10},
+    AnalysisActivities.fetch_sample: [{"a": 1}],
+    AnalysisActivities.run_analyzers: {"outliers": {}},
+    KPIActivities.run_kpis: [{"kpi": "revenue"}],
+}
+
+
+@pytest.fixture
+def patches(monkeypatch):
+    applied = {analyze_workflow._CONCURRENT_STAGES_PATCH: True}
+    monkeypatch.setattr(analyze_workflow.workflow, "patched", applied.__getitem__)
+    return applied
+
+
+@pytest.fixture
+def state(monkeypatch):
+    state = {"active": 0, "peak": 0, "order": [], "params": {}}
+
+    async def fake_execute_activity(fn, params, **kwargs):
+        state["order"].append(fn)
+        state["params"][fn] = params
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.01)
+        state["active"] -= 1
+        return RESULTS.get(fn, {"charts": []})
+
+    monkeypatch.setattr(
+        analyze_workflow.workflow, "execute_activity", fake_execute_activity
+    )
+    return state
+
+
+@pytest.mark.asyncio
+async def test_independent_stages_overlap(patches, state):
+
+    result = await AnalyzeWorkflow().run(
+        {"table": "sales", "kpis": [{"name": "revenue", "sql": "SELECT 1"}]}
+    )
+
+    assert state["peak"] == 3
+    order = state["order"]
+    assert order.index(AnalysisActivities.run_analyzers) > order.index(
+        AnalysisActivities.fetch_sample
+    )
+    assert order[-1] is GenerationActivities.run_generators
+    assert state["params"][AnalysisActivities.run_analyzers]["data"] == [{"a": 1}]
+    generator_params = state["params"][GenerationActivities.run_generators]
+    assert generator_params["profile"] == {"rows": 10}
+    assert generator_params["kpis"] == [{"kpi": "revenue"}]
+    assert result["summary"] == {"table": "sales", "kpi_count": 1, "analyzer_count": 1}
+
+
+@pytest.mark.asyncio
+async def test_unpatched_runs_replay_stages_in_order(patches, state):
+    patches[analyze_workflow._CONCURRENT_STAGES_PATCH] = False
+
+    await AnalyzeWorkflow().run(
+        {"table": "sales", "kpis": [{"name": "revenue", "sql": "SELECT 1"}]}
+    )
+
+    assert state["peak"] == 1
+    assert state["order"] == [
+        ProfileActivities.profile_data,
+        AnalysisActivities.fetch_sample,
+        AnalysisActivities.run_analyzers,
+        KPIActivities.run_kpis,
+        GenerationActivities.run_generators,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_disabled_stages_keep_defaults(patches, monkeypatch):
+    async def fake_execute_activity(fn, params, **kwargs):
+        pytest.fail(f"unexpected activity {fn}")
+
+    monkeypatch.setattr(
+        analyze_workflow.workflow, "execute_activity", fake_execute_activity
+    )
+
+    result = await AnalyzeWorkflow().run(
+        {
+            "table": "sales",
+            "profile": False,
+            "run_analyzers": False,
+            "generate_artifacts": False,
+        }
+    )
+
+    assert result["profile"] is None
+    assert result["analyzers"] == {}
+    assert result["kpis"] == []
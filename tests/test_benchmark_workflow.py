@@ -0,0 +1,52 @@
+"""
+Tests for BenchmarkBrandWorkflow orchestration
+
+All sources are ingested by one batch activity before sampling starts.
+"""
+
+import logging
+from datetime import timedelta
+
+import pytest
+
+from apps.worker.activities.analysis_activities import AnalysisActivities
+from apps.worker.activities.ingest_activities import IngestActivities
+from apps.worker.workflows import benchmark_workflow
+from apps.worker.workflows.benchmark_workflow import BenchmarkBrandWorkflow
+
+
+@pytest.mark.asyncio
+async def test_sources_are_ingested_in_one_batch(monkeypatch):
+    calls = []
+
+    async def fake_execute_activity(fn, params, **kwargs):
+        calls.append((fn, params, kwargs))
+        if fn is AnalysisActivities.fetch_sample:
+            return {"rows": [{"revenue": 10}]}
+        if fn is IngestActivities.run_ingestion_batch:
+            return [
+                {"source_id": s, "status": "completed"} for s in params["source_ids"]
+            ]
+        return {}
+
+    workflow = benchmark_workflow.workflow
+    monkeypatch.setattr(workflow, "logger", logging.getLogger())
+    monkeypatch.setattr(workflow, "execute_activity", fake_execute_activity)
+
+    await BenchmarkBrandWorkflow().run(
+        {"brand_source_id": "acme", "competitor_source_ids": ["globex", "initech"]}
+    )
+
+    ingest_calls = [c for c in calls if c[0] is IngestActivities.run_ingestion_batch]
+    assert len(ingest_calls) == 1
+    assert calls[0] is ingest_calls[0]
+    _, params, kwargs = ingest_calls[0]
+    assert params == {
+        "job_prefix": "benchmark_acme",
+        "source_ids": ["acme", "globex", "initech"],
+        "max_parallel": 8,
+    }
+    # Three sources fit in one wave of eight parallel ingests.
+    assert kwargs["start_to_close_timeout"] == timedelta(minutes=10)
+    assert kwargs["heartbeat_timeout"] == timedelta(minutes=5)
+    assert not any(c[0] is IngestActivities.run_ingestion for c in calls)
@@ -0,0 +1,70 @@
+"""
+Tests for data_ref resolution in activities
+
+Activities load rows from a DuckDB table or a file when a workflow passes a
+data_ref instead of inline data. File refs stay under the data root.
+"""
+
+import duckdb
+import pandas as pd
+import pytest
+from temporalio.exceptions import ApplicationError
+
+from apps.core.config import get_settings
+from apps.worker.activities.data_refs import load_records, resolve_records
+
+ROWS = [{"revenue": 1.0, "region": "eu"}, {"revenue": 2.0, "region": "us"}]
+
+
+@pytest.fixture
+def duckdb_path(tmp_path, monkeypatch):
+    path = str(tmp_path / "voyant.duckdb")
+    conn = duckdb.connect(path)
+    conn.execute(
+        "CREATE TABLE sales AS SELECT * FROM (VALUES (1.0, 'eu'), (2.0, 'us')) t(revenue, region)"
+    )
+    conn.close()
+    monkeypatch.setattr(get_settings(), "duckdb_path", path)
+    return path
+
+
+def test_table_ref_reads_configured_database(duckdb_path):
+    assert load_records("sales") == ROWS
+
+
+def test_file_ref_reads_parquet(tmp_path, duckdb_path):
+    path = str(tmp_path / "sales.parquet")
+    pd.DataFrame(ROWS).to_parquet(path)
+
+    assert resolve_records({"data_ref": path, "data": [{"ignored": 1}]}) == ROWS
+    assert load_records("sales.parquet") == ROWS
+
+
+def test_rejects_file_outside_data_root(tmp_path, duckdb_path):
+    outside = tmp_path.parent / f"{tmp_path.name}-outside.csv"
+    pd.DataFrame(ROWS).to_csv(outside, index=False)
+
+    for ref in (str(outside), f"../{outside.name}"):
+        with pytest.raises(ApplicationError, match="outside the data root") as exc:
+            load_records(ref)
+        assert exc.value.non_retryable
+
+
+def test_inline_data_is_used_without_ref():
+    assert resolve_records({"data": ROWS}) == ROWS
+
+
+@pytest.mark.parametrize(
+    "ref",
+    [
+        "sales; DROP TABLE sales",
+        "../etc/passwd",
+        "http://169.254.169.254/latest.json",
+        "https://example.com/data.csv",
+    ],
+)
+def test_rejects_unsupported_refs(ref):
+    with pytest.raises(ApplicationError) as exc_info:
+        load_records(ref)
+
+    assert exc_info.value.non_retryable
@@ -0,0 +1,140 @@
+"""
+Tests for the run_ingestion activity
+
+Runs against a temporary DuckDB file with the Temporal activity context stubbed.
+Batches isolate non-retryable per-source failures and overlap the blocking
+DuckDB work.
+"""
+
+import asyncio
+import logging
+import time
+
+import duckdb
+import pytest
+
+from apps.worker.activities import ingest_activities
+from apps.worker.activities.ingest_activities import IngestActivities
+
+
+@pytest.fixture
+def activities(tmp_path, monkeypatch):
+    db_path = str(tmp_path / "voyant.duckdb")
+    conn = duckdb.connect(db_path)
+    conn.execute("CREATE TABLE sales AS SELECT * FROM range(3)")
+    conn.close()
+
+    monkeypatch.setattr(ingest_activities.activity, "heartbeat", lambda *a: None)
+    monkeypatch.setattr(ingest_activities.activity, "logger", logging.getLogger())
+    acts = IngestActivities()
+    monkeypatch.setattr(acts.settings, "duckdb_path", db_path)
+    return acts
+
+
+@pytest.mark.asyncio
+async def test_counts_rows_without_pacing_delays(activities):
+    started = time.monotonic()
+
+    result = await activities.run_ingestion({"job_id": "j1", "source_id": "sales"})
+
+    assert result["status"] == "completed"
+    assert result["rows_ingested"] == 3
+    assert time.monotonic() - started < 1
+
+
+@pytest.mark.asyncio
+async def test_unknown_table_degrades_to_zero_rows(activities):
+    result = await activities.run_ingestion({"job_id": "j1", "source_id": "missing"})
+
+    assert result["rows_ingested"] == 0
+
+
+@pytest.mark.asyncio
+async def test_batch_returns_one_result_per_source(activities):
+    results = await activities.run_ingestion_batch(
+        {"job_prefix": "bench", "source_ids": ["sales", "missing"]}
+    )
+
+    assert [r["job_id"] for r in results] == [
+        "ingest_sales_bench",
+        "ingest_missing_bench",
+    ]
+    assert [r["rows_ingested"] for r in results] == [3, 0]
+
+
+@pytest.mark.asyncio
+async def test_batch_bounds_concurrent_ingests(activities, monkeypatch):
+    state = {"active": 0, "peak": 0}
+
+    async def fake_run_ingestion(params):
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.01)
+        state["active"] -= 1
+        return {"source_id": params["source_id"]}
+
+    monkeypatch.setattr(activities, "run_ingestion", fake_run_ingestion)
+
+    results = await activities.run_ingestion_batch(
+        {"source_ids": [f"s{i}" for i in range(6)], "max_parallel": 2}
+    )
+
+    assert [r["source_id"] for r in results] == [f"s{i}" for i in range(6)]
+    assert state["peak"] == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_reports_failed_source_without_raising(activities):
+    results = await activities.run_ingestion_batch(
+        {"job_prefix": "bench", "source_ids": ["sales"], "mode": "bogus"}
+    )
+
+    assert results == [
+        {
+            "job_id": "ingest_sales_bench",
+            "source_id": "sales",
+            "status": "failed",
+            "error": "Unsupported ingestion mode: bogus",
+        }
+    ]
+
+
+@pytest.mark.asyncio
+async def test_batch_raises_retryable_errors(activities, monkeypatch):
+    def broken_count(source_id):
+        raise duckdb.IOException("database is locked")
+
+    monkeypatch.setattr(activities, "_count_rows", broken_count)
+
+    with pytest.raises(duckdb.IOException):
+        await activities.run_ingestion_batch({"source_ids": ["sales", "orders"]})
+
+
+@pytest.mark.asyncio
+async def test_batch_heartbeats_per_finished_source(activities, monkeypatch):
+    beats = []
+    monkeypatch.setattr(ingest_activities.activity, "heartbeat", beats.append)
+
+    await activities.run_ingestion_batch({"source_ids": ["sales", "missing"]})
+
+    assert [b for b in beats if "sources ingested" in b] == [
+        "1/2 sources ingested",
+        "2/2 sources ingested",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_batch_overlaps_blocking_row_counts(activities, monkeypatch):
+    def slow_count(source_id):
+        time.sleep(0.2)
+        return 1
+
+    monkeypatch.setattr(activities, "_count_rows", slow_count)
+    started = time.monotonic()
+
+    results = await activities.run_ingestion_batch(
+        {"source_ids": [f"s{i}" for i in range(4)], "max_parallel": 4}
+    )
+
+    assert [r["rows_ingested"] for r in results] == [1, 1, 1, 1]
+    assert time.monotonic() - started < 0.6
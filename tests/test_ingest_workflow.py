@@ -0,0 +1,66 @@
+"""
+Tests for IngestDataWorkflow orchestration
+
+Contract and lineage steps run as local activities; ingestion stays a
+regular activity.
+"""
+
+import logging
+
+import pytest
+from temporalio.exceptions import ApplicationError
+
+from apps.worker.activities.ingest_activities import IngestActivities
+from apps.worker.workflows import ingest_workflow
+from apps.worker.workflows.ingest_workflow import IngestDataWorkflow
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    recorded = {
+        "local": [],
+        "remote": [],
+        "policies": [],
+        "validation": {"valid": True},
+    }
+
+    async def execute_local_activity(fn, params, **kwargs):
+        recorded["local"].append(fn)
+        recorded["policies"].append(kwargs["retry_policy"])
+        if fn is IngestActivities.validate_contract_activity:
+            return recorded["validation"]
+        return {"recorded": True}
+
+    async def execute_activity(fn, params, **kwargs):
+        recorded["remote"].append(fn)
+        recorded["policies"].append(kwargs["retry_policy"])
+        return {"status": "completed"}
+
+    workflow = ingest_workflow.workflow
+    monkeypatch.setattr(workflow, "logger", logging.getLogger())
+    monkeypatch.setattr(workflow, "execute_local_activity", execute_local_activity)
+    monkeypatch.setattr(workflow, "execute_activity", execute_activity)
+    return recorded
+
+
+@pytest.mark.asyncio
+async def test_bookkeeping_steps_run_locally(calls):
+    result = await IngestDataWorkflow().run({"job_id": "j1", "source_id": "sales"})
+
+    assert result == {"status": "completed"}
+    assert calls["local"] == [
+        IngestActivities.validate_contract_activity,
+        IngestActivities.record_lineage_activity,
+    ]
+    assert calls["remote"] == [IngestActivities.run_ingestion]
+    assert all(p is ingest_workflow._RETRY_POLICY for p in calls["policies"])
+
+
+@pytest.mark.asyncio
+async def test_failed_contract_stops_before_ingestion(calls):
+    calls["validation"] = {"valid": False, "errors": ["missing column"]}
+
+    with pytest.raises(ApplicationError):
+        await IngestDataWorkflow().run({"job_id": "j1", "source_id": "sales"})
+
+    assert calls["remote"] == []
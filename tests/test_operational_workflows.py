@@ -0,0 +1,56 @@
+"""
+Tests for operational workflow short-circuits
+
+Empty inputs return an empty, schema-valid result without scheduling an
+activity.
+"""
+
+import logging
+
+import pytest
+
+from apps.worker.workflows import operational_workflows
+from apps.worker.workflows.operational_workflows import (
+    AnalyzeSentimentWorkflow,
+    DetectAnomaliesWorkflow,
+    FixDataQualityWorkflow,
+)
+
+
+@pytest.fixture(autouse=True)
+def no_activities(monkeypatch):
+    async def execute_activity(fn, params, **kwargs):
+        pytest.fail(f"unexpected activity {fn}")
+
+    workflow = operational_workflows.workflow
+    monkeypatch.setattr(workflow, "logger", logging.getLogger())
+    monkeypatch.setattr(workflow, "execute_activity", execute_activity)
+
+
+@pytest.mark.asyncio
+async def test_empty_sentiment_batch():
+    result = await AnalyzeSentimentWorkflow().run({"texts": []})
+
+    assert result == {
+        "total": 0,
+        "breakdown": {"positive": 0, "negative": 0, "neutral": 0},
+        "details": [],
+    }
+
+
+@pytest.mark.asyncio
+async def test_empty_anomaly_detection():
+    result = await DetectAnomaliesWorkflow().run({"contamination": 0.2})
+
+    assert result["total_records"] == 0
+    assert result["anomaly_indices"] == []
+    assert result["contamination_params"] == 0.2
+
+
+@pytest.mark.asyncio
+async def test_empty_quality_fix():
+    result = await FixDataQualityWorkflow().run({"data": []})
+
+    assert result["cleaned_data"] == []
+    assert result["quality_report"]["original_rows"] == 0
+    assert result["quality_report"]["quality_score_after"] == 0.0
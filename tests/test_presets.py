@@ -0,0 +1,32 @@
+"""
+Tests for preset catalog endpoints
+
+Verifies listing, filtering and lookup over the prebuilt preset schemas.
+"""
+
+import pytest
+from ninja.errors import HttpError
+
+from apps.workflows.api import PRESETS, get_preset, list_presets
+
+
+def test_list_groups_every_preset_by_category():
+    grouped = list_presets(None)
+
+    listed = [info.name for infos in grouped.values() for info in infos]
+    assert sorted(listed) == sorted(p["name"] for p in PRESETS.values())
+    assert list_presets(None, category="missing") == {}
+
+
+def test_get_returns_shared_schema():
+    info = get_preset(None, "quality.data_profiling")
+
+    assert info.output_artifacts == ["profile"]
+    assert info is list_presets(None, category="quality")["quality"][0]
+    with pytest.raises(HttpError):
+        get_preset(None, "unknown")
+
+
+def test_definitions_are_read_only():
+    with pytest.raises(TypeError):
+        PRESETS["new"] = {}
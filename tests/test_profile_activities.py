@@ -0,0 +1,61 @@
+"""
+Tests for the profile_data activity
+
+Runs against a temporary DuckDB file with the Temporal activity logger stubbed.
+"""
+
+import logging
+from datetime import datetime, timedelta
+
+import duckdb
+import pytest
+from temporalio.exceptions import ApplicationError
+
+from apps.worker.activities import profile_activities
+from apps.worker.activities.profile_activities import ProfileActivities
+
+
+@pytest.fixture
+def activities(tmp_path, monkeypatch):
+    db_path = str(tmp_path / "voyant.duckdb")
+    conn = duckdb.connect(db_path)
+    conn.execute("CREATE TABLE sales AS SELECT range AS amount FROM range(5)")
+    conn.close()
+
+    monkeypatch.setattr(profile_activities.activity, "logger", logging.getLogger())
+    acts = ProfileActivities()
+    monkeypatch.setattr(acts.settings, "duckdb_path", db_path)
+    return acts, db_path
+
+
+def test_profiles_table_and_releases_connection(activities):
+    acts, db_path = activities
+
+    result = acts.profile_data({"source_id": "sales"})
+
+    assert result["profile"]["total_rows_estimated"] == 5
+    assert "amount" in result["profile"]["columns"]
+    assert result["generated_at"].endswith("Z")
+    assert datetime.fromisoformat(result["generated_at"]).utcoffset() == timedelta(0)
+    duckdb.connect(db_path).close()
+
+
+@pytest.mark.parametrize("table", ["sales; DROP TABLE sales", "sales--", ""])
+def test_rejects_unsafe_table_names(activities, table):
+    acts, _ = activities
+
+    with pytest.raises(ApplicationError) as exc_info:
+        acts.profile_data({"source_id": table})
+
+    assert exc_info.value.non_retryable
+
+
+def test_sample_is_taken_from_the_frame(activities):
+    acts, _ = activities
+
+    result = acts.profile_data({"source_id": "sales", "sample_size": 3})
+
+    profile = result["profile"]
+    assert profile["rows_analyzed"] == 3
+    assert profile["columns"]["amount"]["type"] == "int64"
+    assert profile["columns"]["amount"]["unique_count"] == 3
@@ -0,0 +1,70 @@
+"""
+Tests for the regression model summary
+
+train_regression_model formats the equation and quality rating once; the
+workflow passes them through, formatting results recorded before that itself.
+"""
+
+import logging
+
+import pytest
+
+from apps.worker.activities import ml_activities
+from apps.worker.activities.ml_activities import MLActivities
+from apps.worker.workflows import regression_workflow
+from apps.worker.workflows.regression_workflow import LinearRegressionWorkflow
+
+DATA = [{"x": float(i), "y": 2.0 * i + 1.0} for i in range(10)]
+
+
+def test_activity_returns_formatted_summary(monkeypatch):
+    pytest.importorskip("sklearn")
+    monkeypatch.setattr(ml_activities.activity, "heartbeat", lambda *a: None)
+    monkeypatch.setattr(ml_activities.activity, "logger", logging.getLogger())
+
+    result = MLActivities().train_regression_model(
+        {"data": DATA, "target_col": "y", "feature_cols": ["x"]}
+    )
+
+    assert result["equation"] == "y = 1.00 + 2.00*x"
+    assert result["quality"] == "excellent"
+
+
+@pytest.mark.asyncio
+async def test_workflow_passes_summary_through(monkeypatch):
+    async def execute_activity(fn, params, **kwargs):
+        return {"equation": "y = 0.00 - 1.00*x", "quality": "poor"}
+
+    workflow = regression_workflow.workflow
+    monkeypatch.setattr(workflow, "logger", logging.getLogger())
+    monkeypatch.setattr(workflow, "execute_activity", execute_activity)
+
+    result = await LinearRegressionWorkflow().run({"data": DATA})
+
+    assert result["model_summary"] == {
+        "equation": "y = 0.00 - 1.00*x",
+        "quality": "poor",
+    }
+
+
+@pytest.mark.asyncio
+async def test_workflow_formats_results_recorded_without_summary(monkeypatch):
+    async def execute_activity(fn, params, **kwargs):
+        return {
+            "target": "y",
+            "intercept": 1.0,
+            "coefficients": [-0.5],
+            "features": ["x"],
+            "r2_score": 0.75,
+        }
+
+    workflow = regression_workflow.workflow
+    monkeypatch.setattr(workflow, "logger", logging.getLogger())
+    monkeypatch.setattr(workflow, "execute_activity", execute_activity)
+
+    result = await LinearRegressionWorkflow().run({"data": DATA})
+
+    assert result["model_summary"] == {
+        "equation": "y = 1.00 - 0.50*x",
+        "quality": "good",
+    }
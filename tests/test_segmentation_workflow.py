@@ -0,0 +1,98 @@
+"""
+Tests for segment profile aggregation
+
+The summarize_clusters activity computes segment sizes and mean profiles;
+SegmentCustomersWorkflow runs it as a local activity.
+"""
+
+import logging
+
+import pytest
+from temporalio.exceptions import ApplicationError
+
+from apps.worker.activities.ml_activities import MLActivities
+from apps.worker.workflows import segmentation_workflow
+from apps.worker.workflows.segmentation_workflow import SegmentCustomersWorkflow
+
+DATA = [
+    {"spend": 10.0, "visits": 1},
+    {"spend": 30.0, "visits": 3},
+    {"spend": 100.0, "visits": 7},
+    {"spend": 20.0},
+]
+CLUSTERS = [0, 0, 2, 0]
+
+
+def test_summarize_clusters_matches_per_segment_means():
+    profiles = MLActivities().summarize_clusters(
+        {"data": DATA, "clusters": CLUSTERS, "n_segments": 3}
+    )
+
+    assert list(profiles) == ["segment_0", "segment_2"]
+    assert profiles["segment_0"] == {
+        "size": 3,
+        "percentage": 75.0,
+        "average_profile": {"spend": 20.0, "visits": 2.0},
+    }
+    assert profiles["segment_2"]["average_profile"] == {"spend": 100.0, "visits": 7.0}
+
+
+@pytest.mark.asyncio
+async def test_workflow_delegates_profiles_to_local_activity(monkeypatch):
+    local_calls = []
+
+    async def execute_activity(fn, params, **kwargs):
+        return {"clusters": CLUSTERS, "silhouette_score": 0.5}
+
+    async def execute_local_activity(fn, params, **kwargs):
+        local_calls.append(fn)
+        return MLActivities().summarize_clusters(params)
+
+    workflow = segmentation_workflow.workflow
+    monkeypatch.setattr(workflow, "logger", logging.getLogger())
+    monkeypatch.setattr(workflow, "execute_activity", execute_activity)
+    monkeypatch.setattr(workflow, "execute_local_activity", execute_local_activity)
+
+    result = await SegmentCustomersWorkflow().run({"data": DATA})
+
+    assert local_calls == [MLActivities.summarize_clusters]
+    assert result["segment_profiles"]["segment_0"]["size"] == 3
+    assert result["cluster_assignments"] == CLUSTERS
+
+
+@pytest.mark.asyncio
+async def test_workflow_forwards_data_ref_instead_of_rows(monkeypatch):
+    payloads = []
+
+    async def execute_activity(fn, params, **kwargs):
+        payloads.append(params)
+        return {"clusters": CLUSTERS}
+
+    async def execute_local_activity(fn, params, **kwargs):
+        payloads.append(params)
+        return {}
+
+    workflow = segmentation_workflow.workflow
+    monkeypatch.setattr(workflow, "logger", logging.getLogger())
+    monkeypatch.setattr(workflow, "execute_activity", execute_activity)
+    monkeypatch.setattr(workflow, "execute_local_activity", execute_local_activity)
+
+    result = await SegmentCustomersWorkflow().run({"data_ref": "customers"})
+
+    assert all(p["data_ref"] == "customers" and "data" not in p for p in payloads)
+    assert result["total_customers"] == len(CLUSTERS)
+
+
+@pytest.mark.asyncio
+async def test_workflow_rejects_empty_input_without_activity(monkeypatch):
+    async def execute_activity(fn, params, **kwargs):
+        pytest.fail(f"unexpected activity {fn}")
+
+    workflow = segmentation_workflow.workflow
+    monkeypatch.setattr(workflow, "logger", logging.getLogger())
+    monkeypatch.setattr(workflow, "execute_activity", execute_activity)
+
+    with pytest.raises(ApplicationError) as exc_info:
+        await SegmentCustomersWorkflow().run({"data": []})
+
+    assert exc_info.value.non_retryable
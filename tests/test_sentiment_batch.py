@@ -0,0 +1,25 @@
+"""
+Tests for the analyze_sentiment_batch activity
+
+Sentiment counts are aggregated by the activity in a single pass.
+"""
+
+import logging
+
+from apps.worker.activities import operational_activities
+from apps.worker.activities.operational_activities import OperationalActivities
+
+
+def test_batch_returns_breakdown_with_details(monkeypatch):
+    monkeypatch.setattr(operational_activities.activity, "logger", logging.getLogger())
+    ops = OperationalActivities()
+    details = [{"sentiment": s} for s in ("positive", "negative", "positive")]
+    monkeypatch.setattr(ops.nlp, "analyze_sentiment", lambda texts: details)
+
+    result = ops.analyze_sentiment_batch({"texts": ["a", "b", "c"]})
+
+    assert result == {
+        "total": 3,
+        "breakdown": {"positive": 2, "negative": 1, "neutral": 0},
+        "details": details,
+    }
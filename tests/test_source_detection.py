@@ -0,0 +1,53 @@
+"""
+Test source type detection
+
+Scheme, suffix and substring hints resolve with the same precedence as the
+original branch chain.
+"""
+
+import pytest
+
+from apps.discovery.source_detection import detect_source_type
+
+
+@pytest.mark.parametrize(
+    ("hint", "source_type"),
+    [
+        ("postgresql://user@db.internal/app", "postgresql"),
+        ("POSTGRES://db/app", "postgresql"),
+        ("mysql://db/app", "mysql"),
+        ("mongodb+srv://cluster/app", "mongodb"),
+        ("snowflake_export.csv", "snowflake"),
+        ("s3://bucket/data.csv", "csv"),
+        ("/tmp/data.parquet", "parquet"),
+        ("events.jsonl", "json"),
+        ("s3://bucket/raw/", "s3"),
+        ("https://docs.google.com/spreadsheets/d/abc", "google_sheets"),
+        ("https://api.example.com/v1/orders", "api"),
+        ("ftp://host/file", "unknown"),
+        ("orders", "unknown"),
+    ],
+)
+def test_detect_source_type(hint, source_type):
+    assert detect_source_type(hint)["source_type"] == source_type
+
+
+def test_detect_source_type_properties():
+    assert detect_source_type("postgres://u:p@db.internal/app")["properties"] == {
+        "host": "db.internal"
+    }
+    assert detect_source_type("s3://bucket/raw/")["properties"] == {"bucket": "bucket"}
+    assert detect_source_type("data.CSV")["properties"] == {"format": "csv"}
+    assert detect_source_type("https://x.io/v1") == {
+        "source_type": "api",
+        "connector": "airbyte/source-http",
+        "properties": {"url": "https://x.io/v1"},
+        "confidence": 0.5,
+    }
+
+
+def test_detect_source_type_returns_fresh_dicts():
+    first = detect_source_type("data.csv")
+    first["properties"]["format"] = "changed"
+
+    assert detect_source_type("data.csv")["properties"] == {"format": "csv"}
@@ -0,0 +1,108 @@
+"""
+Tests for Temporal worker sizing and registration.
+
+Full mode claims no more activities than it has threads and splits BLAS
+threads across them, applied inside the activity threads; scraper mode keeps Temporal's default; workflow tasks
+scale with CPU; explicit settings win.
+"""
+
+import types
+
+import pytest
+
+from apps.worker import worker_main
+
+
+def _settings(mode="full", max_workers=0, max_concurrent=0, workflow_tasks=0):
+    return types.SimpleNamespace(
+        worker_mode=mode,
+        temporal_activity_max_workers=max_workers,
+        temporal_max_concurrent_activities=max_concurrent,
+        temporal_max_concurrent_workflow_tasks=workflow_tasks,
+    )
+
+
+@pytest.mark.parametrize(
+    "config, expected",
+    [
+        (_settings(max_workers=8), (8, 8)),
+        (_settings(mode="scraper", max_workers=8), (8, 100)),
+        (_settings(max_workers=8, max_concurrent=20), (8, 20)),
+    ],
+)
+def test_activity_limits(config, expected):
+    assert worker_main._activity_limits(config) == expected
+
+
+def test_auto_thread_count_follows_cpu(monkeypatch):
+    monkeypatch.setattr(worker_main.os, "cpu_count", lambda: 2)
+
+    assert worker_main._activity_limits(_settings()) == (10, 10)
+
+
+def test_workflow_task_limit(monkeypatch):
+    monkeypatch.setattr(worker_main.os, "cpu_count", lambda: 2)
+    assert worker_main._workflow_task_limit(_settings()) == 16
+
+    monkeypatch.setattr(worker_main.os, "cpu_count", lambda: 64)
+    assert worker_main._workflow_task_limit(_settings()) == 100
+    assert worker_main._workflow_task_limit(_settings(workflow_tasks=40)) == 40
+
+
+def test_scraper_registrations_are_built_without_a_loop():
+    workflows, activities = worker_main.build_registrations(_settings(mode="scraper"))
+
+    assert workflows == [worker_main.ScrapeWorkflow]
+    assert len({fn.__self__.__class__ for fn in activities}) == 3
+
+
+def test_native_thread_vars_split_across_activity_threads(monkeypatch):
+    for var in worker_main._NATIVE_THREAD_VARS:
+        monkeypatch.delenv(var, raising=False)
+    monkeypatch.setattr(worker_main.os, "cpu_count", lambda: 16)
+
+    worker_main._limit_native_threads(_settings(mode="scraper", max_workers=4))
+    assert "OMP_NUM_THREADS" not in worker_main.os.environ
+
+    worker_main._limit_native_threads(_settings(max_workers=4))
+    assert [worker_main.os.environ[v] for v in worker_main._NATIVE_THREAD_VARS] == [
+        "4",
+        "4",
+        "4",
+    ]
+
+    # An explicit (or already exported) value wins.
+    worker_main._limit_native_threads(_settings(max_workers=32))
+    assert worker_main.os.environ["OMP_NUM_THREADS"] == "4"
+
+
+def test_activity_threads_apply_the_native_cap(monkeypatch):
+    threadpoolctl = pytest.importorskip("threadpoolctl")
+    pytest.importorskip("numpy")
+    original = threadpoolctl.threadpool_info()
+    if not original:
+        pytest.skip("no native thread pool loaded")
+    target = 2 if original[0]["num_threads"] == 1 else 1
+    monkeypatch.setenv("OMP_NUM_THREADS", str(target))
+
+    executor = worker_main._activity_executor(1)
+    try:
+        info = executor.submit(threadpoolctl.threadpool_info).result()
+    finally:
+        executor.shutdown()
+        threadpoolctl.threadpool_limits(
+            {lib["prefix"]: lib["num_threads"] for lib in original}
+        )
+
+    assert {lib["num_threads"] for lib in info} == {target}
+
+
+def test_full_mode_registers_every_decorated_activity():
+    workflows, activities = worker_main.build_registrations(_settings())
+
+    names = [getattr(fn, "__temporal_activity_definition").name for fn in activities]
+    assert len(names) == len(set(names))
+    assert {"run_ingestion_batch", "summarize_clusters", "store_artifacts"} <= set(
+        names
+    )
+    assert worker_main.IngestDataWorkflow in workflows
@@ -0,0 +1,51 @@
+"""
+Tests for Temporal worker shutdown handling
+
+A stop request drains the worker via shutdown(); a worker that exits or
+fails first ends the wait without one.
+"""
+
+import asyncio
+
+import pytest
+
+from apps.worker import worker_main
+
+
+class FakeWorker:
+    def __init__(self, error=None):
+        self.error = error
+        self.stopped = asyncio.Event()
+        self.shutdown_calls = 0
+
+    async def run(self):
+        if self.error:
+            raise self.error
+        await self.stopped.wait()
+
+    async def shutdown(self):
+        self.shutdown_calls += 1
+        self.stopped.set()
+
+
+@pytest.mark.asyncio
+async def test_stop_event_shuts_worker_down():
+    worker = FakeWorker()
+    stop_event = asyncio.Event()
+    asyncio.get_running_loop().call_later(0.01, stop_event.set)
+
+    await asyncio.wait_for(worker_main._run_until_stopped(worker, stop_event), 1)
+
+    assert worker.shutdown_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_worker_failure_propagates_without_stop():
+    worker = FakeWorker(error=RuntimeError("fatal"))
+
+    with pytest.raises(RuntimeError, match="fatal"):
+        await asyncio.wait_for(
+            worker_main._run_until_stopped(worker, asyncio.Event()), 1
+        )
+
+    assert worker.shutdown_calls == 0